@@ -157,6 +157,10 @@ def test_locale(django_assert_num_queries):
     translated_resource.missing_strings = 5
     translated_resource.unreviewed_strings = 5
     translated_resource.save()
+    ProjectLocale.objects.filter(
+        project=translated_resource.resource.project,
+        locale=translated_resource.locale,
+    ).calculate_stats()
 
     with django_assert_num_queries(4):
         response = APIClient().get(
@@ -260,6 +264,10 @@ def test_locales(django_assert_num_queries):
         translated_resource.missing_strings = 5
         translated_resource.unreviewed_strings = 5
         translated_resource.save()
+        ProjectLocale.objects.filter(
+            project=translated_resource.resource.project,
+            locale=translated_resource.locale,
+        ).calculate_stats()
 
     expected_results = [
         {
@@ -353,6 +361,10 @@ def test_project(django_assert_num_queries):
         translated_resource.missing_strings = 5
         translated_resource.unreviewed_strings = 5
         translated_resource.save()
+        ProjectLocale.objects.filter(
+            project=translated_resource.resource.project,
+            locale=translated_resource.locale,
+        ).calculate_stats()
 
     with django_assert_num_queries(5):
         response = APIClient().get(
@@ -620,6 +632,10 @@ def test_projects(django_assert_num_queries):
         translated_resource.missing_strings = 5
         translated_resource.unreviewed_strings = 5
         translated_resource.save()
+        ProjectLocale.objects.filter(
+            project=translated_resource.resource.project,
+            locale=translated_resource.locale,
+        ).calculate_stats()
 
     expected_results = [
         {
@@ -1017,6 +1033,10 @@ def test_project_locale(django_assert_num_queries):
         translated_resource.missing_strings = 5
         translated_resource.unreviewed_strings = 5
         translated_resource.save()
+        ProjectLocale.objects.filter(
+            project=translated_resource.resource.project,
+            locale=translated_resource.locale,
+        ).calculate_stats()
 
     with django_assert_num_queries(6):
         response = APIClient().get(
@@ -169,6 +169,7 @@ class RepositoryInline(admin.TabularInline):
         "website",
         "last_synced_revisions",
         "source_repo",
+        "sparse_checkout",
     )
 
 
@@ -237,6 +238,7 @@ class ProjectLocaleAdmin(admin.ModelAdmin):
     list_display = ("pk", "project", "locale", "readonly", "pretranslation_enabled")
     ordering = ("-pk",)
     autocomplete_fields = ["translators_group", "latest_translation"]
+    readonly_fields = AGGREGATED_STATS_FIELDS
 
 
 class ResourceAdmin(admin.ModelAdmin):
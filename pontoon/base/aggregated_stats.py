@@ -4,7 +4,7 @@ from functools import cached_property
 class AggregatedStats:
     aggregated_stats_query: object
     """
-    Must be set by the child class as a QuerySet of TranslatedResource objects.
+    Must be set by the child class as a QuerySet of ProjectLocale objects.
 
     Should include any filters leaving out disabled or system projects.
     """
@@ -356,6 +356,7 @@ class GetEntitiesForm(forms.Form):
     search = forms.CharField(required=False)
     entity_ids = forms.CharField(required=False)
     pk_only = forms.BooleanField(required=False)
+    terms = forms.BooleanField(required=False)
     inplace_editor = forms.BooleanField(required=False)
     entity = forms.IntegerField(required=False)
 
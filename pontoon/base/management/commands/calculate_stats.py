@@ -1,10 +1,21 @@
 import logging
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from time import perf_counter
+
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.db.models import Count
 
 from pontoon.base.models import Project
-from pontoon.sync.core.stats import update_stats
+from pontoon.sync.core.stats import (
+    count_stats_drift,
+    resource_chunks,
+    update_project_locale_stats,
+    update_scoped_stats,
+    update_stats,
+)
 
 
 log = logging.getLogger(__name__)
@@ -15,15 +26,13 @@ class Command(BaseCommand):
         Re-calculate statistics for all translated resources and corresponding
         objects.
 
-        Note: while unlikely, it's possible that running this command may
-        result in IntegrityErrors. That happens if at the same time when
-        calculate_stats() is being executed for a TranslatedResource instance,
-        translation is added, accepted or rejected for that very instance.
-
-        To be completely sure errors don't occur, command needs to run in a
-        maintenance mode.
+        By default, each project is updated in a single transaction.
+        To keep transactions and row locks short on a live instance,
+        use --chunk-size to update at most that many translated resources
+        in each transaction, and --workers to update projects in parallel.
 
-        See bug 1470337 for more details.
+        Use --dry-run to only report the number of translated resources
+        with outdated stats.
         """
 
     def add_arguments(self, parser):
@@ -32,6 +41,23 @@ class Command(BaseCommand):
             action="store_true",
             help="Run on all projects, including disabled",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of projects to process at the same time (default: 1)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=0,
+            help="Maximum number of translated resources to update in each transaction (default: all of a project's)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report stats drift without updating any stats",
+        )
 
     def handle(self, *args, **options):
         if options["all"]:
@@ -43,9 +69,75 @@ class Command(BaseCommand):
         projects = projects.annotate(resource_count=Count("resources")).order_by(
             "disabled", "resource_count"
         )
-        log.info(f"Calculating stats for {action_txt} ({len(projects)})...")
+        workers: int = max(options["workers"], 1)
+        chunk_size: int = options["chunk_size"]
+        dry_run: bool = options["dry_run"]
+        verb = "Checking" if dry_run else "Calculating"
+        log.info(f"{verb} stats for {action_txt} ({len(projects)})...")
+
+        def process(project: Project) -> int:
+            """Returns the stats drift count for dry runs."""
+            if dry_run:
+                return sum(
+                    count_stats_drift(project, chunk)
+                    for chunk in resource_chunks(project, chunk_size)
+                )
+            if chunk_size > 0:
+                for chunk in resource_chunks(project, chunk_size):
+                    with transaction.atomic():
+                        update_scoped_stats(
+                            project,
+                            chunk,
+                            [],
+                            include_outdated=False,
+                            update_project_locales=False,
+                        )
+                update_project_locale_stats(project)
+            else:
+                update_stats(project)
+            return 0
+
+        def process_in_thread(project: Project) -> int:
+            try:
+                return process(project)
+            finally:
+                connection.close()
+
+        total_resources = sum(project.resource_count for project in projects)
+        done_resources = 0
+        drift_count = 0
+        start = perf_counter()
 
-        for project in projects:
-            update_stats(project)
+        def report(project: Project, drift: int) -> None:
+            nonlocal done_resources, drift_count
+            done_resources += project.resource_count
+            drift_count += drift
+            if dry_run and drift:
+                str_tr = "translated resource" if drift == 1 else "translated resources"
+                log.info(f"[{project.slug}] Stats drift in {drift} {str_tr}")
+            elapsed = perf_counter() - start
+            progress = done_resources / total_resources if total_resources else 1
+            eta = elapsed / progress - elapsed if progress else 0
+            log.info(
+                f"{verb} stats... {progress:.0%} done, "
+                f"ETA {timedelta(seconds=round(eta))}"
+            )
 
-        log.info("Calculating stats complete.")
+        if workers > 1:
+            with ThreadPoolExecutor(workers) as executor:
+                futures = {
+                    executor.submit(process_in_thread, project): project
+                    for project in projects
+                }
+                for future in as_completed(futures):
+                    report(futures[future], future.result())
+        else:
+            for project in projects:
+                report(project, process(project))
+
+        if dry_run:
+            log.info(
+                f"Checking stats complete. Stats drift in {drift_count} translated resources."
+            )
+        else:
+            log.info("Calculating stats complete.")
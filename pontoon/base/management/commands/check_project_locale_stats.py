@@ -0,0 +1,58 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from pontoon.base.models import Project
+from pontoon.sync.core.stats import (
+    count_project_locale_stats_drift,
+    update_project_locale_stats,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """
+        Check that the stored stats of all project locales match the sums
+        of the stats of their translated resources.
+
+        The locale and project stats are summed up from the project locale stats.
+        Use --fix to update the project locales with outdated stats.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Run on all projects, including disabled",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Update project locales with outdated stats",
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            projects = Project.objects.all()
+            action_txt = "all projects"
+        else:
+            projects = Project.objects.filter(disabled=False)
+            action_txt = "enabled projects"
+        log.info(f"Checking project locale stats for {action_txt}...")
+
+        drift_count = 0
+        for project in projects.order_by("slug"):
+            drift = count_project_locale_stats_drift(project)
+            if drift:
+                str_pl = "project locale" if drift == 1 else "project locales"
+                log.warning(f"[{project.slug}] Stats drift in {drift} {str_pl}")
+                drift_count += drift
+                if options["fix"]:
+                    update_project_locale_stats(project)
+
+        str_pl = "project locale" if drift_count == 1 else "project locales"
+        log.info(
+            f"Checking project locale stats complete. Stats drift in {drift_count} {str_pl}."
+        )
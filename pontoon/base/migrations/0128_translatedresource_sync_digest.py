@@ -0,0 +1,17 @@
+# Generated by Django 5.2.15 on 2026-10-18 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0127_add_missing_sections"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translatedresource",
+            name="sync_digest",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.15 on 2026-10-18 02:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0128_translatedresource_sync_digest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="repository",
+            name="sparse_checkout",
+            field=models.BooleanField(
+                default=False,
+                help_text="\n        If true, sync uses a partial clone of this git repo,\n        and only checks out the files used by the project.\n    ",
+            ),
+        ),
+    ]
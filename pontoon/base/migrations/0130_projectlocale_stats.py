@@ -0,0 +1,70 @@
+# Generated by Django 5.2.15 on 2026-10-18 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0129_repository_sparse_checkout"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectlocale",
+            name="total_strings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocale",
+            name="approved_strings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocale",
+            name="pretranslated_strings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocale",
+            name="strings_with_errors",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocale",
+            name="strings_with_warnings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectlocale",
+            name="unreviewed_strings",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE base_projectlocale pl
+                SET
+                    total_strings = agg.total,
+                    approved_strings = agg.approved,
+                    pretranslated_strings = agg.pretranslated,
+                    strings_with_errors = agg.errors,
+                    strings_with_warnings = agg.warnings,
+                    unreviewed_strings = agg.unreviewed
+                FROM (
+                    SELECT
+                        res.project_id AS "project_id",
+                        tr.locale_id AS "locale_id",
+                        SUM(tr.total_strings) AS "total",
+                        SUM(tr.approved_strings) AS "approved",
+                        SUM(tr.pretranslated_strings) AS "pretranslated",
+                        SUM(tr.strings_with_errors) AS "errors",
+                        SUM(tr.strings_with_warnings) AS "warnings",
+                        SUM(tr.unreviewed_strings) AS "unreviewed"
+                    FROM base_translatedresource tr
+                    INNER JOIN base_resource res ON (tr.resource_id = res.id)
+                    GROUP BY res.project_id, tr.locale_id
+                ) AS agg
+                WHERE pl.project_id = agg.project_id AND pl.locale_id = agg.locale_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated manually on 2026-10-18
+
+from django.db import migrations
+
+
+def create_pg_trgm(apps, schema_editor):
+    # Trigram similarity is only used if the pg_trgm module is available.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is not None:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0130_projectlocale_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=create_pg_trgm,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
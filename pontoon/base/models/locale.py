@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import BooleanField, Case, F, QuerySet, Sum, Value, When
+from django.db.models import BooleanField, Case, F, QuerySet, Value, When
 
 from pontoon.base.aggregated_stats import AggregatedStats
 
@@ -67,41 +67,36 @@ class LocaleQuerySet(models.QuerySet["Locale"]):
         )
 
     def stats_data(self, project=None):
+        from pontoon.base.models.project_locale import ProjectLocale
+
         if project is not None:
-            query = self.filter(
-                translatedresources__resource__project=project,
-                translatedresources__resource__obsolete=False,
-            )
+            project_locales = ProjectLocale.objects.filter(project=project)
         else:
-            query = self.filter(
-                translatedresources__resource__project__disabled=False,
-                translatedresources__resource__project__system_project=False,
-                translatedresources__resource__project__visibility="public",
-                translatedresources__resource__obsolete=False,
+            project_locales = ProjectLocale.objects.filter(
+                project__disabled=False,
+                project__system_project=False,
+                project__visibility="public",
             )
 
-        return query.annotate(
-            total=Sum("translatedresources__total_strings", default=0),
-            approved=Sum("translatedresources__approved_strings", default=0),
-            pretranslated=Sum("translatedresources__pretranslated_strings", default=0),
-            errors=Sum("translatedresources__strings_with_errors", default=0),
-            warnings=Sum("translatedresources__strings_with_warnings", default=0),
-            unreviewed=Sum("translatedresources__unreviewed_strings", default=0),
-        ).annotate(
-            missing=F("total")
-            - F("approved")
-            - F("pretranslated")
-            - F("errors")
-            - F("warnings"),
-            completed=F("approved") + F("warnings"),
-            is_complete=Case(
-                When(
-                    total=F("approved") + F("warnings"),
-                    then=Value(True),
+        return (
+            self.filter(pk__in=project_locales.values("locale"))
+            .annotate(**project_locales.stats_sums("locale"))
+            .annotate(
+                missing=F("total")
+                - F("approved")
+                - F("pretranslated")
+                - F("errors")
+                - F("warnings"),
+                completed=F("approved") + F("warnings"),
+                is_complete=Case(
+                    When(
+                        total=F("approved") + F("warnings"),
+                        then=Value(True),
+                    ),
+                    default=Value(False),
+                    output_field=BooleanField(),
                 ),
-                default=Value(False),
-                output_field=BooleanField(),
-            ),
+            )
         )
 
     def stats_data_as_dict(self, project=None) -> dict[int, dict[str, int]]:
@@ -123,13 +118,13 @@ class LocaleQuerySet(models.QuerySet["Locale"]):
 class Locale(models.Model, AggregatedStats):
     @property
     def aggregated_stats_query(self):
-        from pontoon.base.models.translated_resource import TranslatedResource
+        from pontoon.base.models.project_locale import ProjectLocale
 
-        return TranslatedResource.objects.filter(
+        return ProjectLocale.objects.filter(
             locale=self,
-            resource__project__disabled=False,
-            resource__project__system_project=False,
-            resource__project__visibility="public",
+            project__disabled=False,
+            project__system_project=False,
+            project__visibility="public",
         )
 
     code = models.CharField(max_length=20, unique=True)
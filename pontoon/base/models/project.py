@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
 from django.db import models
-from django.db.models import BooleanField, Case, F, QuerySet, Sum, Value, When
+from django.db.models import BooleanField, Case, F, QuerySet, Value, When
 from django.utils import timezone
 
 from pontoon.base.aggregated_stats import AggregatedStats
@@ -74,20 +74,15 @@ class ProjectQuerySet(models.QuerySet["Project"]):
         return self.force_syncable().filter(sync_disabled=False)
 
     def stats_data(self, locale=None):
-        query = (
-            self
-            if locale is None
-            else self.filter(resources__translatedresources__locale=locale)
-        )
-        tr = "resources__translatedresources"
-        return query.annotate(
-            total=Sum(f"{tr}__total_strings", default=0),
-            approved=Sum(f"{tr}__approved_strings", default=0),
-            pretranslated=Sum(f"{tr}__pretranslated_strings", default=0),
-            errors=Sum(f"{tr}__strings_with_errors", default=0),
-            warnings=Sum(f"{tr}__strings_with_warnings", default=0),
-            unreviewed=Sum(f"{tr}__unreviewed_strings", default=0),
-        ).annotate(
+        from pontoon.base.models.project_locale import ProjectLocale
+
+        if locale is None:
+            project_locales = ProjectLocale.objects.all()
+            query = self
+        else:
+            project_locales = ProjectLocale.objects.filter(locale=locale)
+            query = self.filter(pk__in=project_locales.values("project"))
+        return query.annotate(**project_locales.stats_sums("project")).annotate(
             missing=F("total")
             - F("approved")
             - F("pretranslated")
@@ -123,9 +118,9 @@ class ProjectQuerySet(models.QuerySet["Project"]):
 class Project(models.Model, AggregatedStats):
     @property
     def aggregated_stats_query(self):
-        from pontoon.base.models.translated_resource import TranslatedResource
+        from pontoon.base.models.project_locale import ProjectLocale
 
-        return TranslatedResource.objects.filter(resource__project=self)
+        return ProjectLocale.objects.filter(project=self)
 
     name = models.CharField(max_length=128, unique=True)
     slug = models.SlugField(unique=True)
@@ -2,7 +2,18 @@ from typing import TYPE_CHECKING
 
 from django.contrib.auth.models import Group
 from django.db import models
-from django.db.models import BooleanField, Case, F, Sum, Value, When
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 
 from pontoon.base.aggregated_stats import AggregatedStats
 from pontoon.base.models.locale import Locale
@@ -35,46 +46,124 @@ class ProjectLocaleQuerySet(models.QuerySet["ProjectLocale"]):
             project__system_project=False,
         ).distinct()
 
+    def string_stats(
+        self,
+        user=None,
+        *,
+        count_disabled: bool = False,
+        count_system_projects: bool = False,
+    ) -> dict[str, int]:
+        query = self
+        if not count_disabled:
+            query = query.filter(project__disabled=False)
+        if not count_system_projects:
+            query = query.filter(project__system_project=False)
+        if user is None or not user.is_superuser:
+            query = query.filter(project__visibility="public")
+        return query.aggregate(
+            total=Sum("total_strings", default=0),
+            approved=Sum("approved_strings", default=0),
+            pretranslated=Sum("pretranslated_strings", default=0),
+            errors=Sum("strings_with_errors", default=0),
+            warnings=Sum("strings_with_warnings", default=0),
+            unreviewed=Sum("unreviewed_strings", default=0),
+        )
+
+    def stats_sums(self, outer_ref: str) -> dict[str, Coalesce]:
+        """
+        Annotations summing up the stats of these project locales
+        for each `outer_ref` (`"project"` or `"locale"`) of an outer query.
+        """
+        query = self.filter(**{outer_ref: OuterRef("pk")}).order_by().values(outer_ref)
+        return {
+            name: Coalesce(Subquery(query.annotate(sum=Sum(field)).values("sum")), 0)
+            for name, field in [
+                ("total", "total_strings"),
+                ("approved", "approved_strings"),
+                ("pretranslated", "pretranslated_strings"),
+                ("errors", "strings_with_errors"),
+                ("warnings", "strings_with_warnings"),
+                ("unreviewed", "unreviewed_strings"),
+            ]
+        }
+
     def stats_data(self, project=None, locale=None):
+        from pontoon.base.models.translated_resource import TranslatedResource
+
         if project:
-            query = self.filter(
-                locale__translatedresources__resource__project=project,
-                locale__translatedresources__resource__obsolete=False,
-            ).prefetch_related("locale")
-            tr = "locale__translatedresources"
+            query = self.filter(project=project).prefetch_related("locale")
         elif locale:
             query = self.filter(
-                project__resources__translatedresources__locale=locale,
+                locale=locale,
                 project__disabled=False,
                 project__system_project=False,
                 project__visibility="public",
-                project__resources__obsolete=False,
             ).prefetch_related("project")
-            tr = "project__resources__translatedresources"
         else:
             raise ValueError("Either project or locale is required")
-        return query.annotate(
-            total=Sum(f"{tr}__total_strings", default=0),
-            approved=Sum(f"{tr}__approved_strings", default=0),
-            pretranslated=Sum(f"{tr}__pretranslated_strings", default=0),
-            errors=Sum(f"{tr}__strings_with_errors", default=0),
-            warnings=Sum(f"{tr}__strings_with_warnings", default=0),
-            unreviewed=Sum(f"{tr}__unreviewed_strings", default=0),
-        ).annotate(
-            missing=F("total")
-            - F("approved")
-            - F("pretranslated")
-            - F("errors")
-            - F("warnings"),
-            completed=F("approved") + F("warnings"),
-            is_complete=Case(
-                When(
-                    total=F("approved") + F("warnings"),
-                    then=Value(True),
+        return (
+            query.filter(
+                Exists(
+                    TranslatedResource.objects.filter(
+                        resource__project=OuterRef("project"),
+                        locale=OuterRef("locale"),
+                    )
+                )
+            )
+            .annotate(
+                total=F("total_strings"),
+                approved=F("approved_strings"),
+                pretranslated=F("pretranslated_strings"),
+                errors=F("strings_with_errors"),
+                warnings=F("strings_with_warnings"),
+                unreviewed=F("unreviewed_strings"),
+            )
+            .annotate(
+                missing=F("total")
+                - F("approved")
+                - F("pretranslated")
+                - F("errors")
+                - F("warnings"),
+                completed=F("approved") + F("warnings"),
+                is_complete=Case(
+                    When(
+                        total=F("approved") + F("warnings"),
+                        then=Value(True),
+                    ),
+                    default=Value(False),
+                    output_field=BooleanField(),
                 ),
-                default=Value(False),
-                output_field=BooleanField(),
-            ),
+            )
+        )
+
+    def calculate_stats(self) -> int:
+        """
+        Update the stored stats of the project locales
+        by summing up the stats of their translated resources.
+        """
+        from pontoon.base.models.translated_resource import TranslatedResource
+
+        tr_query = (
+            TranslatedResource.objects.filter(
+                resource__project=OuterRef("project"), locale=OuterRef("locale")
+            )
+            .order_by()
+            .values("locale")
+        )
+        return self.update(
+            **{
+                field: Coalesce(
+                    Subquery(tr_query.annotate(sum=Sum(field)).values("sum")), 0
+                )
+                for field in [
+                    "total_strings",
+                    "approved_strings",
+                    "pretranslated_strings",
+                    "strings_with_errors",
+                    "strings_with_warnings",
+                    "unreviewed_strings",
+                ]
+            }
         )
 
 
@@ -83,11 +172,7 @@ class ProjectLocale(models.Model, AggregatedStats):
 
     @property
     def aggregated_stats_query(self):
-        from pontoon.base.models.translated_resource import TranslatedResource
-
-        return TranslatedResource.objects.filter(
-            locale=self.locale, resource__project=self.project
-        )
+        return ProjectLocale.objects.filter(pk=self.pk)
 
     project: models.ForeignKey[Project] = models.ForeignKey(
         Project, models.CASCADE, related_name="project_locale"
@@ -98,6 +183,15 @@ class ProjectLocale(models.Model, AggregatedStats):
     readonly = models.BooleanField(default=False)
     pretranslation_enabled = models.BooleanField(default=False)
 
+    # Sums of the stats of the translated resources of this project in this locale,
+    # from which the locale and project stats are also summed up.
+    total_strings = models.PositiveIntegerField(default=0)
+    approved_strings = models.PositiveIntegerField(default=0)
+    pretranslated_strings = models.PositiveIntegerField(default=0)
+    strings_with_errors = models.PositiveIntegerField(default=0)
+    strings_with_warnings = models.PositiveIntegerField(default=0)
+    unreviewed_strings = models.PositiveIntegerField(default=0)
+
     #: Most recent translation approved or created for this project in
     #: this locale.
     latest_translation: models.ForeignKey["Translation | None"] = models.ForeignKey(
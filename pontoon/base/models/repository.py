@@ -66,6 +66,14 @@ class Repository(models.Model):
     """,
     )
 
+    sparse_checkout = models.BooleanField(
+        default=False,
+        help_text="""
+        If true, sync uses a partial clone of this git repo,
+        and only checks out the files used by the project.
+    """,
+    )
+
     def __repr__(self):
         repo_kind = "Repository"
         if self.source_repo:
@@ -31,6 +31,12 @@ class ResourceQuerySet(models.QuerySet["Resource"]):
 
         TranslatedResource.objects.filter(resource__in=self).delete()
 
+        from pontoon.base.models.project_locale import ProjectLocale
+
+        ProjectLocale.objects.filter(
+            project__in=self.values("project")
+        ).calculate_stats()
+
     def current(self):
         return self.filter(obsolete=False)
 
@@ -5,6 +5,7 @@ from django.db.models import F, Sum
 
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.project import Project
+from pontoon.base.models.project_locale import ProjectLocale
 from pontoon.base.models.resource import Resource
 from pontoon.base.models.translation import Translation
 from pontoon.base.models.user import User
@@ -65,6 +66,10 @@ class TranslatedResourceQuerySet(models.QuerySet["TranslatedResource"]):
                 "unreviewed_strings",
             ],
         )
+        ProjectLocale.objects.filter(
+            project__in={tr.resource.project_id for tr in self},
+            locale__in={tr.locale_id for tr in self},
+        ).calculate_stats()
 
         n = len(self)
         log.debug(f"update_stats: {n} translated resource{'' if n == 1 else 's'}")
@@ -99,6 +104,10 @@ class TranslatedResource(models.Model):
         related_name="resource_latest",
     )
 
+    #: Digest of the target file and the data it was written from,
+    #: as of its last sync commit. Used by sync to skip unchanged files.
+    sync_digest = models.CharField(max_length=64, blank=True, default="")
+
     objects = TranslatedResourceQuerySet.as_manager()
 
     class Meta:
@@ -117,7 +126,9 @@ class TranslatedResource(models.Model):
     def adjust_stats(
         self, before: dict[str, int], after: dict[str, int], tr_created: bool
     ):
+        total_diff = 0
         if tr_created:
+            total_diff = self.resource.total_strings - self.total_strings
             self.total_strings = self.resource.total_strings
         self.approved_strings = (
             F("approved_strings") + after["approved"] - before["approved"]
@@ -146,6 +157,26 @@ class TranslatedResource(models.Model):
                 "unreviewed_strings",
             ]
         )
+        ProjectLocale.objects.filter(
+            project=self.resource.project_id, locale=self.locale_id
+        ).update(
+            total_strings=F("total_strings") + total_diff,
+            approved_strings=F("approved_strings")
+            + after["approved"]
+            - before["approved"],
+            pretranslated_strings=F("pretranslated_strings")
+            + after["pretranslated"]
+            - before["pretranslated"],
+            strings_with_errors=F("strings_with_errors")
+            + after["errors"]
+            - before["errors"],
+            strings_with_warnings=F("strings_with_warnings")
+            + after["warnings"]
+            - before["warnings"],
+            unreviewed_strings=F("unreviewed_strings")
+            + after["unreviewed"]
+            - before["unreviewed"],
+        )
 
     def calculate_stats(self, save=True):
         """Update stats, including denormalized ones."""
@@ -177,3 +208,6 @@ class TranslatedResource(models.Model):
                     "unreviewed_strings",
                 ]
             )
+            ProjectLocale.objects.filter(
+                project=self.resource.project_id, locale=self.locale_id
+            ).calculate_stats()
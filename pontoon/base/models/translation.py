@@ -4,7 +4,7 @@ from dirtyfields import DirtyFieldsMixin
 
 from django.contrib.postgres.fields import ArrayField
 from django.db import IntegrityError, models, transaction
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, QuerySet
 from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog
@@ -14,6 +14,7 @@ from pontoon.base.models.entity import Entity
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.project import Project
 from pontoon.base.models.project_locale import ProjectLocale
+from pontoon.base.models.resource import Resource
 from pontoon.base.models.user import User
 from pontoon.base.simple_preview import get_simple_preview
 from pontoon.checks import DB_FORMATS
@@ -34,33 +35,24 @@ class TranslationQuerySet(models.QuerySet["Translation"]):
         :return: a dictionary with approved, pretranslated, errors, warnings,
                  and unreviewed counts.
         """
-        stats = self.aggregate(
+        from pontoon.checks.models import Error, Warning
+
+        # Semi-joins avoid multiplying translation rows by their failed checks
+        failed_q = Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True)
+        stats = self.alias(
+            has_errors=Exists(Error.objects.filter(translation=OuterRef("pk"))),
+            has_warnings=Exists(Warning.objects.filter(translation=OuterRef("pk"))),
+        ).aggregate(
             approved_count=Count(
                 "pk",
-                filter=Q(approved=True, errors__isnull=True, warnings__isnull=True),
+                filter=Q(approved=True, has_errors=False, has_warnings=False),
             ),
             pretranslated_count=Count(
                 "pk",
-                filter=Q(
-                    pretranslated=True, errors__isnull=True, warnings__isnull=True
-                ),
-            ),
-            errors_count=Count(
-                "pk",
-                distinct=True,
-                filter=Q(
-                    Q(Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
-                    & Q(errors__isnull=False)
-                ),
-            ),
-            warnings_count=Count(
-                "pk",
-                distinct=True,
-                filter=Q(
-                    Q(Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
-                    & Q(warnings__isnull=False)
-                ),
+                filter=Q(pretranslated=True, has_errors=False, has_warnings=False),
             ),
+            errors_count=Count("pk", filter=failed_q & Q(has_errors=True)),
+            warnings_count=Count("pk", filter=failed_q & Q(has_warnings=True)),
             unreviewed_count=Count(
                 "pk",
                 filter=Q(
@@ -86,11 +78,20 @@ class TranslationQuerySet(models.QuerySet["Translation"]):
     def for_checks(self, only_db_formats=True):
         """
         Return an optimized queryset for `checks`-related functions.
+
+        The entities of a resource are only prefetched for formats
+        that use them as check references, i.e. DTD.
         :arg bool only_db_formats: filter translations by formats supported by checks.
         """
-        translations = self.prefetch_related(
-            "entity__resource__entities",
-            "locale",
+        translations = self.select_related(
+            "entity__resource", "locale"
+        ).prefetch_related(
+            Prefetch(
+                "entity__resource__entities",
+                queryset=Entity.objects.filter(
+                    resource__format=Resource.Format.DTD
+                ).only("key", "string", "comment", "resource_id"),
+            )
         )
 
         if only_db_formats:
@@ -101,22 +102,28 @@ class TranslationQuerySet(models.QuerySet["Translation"]):
         return translations
 
     def bulk_mark_changed(self):
-        changed_entities = {}
-        existing = ChangedEntityLocale.objects.values_list(
-            "entity", "locale"
-        ).distinct()
-
-        for translation in self.exclude(
-            entity__resource__project__data_source=Project.DataSource.DATABASE
-        ):
-            key = (translation.entity.pk, translation.locale.pk)
-
-            if key not in existing:
-                changed_entities[key] = ChangedEntityLocale(
-                    entity=translation.entity, locale=translation.locale
-                )
+        """
+        Mark the entity & locale of each translation as changed since the last sync.
 
-        ChangedEntityLocale.objects.bulk_create(changed_entities.values())
+        Uses `INSERT ... ON CONFLICT DO NOTHING` to skip already marked pairs.
+        """
+        now = timezone.now()
+        keys = (
+            self.exclude(
+                entity__resource__project__data_source=Project.DataSource.DATABASE
+            )
+            .order_by()
+            .values_list("entity_id", "locale_id")
+            .distinct()
+        )
+        ChangedEntityLocale.objects.bulk_create(
+            (
+                ChangedEntityLocale(entity_id=entity_id, locale_id=locale_id, when=now)
+                for entity_id, locale_id in keys.iterator()
+            ),
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
 
 
 class Translation(DirtyFieldsMixin, models.Model):
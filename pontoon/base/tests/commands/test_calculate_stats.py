@@ -0,0 +1,100 @@
+import logging
+
+import pytest
+
+from django.core.management import call_command
+
+from pontoon.base.models import ProjectLocale, TranslatedResource
+from pontoon.test.factories import (
+    EntityFactory,
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
+
+
+@pytest.fixture
+def outdated_stats():
+    locales = LocaleFactory.create_batch(2)
+    project = ProjectFactory.create(locales=locales)
+    for path in ["a.ftl", "b.ftl", "c.ftl"]:
+        resource = ResourceFactory.create(project=project, path=path)
+        for locale in locales:
+            TranslatedResourceFactory.create(resource=resource, locale=locale)
+        entity = EntityFactory.create(resource=resource)
+        for locale in locales:
+            TranslationFactory.create(entity=entity, locale=locale, approved=True)
+    call_command("calculate_stats")
+    TranslatedResource.objects.filter(
+        resource__project=project, resource__path__in=["a.ftl", "c.ftl"]
+    ).update(approved_strings=0)
+    return project
+
+
+def approved_stats(project):
+    return sorted(
+        TranslatedResource.objects.filter(resource__project=project).values_list(
+            "resource__path", "approved_strings"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_dry_run(outdated_stats, caplog):
+    caplog.set_level(logging.INFO)
+    call_command("calculate_stats", dry_run=True, chunk_size=2)
+    assert f"[{outdated_stats.slug}] Stats drift in 4 translated resources" in (
+        caplog.messages
+    )
+    assert approved_stats(outdated_stats) == [
+        ("a.ftl", 0),
+        ("a.ftl", 0),
+        ("b.ftl", 1),
+        ("b.ftl", 1),
+        ("c.ftl", 0),
+        ("c.ftl", 0),
+    ]
+
+
+@pytest.mark.django_db
+def test_dry_run_empty_resource(outdated_stats, caplog):
+    caplog.set_level(logging.INFO)
+    call_command("calculate_stats")
+    # A resource with only obsolete entities
+    resource = ResourceFactory.create(project=outdated_stats, path="d.ftl")
+    EntityFactory.create(resource=resource, obsolete=True)
+    TranslatedResourceFactory.create(
+        resource=resource, locale=outdated_stats.locales.first(), total_strings=1
+    )
+    call_command("calculate_stats", dry_run=True)
+    assert f"[{outdated_stats.slug}] Stats drift in 1 translated resource" in (
+        caplog.messages
+    )
+
+
+@pytest.mark.django_db
+def test_chunk_size(outdated_stats, caplog):
+    caplog.set_level(logging.INFO)
+    ProjectLocale.objects.filter(project=outdated_stats).update(approved_strings=0)
+    call_command("calculate_stats", chunk_size=3)
+    assert approved_stats(outdated_stats) == [
+        ("a.ftl", 1),
+        ("a.ftl", 1),
+        ("b.ftl", 1),
+        ("b.ftl", 1),
+        ("c.ftl", 1),
+        ("c.ftl", 1),
+    ]
+    assert "Calculating stats... 100% done, ETA 0:00:00" in caplog.messages
+    assert list(
+        ProjectLocale.objects.filter(project=outdated_stats).values_list(
+            "approved_strings", flat=True
+        )
+    ) == [3, 3]
+
+    call_command("calculate_stats", dry_run=True)
+    assert "Checking stats complete. Stats drift in 0 translated resources." in (
+        caplog.messages
+    )
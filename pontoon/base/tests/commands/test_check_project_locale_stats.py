@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+
+from django.core.management import call_command
+
+from pontoon.base.models import ProjectLocale
+from pontoon.test.factories import (
+    EntityFactory,
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
+
+
+@pytest.fixture
+def outdated_stats():
+    locales = LocaleFactory.create_batch(2)
+    project = ProjectFactory.create(locales=locales)
+    resource = ResourceFactory.create(project=project, path="a.ftl")
+    for locale in locales:
+        TranslatedResourceFactory.create(resource=resource, locale=locale)
+    entity = EntityFactory.create(resource=resource)
+    for locale in locales:
+        TranslationFactory.create(entity=entity, locale=locale, approved=True)
+    ProjectLocale.objects.filter(project=project, locale=locales[0]).update(
+        approved_strings=0
+    )
+    return project
+
+
+def approved_stats(project):
+    return sorted(
+        ProjectLocale.objects.filter(project=project).values_list(
+            "approved_strings", flat=True
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_check(outdated_stats, caplog):
+    caplog.set_level(logging.INFO)
+    call_command("check_project_locale_stats")
+    assert f"[{outdated_stats.slug}] Stats drift in 1 project locale" in (
+        caplog.messages
+    )
+    assert approved_stats(outdated_stats) == [0, 1]
+
+
+@pytest.mark.django_db
+def test_fix(outdated_stats, caplog):
+    caplog.set_level(logging.INFO)
+    call_command("check_project_locale_stats", fix=True)
+    assert approved_stats(outdated_stats) == [1, 1]
+
+    call_command("check_project_locale_stats")
+    assert (
+        "Checking project locale stats complete. Stats drift in 0 project locales."
+        in caplog.messages
+    )
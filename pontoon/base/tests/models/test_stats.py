@@ -4,16 +4,25 @@ Test consistency of calculations between `calculate_stats` and `translation.save
 
 import pytest
 
-from pontoon.base.models import TranslatedResource
+from pontoon.base.models import ProjectLocale, TranslatedResource
 from pontoon.test.factories import TranslationFactory
 
 
 def get_stats(translation):
-    return TranslatedResource.objects.filter(
+    stats = TranslatedResource.objects.filter(
         resource=translation.entity.resource,
         locale=translation.locale,
     ).string_stats()
 
+    # The project locale stats are kept in sync with the translated resource stats
+    project_locale_stats = ProjectLocale.objects.filter(
+        project=translation.entity.resource.project,
+        locale=translation.locale,
+    ).string_stats()
+    assert project_locale_stats == stats
+
+    return stats
+
 
 @pytest.mark.django_db
 def test_translation_approved(translation_a):
@@ -2,7 +2,12 @@ from unittest.mock import call, patch
 
 import pytest
 
-from pontoon.base.models import Project, Translation, TranslationMemoryEntry
+from pontoon.base.models import (
+    ChangedEntityLocale,
+    Project,
+    Translation,
+    TranslationMemoryEntry,
+)
 from pontoon.base.utils import aware_datetime
 from pontoon.test.factories import (
     EntityFactory,
@@ -321,3 +326,21 @@ def test_machinery_sources_values(locale_a, entity_a):
     assert (
         translation.machinery_sources_values == "Translation Memory, Google Translate"
     )
+
+
+@pytest.mark.django_db
+def test_translation_bulk_mark_changed(locale_a, entity_a, entity_b):
+    """
+    Translations are marked as changed once per entity & locale,
+    keeping existing marks unchanged.
+    """
+    existing = ChangedEntityLocale.objects.create(entity=entity_b, locale=locale_a)
+    TranslationFactory.create_batch(2, locale=locale_a, entity=entity_a)
+    TranslationFactory.create(locale=locale_a, entity=entity_b)
+
+    Translation.objects.filter(locale=locale_a).bulk_mark_changed()
+    changed = ChangedEntityLocale.objects.filter(locale=locale_a)
+    assert sorted(changed.values_list("entity_id", flat=True)) == sorted(
+        [entity_a.pk, entity_b.pk]
+    )
+    assert changed.get(entity=entity_b).when == existing.when
@@ -1,11 +1,15 @@
 import json
 
+from unittest.mock import patch
+
 import pytest
 
 from pontoon.base.models import TranslatedResource
 from pontoon.test.factories import (
     EntityFactory,
     ProjectLocaleFactory,
+    TermFactory,
+    TermTranslationFactory,
     TranslationFactory,
 )
 
@@ -54,6 +58,56 @@ def test_view_get_entities_paging(
     assert json.loads(response.content)["entities"][0]["pk"] == entities[-1].pk
 
 
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_view_get_entities_terms(
+    _, member, resource_a, locale_a, django_capture_on_commit_callbacks
+):
+    """
+    The terms of the returned entities are included if requested.
+    """
+    TranslatedResource.objects.create(resource=resource_a, locale=locale_a)
+    ProjectLocaleFactory.create(project=resource_a.project, locale=locale_a)
+    entity_a = EntityFactory.create(resource=resource_a, string="Open a new tab")
+    entity_b = EntityFactory.create(resource=resource_a, string="Close the window")
+    with django_capture_on_commit_callbacks(execute=True):
+        term = TermFactory.create(text="new tab")
+    TermTranslationFactory.create(term=term, locale=locale_a, text="tab-kg")
+
+    params = {
+        "project": resource_a.project.slug,
+        "locale": locale_a.code,
+        "paths[]": [resource_a.path],
+        "page": 1,
+        "limit": 50,
+    }
+    response = member.client.post(
+        "/get-entities/", params, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+    )
+    assert response.status_code == 200
+    assert "terms" not in json.loads(response.content)
+
+    response = member.client.post(
+        "/get-entities/",
+        {**params, "terms": "true"},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content)["terms"] == {
+        str(entity_a.pk): [
+            {
+                "text": "new tab",
+                "part_of_speech": term.part_of_speech,
+                "definition": term.definition,
+                "usage": term.usage,
+                "translation": "tab-kg",
+                "entity_id": term.entity_id,
+            }
+        ],
+        str(entity_b.pk): [],
+    }
+
+
 @pytest.mark.django_db
 def test_entities_string_not_shown_if_not_matching_filters(member, entity_a, locale_a):
     """
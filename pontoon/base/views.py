@@ -73,6 +73,7 @@ from pontoon.checks.libraries import run_checks
 from pontoon.checks.utils import are_blocking_checks
 from pontoon.contributors.utils import users_with_translations_counts
 from pontoon.messaging.notifications import send_notification
+from pontoon.terminology.utils import get_entity_terms
 
 
 log = logging.getLogger(__name__)
@@ -128,7 +129,7 @@ def locale_projects(request, locale):
 def locale_stats(request, locale):
     """Get locale stats used in All Resources part."""
     locale = get_object_or_404(Locale, code=locale)
-    stats = TranslatedResource.objects.filter(locale=locale).string_stats(request.user)
+    stats = ProjectLocale.objects.filter(locale=locale).string_stats(request.user)
     stats["title"] = "all-resources"
     return JsonResponse([stats], safe=False)
 
@@ -237,15 +238,15 @@ def _get_entities_list(
 
     entities = entities.distinct().order_by("order")
 
-    return JsonResponse(
-        {
-            "entities": map_entities_to_json(locale, preferred_source_locale, entities),
-            "stats": TranslatedResource.objects.query_stats(
-                project, cleaned_data["paths"], locale
-            ),
-        },
-        safe=False,
-    )
+    response = {
+        "entities": map_entities_to_json(locale, preferred_source_locale, entities),
+        "stats": TranslatedResource.objects.query_stats(
+            project, cleaned_data["paths"], locale
+        ),
+    }
+    if cleaned_data["terms"] and not preferred_source_locale:
+        response["terms"] = get_entity_terms(entities, locale)
+    return JsonResponse(response, safe=False)
 
 
 def _get_paginated_entities(
@@ -323,6 +324,10 @@ def _get_paginated_entities(
     }
     if requested_entity_location is not None:
         response["requested_entity"] = requested_entity_location
+    if cleaned_data["terms"] and not preferred_source_locale:
+        response["terms"] = get_entity_terms(
+            cast(QuerySet[Entity], entities_page.object_list), locale
+        )
     return JsonResponse(response, safe=False)
 
 
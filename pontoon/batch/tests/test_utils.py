@@ -75,6 +75,30 @@ def test_ftl_find_and_replace_non_text_value(locale_a, user_a):
     assert translations_with_errors == []
 
 
+@pytest.mark.django_db
+def test_find_and_replace_dtd_queries(locale_a, user_a, django_assert_max_num_queries):
+    """
+    Resource entities used as DTD check references are loaded in a single
+    query, regardless of the number of matching translations.
+    """
+    project = ProjectFactory(slug="project", name="Project")
+    resource = ResourceFactory(project=project, path="resource.dtd", format="dtd")
+    for i in range(10):
+        entity = EntityFactory(resource=resource, key=[f"key{i}"], string=f"find {i}")
+        TranslationFactory(entity=entity, locale=locale_a, string=f"find {i}")
+
+    translations = Translation.objects.filter(entity__resource=resource)
+    with django_assert_max_num_queries(4):
+        _, translations_to_create, translations_with_errors = find_and_replace(
+            translations, "find", "replace", user_a
+        )
+
+    assert sorted(t.string for t in translations_to_create) == [
+        f"replace {i}" for i in range(10)
+    ]
+    assert translations_with_errors == []
+
+
 @pytest.mark.django_db
 def test_copy_from_another_locale():
     """
@@ -133,9 +133,11 @@ def find_and_replace(
             errors = True
 
         if not errors and res_format in DB_FORMATS:
+            # Deep copies drop prefetched querysets, so checks use the original
+            # entity with its prefetched resource entities.
             errors = run_checks(
-                new_translation.entity,
-                new_translation.locale.code,
+                translation.entity,
+                translation.locale.code,
                 new_translation.string,
                 use_tt_checks=False,
             )
@@ -5,7 +5,7 @@ from celery import shared_task
 from django.db import transaction
 
 from pontoon.base.models import Translation
-from pontoon.checks.utils import bulk_run_checks
+from pontoon.checks.utils import bulk_run_checks, get_translations_for_checks
 
 
 log = logging.getLogger(__name__)
@@ -18,7 +18,9 @@ def check_translations(self, translations_pks):
     :arg list[int] translations_pks: list of primary keys for translations that should be processed
     """
     with transaction.atomic():
-        translations = Translation.objects.for_checks().filter(pk__in=translations_pks)
+        translations = get_translations_for_checks(
+            Translation.objects.filter(pk__in=translations_pks)
+        )
 
         warnings, errors = bulk_run_checks(translations)
 
@@ -9,6 +9,7 @@ from pontoon.checks.models import (
 from pontoon.checks.utils import (
     bulk_run_checks,
     get_failed_checks_db_objects,
+    get_translations_for_checks,
     save_failed_checks,
 )
 
@@ -146,6 +147,34 @@ def test_bulk_run_checks(
     assert p_error.translation == translation_pontoon_error
 
 
+@pytest.mark.django_db
+def test_bulk_run_checks_lean_translations(
+    django_assert_num_queries,
+    translation_compare_locales_warning,
+    translation_compare_locales_error,
+):
+    pks = [translation_compare_locales_warning.pk, translation_compare_locales_error.pk]
+    with django_assert_num_queries(1):
+        translations = get_translations_for_checks(
+            Translation.objects.filter(pk__in=pks).order_by("pk")
+        )
+    assert [tx.pk for tx in translations] == pks
+    assert translations[0].entity.resource is translations[1].entity.resource
+
+    warnings, errors = bulk_run_checks(translations)
+    # The fixtures share an entity, with the string "test %s %s"
+    assert [(w.translation_id, w.message) for w in warnings] == [
+        (translation_compare_locales_warning.pk, "unknown escape sequence, \\q"),
+        (
+            translation_compare_locales_warning.pk,
+            "trailing argument 1 `s` missing, trailing argument 2 `s` missing",
+        ),
+    ]
+    assert [(e.translation_id, e.message) for e in errors] == [
+        (translation_compare_locales_error.pk, "Found single %")
+    ]
+
+
 @pytest.mark.django_db
 def test_get_failed_checks_db_objects(translation_a):
     """
@@ -1,4 +1,82 @@
-from pontoon.checks import DB_LIBRARIES
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db.models import Prefetch, QuerySet, prefetch_related_objects
+
+from pontoon.checks import DB_FORMATS, DB_LIBRARIES
+
+
+if TYPE_CHECKING:
+    from pontoon.base.models import Entity, Translation
+
+
+class CheckTranslation(NamedTuple):
+    """
+    The data of a translation that is used by `bulk_run_checks()`.
+
+    `entity` only includes its `string`, `key` and `comment` fields,
+    and its `resource` only includes its `path` and `format`.
+    """
+
+    pk: int
+    string: str
+    locale_code: str
+    entity: "Entity"
+
+
+def get_translations_for_checks(
+    translations: QuerySet["Translation"], only_db_formats: bool = True
+) -> list[CheckTranslation]:
+    """
+    Load only the data of `translations` that is used by `bulk_run_checks()`.
+
+    The entities of a resource are only loaded for formats
+    that use them as check references, i.e. DTD.
+    :arg bool only_db_formats: filter translations by formats supported by checks.
+    """
+    from pontoon.base.models import Entity, Resource
+
+    if only_db_formats:
+        translations = translations.filter(entity__resource__format__in=DB_FORMATS)
+    resources: dict[int, Resource] = {}
+    records: list[CheckTranslation] = []
+    for row in translations.values_list(
+        "pk",
+        "string",
+        "locale__code",
+        "entity_id",
+        "entity__string",
+        "entity__key",
+        "entity__comment",
+        "entity__resource_id",
+        "entity__resource__path",
+        "entity__resource__format",
+    ).iterator():
+        pk, string, locale_code, entity_id, ent_string, key, comment = row[:7]
+        res_id, res_path, res_format = row[7:]
+        resource = resources.get(res_id, None)
+        if resource is None:
+            resource = Resource(pk=res_id, path=res_path, format=res_format)
+            resources[res_id] = resource
+        entity = Entity(
+            pk=entity_id,
+            string=ent_string,
+            key=key,
+            comment=comment,
+            resource=resource,
+        )
+        records.append(CheckTranslation(pk, string, locale_code, entity))
+
+    dtd_resources = [
+        res for res in resources.values() if res.format == Resource.Format.DTD
+    ]
+    if dtd_resources:
+        prefetch_related_objects(
+            dtd_resources,
+            Prefetch(
+                "entities", queryset=Entity.objects.only("key", "string", "comment")
+            ),
+        )
+    return records
 
 
 def bulk_run_checks(translations):
@@ -6,7 +84,8 @@ def bulk_run_checks(translations):
     Run checks on a list of translations
 
     *Important*
-    To avoid performance problems, translations have to prefetch entities and locales objects.
+    To avoid performance problems, use `get_translations_for_checks()`
+    or have translations select their entities, resources and locales.
     """
     from pontoon.checks.libraries import run_checks
     from pontoon.checks.models import Error, Warning
@@ -16,11 +95,16 @@ def bulk_run_checks(translations):
         return
 
     for translation in translations:
+        locale_code = (
+            translation.locale_code
+            if isinstance(translation, CheckTranslation)
+            else translation.locale.code
+        )
         warnings_, errors_ = get_failed_checks_db_objects(
             translation,
             run_checks(
                 translation.entity,
-                translation.locale.code,
+                locale_code,
                 translation.string,
                 use_tt_checks=False,
             ),
@@ -42,7 +126,7 @@ def bulk_run_checks(translations):
 def get_failed_checks_db_objects(translation, failed_checks):
     """
     Return model instances of Warnings and Errors
-    :arg Translation translation: instance of translation
+    :arg Translation|CheckTranslation translation: instance of translation
     :arg dict failed_checks: dictionary with failed checks
     """
     from pontoon.checks.models import Error, Warning
@@ -65,7 +149,7 @@ def get_failed_checks_db_objects(translation, failed_checks):
                 severity_cls(
                     library=library,
                     message=message,
-                    translation=translation,
+                    translation_id=translation.pk,
                 )
                 for message in messages
             ]
@@ -1,4 +1,7 @@
-from django.db.models import Func
+from functools import cache
+
+from django.db import connection
+from django.db.models import FloatField, Func
 from django.db.models.lookups import (
     Field,
     IContains,
@@ -19,6 +22,30 @@ class LevenshteinDistance(Func):
         super().__init__(expr1, expr2, insertion_cost, deletion_cost, substitution_cost)
 
 
+class TrigramSimilarity(Func):
+    """
+    Calculate the trigram similarity (from 0 to 1) between an expression and a string,
+    using the `similarity()` function of the `pg_trgm` module.
+    """
+
+    function = "similarity"
+    arity = 2
+    output_field = FloatField()
+
+
+@cache
+def has_trigram_similarity() -> bool:
+    """
+    Whether the `pg_trgm` module is installed in the database.
+
+    As the module is only installed by a migration,
+    the result is cached for the lifetime of the process.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
 class IContainsCollate(IContains):
     """
     Searching for translations may produce invalid results if you don't specify a correct
@@ -45,7 +45,9 @@ def localization(request, code, slug):
         {
             "locale": locale,
             "project": project,
-            "project_locale_stats": trans_res.string_stats(count_system_projects=True),
+            "project_locale_stats": ProjectLocale.objects.filter(
+                locale=locale, project=project
+            ).string_stats(count_system_projects=True),
             "resource_count": trans_res.filter(resource__entities__obsolete=False)
             .distinct()
             .count(),
@@ -1,15 +1,31 @@
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
 
 import pytest
+import requests
 
 from django.core.cache import cache
 from django.core.management import call_command
 
 from pontoon.machinery.utils import (
+    concordance_search_after,
+    encode_concordance_cursor,
+    get_concordance_search_data,
     get_google_automl_translation,
+    get_google_generic_translation,
+    get_google_translate_batch_data,
     get_machinery_service_cache_key,
+    get_microsoft_translator_batch_data,
+)
+from pontoon.test.factories import (
+    LocaleFactory,
+    ProjectLocaleFactory,
+    TranslationMemoryFactory,
 )
-from pontoon.test.factories import LocaleFactory
 
 
 @pytest.fixture
@@ -94,3 +110,168 @@ def test_warmup_automl_command_bypasses_cache(automl_project_id, automl_locale):
 
     # The warmup made a real request even though a cached value was present.
     assert client.translate_text.call_count == 1
+
+
+@pytest.fixture
+def mt_server():
+    """
+    A local stub of the Google Translate v2 and Microsoft Translator APIs,
+    translating texts to upper case and recording the texts of each request.
+    """
+    requests_texts = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+            if self.path.startswith("/google"):
+                texts = parse_qs(body)["q"]
+                data = {
+                    "data": {
+                        "translations": [{"translatedText": t.upper()} for t in texts]
+                    }
+                }
+            else:
+                texts = [item["Text"] for item in json.loads(body)]
+                data = [{"translations": [{"text": t.upper()}]} for t in texts]
+            requests_texts.append(texts)
+            content = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    with (
+        patch("pontoon.machinery.utils.GOOGLE_TRANSLATE_URL", f"{url}/google"),
+        patch("pontoon.machinery.utils.MICROSOFT_TRANSLATOR_URL", f"{url}/microsoft"),
+        patch("pontoon.machinery.utils.MT_BATCH_SIZE", 2),
+    ):
+        yield requests_texts
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.django_db
+def test_google_translate_batch(
+    mt_server, google_translate_locale, google_translate_api_key
+):
+    cache.clear()
+    cache.set(
+        get_machinery_service_cache_key(
+            "google_generic",
+            "cached",
+            google_translate_locale.google_translate_code,
+            "text",
+        ),
+        "from cache",
+    )
+    texts = ["a", "b", "c", "cached", "a"]
+
+    with requests.Session() as session:
+        translations = get_google_translate_batch_data(
+            texts, google_translate_locale, session=session
+        )
+
+    assert translations == {"a": "A", "b": "B", "c": "C", "cached": "from cache"}
+    assert mt_server == [["a", "b"], ["c"]]
+
+    # The per-string cache is populated
+    assert get_google_generic_translation("c", "google-translate") == "C"
+    assert len(mt_server) == 2
+
+
+@pytest.mark.django_db
+def test_microsoft_translator_batch(mt_server, ms_locale, ms_api_key):
+    cache.clear()
+    translations = get_microsoft_translator_batch_data(["x", "y", "z"], ms_locale)
+
+    assert translations == {"x": "X", "y": "Y", "z": "Z"}
+    assert mt_server == [["x", "y"], ["z"]]
+
+
+@patch("pontoon.machinery.utils.MT_BATCH_MAX_CHARS", 5)
+@pytest.mark.django_db
+def test_google_translate_batch_max_chars(
+    mt_server, google_translate_locale, google_translate_api_key
+):
+    cache.clear()
+    translations = get_google_translate_batch_data(
+        ["abc", "def", "very long text"], google_translate_locale
+    )
+
+    assert translations == {
+        "abc": "ABC",
+        "def": "DEF",
+        "very long text": "VERY LONG TEXT",
+    }
+    assert mt_server == [["abc"], ["def"], ["very long text"]]
+
+
+@pytest.mark.django_db
+def test_concordance_search_ranking(member, project_a, locale_a):
+    ProjectLocaleFactory.create(project=project_a, locale=locale_a)
+    for source, target in [
+        ("Open the file menu", "Ouvrir le menu fichier"),
+        ("File", "Fichier"),
+        ("Save file", "Enregistrer le fichier"),
+    ]:
+        TranslationMemoryFactory.create(
+            source=source, target=target, locale=locale_a, project=project_a
+        )
+
+    results = get_concordance_search_data(member.user, "file", locale_a)
+    assert [(r["source"], r["quality"]) for r in results] == [
+        ("File", 100),
+        ("Save file", 62),
+        ("Open the file menu", 36),
+    ]
+
+    # Keyset pagination continues after the given result
+    cursor = encode_concordance_cursor(results[0])
+    assert [r["source"] for r in concordance_search_after(results, cursor)] == [
+        "Save file",
+        "Open the file menu",
+    ]
+
+
+@pytest.mark.django_db
+def test_concordance_search_max_candidates(member, project_a, locale_a):
+    """
+    With more matches than candidates, only the most recent ones are ranked.
+    """
+    ProjectLocaleFactory.create(project=project_a, locale=locale_a)
+    for i in range(5):
+        TranslationMemoryFactory.create(
+            source=f"Open the file menu {i}",
+            target=f"Ouvrir le menu fichier {i}",
+            locale=locale_a,
+            project=project_a,
+        )
+    for source, target in [
+        ("Save file", "Enregistrer le fichier"),
+        ("File", "Fichier"),
+    ]:
+        TranslationMemoryFactory.create(
+            source=source, target=target, locale=locale_a, project=project_a
+        )
+
+    with patch("pontoon.machinery.utils.CONCORDANCE_MAX_CANDIDATES", 3):
+        results = get_concordance_search_data(member.user, "file", locale_a)
+        assert [r["source"] for r in results] == [
+            "File",
+            "Save file",
+            "Open the file menu 4",
+        ]
+
+        # Later pages are built from the same candidates
+        cursor = encode_concordance_cursor(results[1])
+        assert [r["source"] for r in concordance_search_after(results, cursor)] == [
+            "Open the file menu 4",
+        ]
@@ -152,7 +152,7 @@ def test_view_google_translate(
 
     req = m.request_history[0]
 
-    assert urllib.parse.parse_qs(req.query) == {
+    assert urllib.parse.parse_qs(req.text) == {
         "q": ["text"],
         "source": ["en"],
         "target": ["google-translate"],
@@ -310,7 +310,9 @@ def test_view_gpt_transform_cache(member, locale_a, openai_api_key):
 
 
 @pytest.mark.django_db
-def test_view_gpt_transform_context(member, locale_a, openai_api_key):
+def test_view_gpt_transform_context(
+    member, locale_a, openai_api_key, django_capture_on_commit_callbacks
+):
     url = reverse("pontoon.gpt_transform")
     cache.clear()
 
@@ -342,9 +344,10 @@ def test_view_gpt_transform_context(member, locale_a, openai_api_key):
     )
 
     # Term matching the source string, with a translation for the target locale
-    term = TermFactory(
-        text="browser", part_of_speech="noun", definition="A web browser"
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        term = TermFactory(
+            text="browser", part_of_speech="noun", definition="A web browser"
+        )
     TermTranslationFactory(term=term, locale=locale_a, text="navigateur")
 
     with patch("pontoon.machinery.openai_service.OpenAI") as MockOpenAI:
@@ -830,6 +833,8 @@ def test_view_concordance_search_remove_duplicates(
         {"limit": "a", "page": 1},
         {"limit": "a", "page": "a"},
         {"limit": 1, "page": "a"},
+        {"limit": 1, "cursor": "a"},
+        {"limit": 1, "cursor": "WzEwMF0="},
     ),
 )
 def test_view_concordance_search_invalid_pagination_parameters(
@@ -878,6 +883,7 @@ def test_view_concordance_search_pagination(client, project_a, locale_a, resourc
         {"text": "ccc", "locale": locale_a.code, "limit": 1},
     )
     results = json.loads(response.content)
+    cursor = results.pop("cursor")
     assert results == {
         "results": [
             {
@@ -917,6 +923,13 @@ def test_view_concordance_search_pagination(client, project_a, locale_a, resourc
         "has_next": False,
     }
 
+    # The second page may also be requested with the cursor of the first one
+    response = client.get(
+        "/concordance-search/",
+        {"text": "ccc", "locale": locale_a.code, "limit": 1, "cursor": cursor},
+    )
+    assert json.loads(response.content) == results
+
     # Check a query that should return no results
     response = client.get(
         "/concordance-search/",
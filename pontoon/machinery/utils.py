@@ -4,6 +4,7 @@ import logging
 import operator
 import os
 
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import defaultdict
 from functools import reduce
 from html import unescape
@@ -15,23 +16,43 @@ import requests
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud import translate
 from google.oauth2 import service_account
-from rapidfuzz.distance.Indel import normalized_distance
 
 from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg, JSONBAgg
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
-from django.db.models import Q
-from django.db.models.functions import JSONObject
+from django.db.models import Count, F, FloatField, IntegerField, Q, Value
+from django.db.models.functions import (
+    Cast,
+    Greatest,
+    JSONObject,
+    Length,
+    Lower,
+    Substr,
+)
 
 from pontoon.base.models import Locale, Project, ProjectLocale, TranslationMemoryEntry
 from pontoon.base.placeables import get_placeables
 from pontoon.base.utils import get_search_phrases
+from pontoon.db import LevenshteinDistance, TrigramSimilarity, has_trigram_similarity
 
 
 log = logging.getLogger(__name__)
 MAX_RESULTS = 5
 
+GOOGLE_TRANSLATE_URL = "https://translation.googleapis.com/language/translate/v2"
+MICROSOFT_TRANSLATOR_URL = "https://api.cognitive.microsofttranslator.com/translate"
+
+# Limits of a single batched request to a machine translation service
+MT_BATCH_SIZE = 100
+MT_BATCH_MAX_CHARS = 5000
+
+# Maximum number of translation memory entries ranked for a concordance search
+CONCORDANCE_MAX_CANDIDATES = 10000
+
+PROJECT_ORDER_CACHE_KEY = "concordance_search_project_order"
+PROJECT_ORDER_CACHE_TIMEOUT = 60 * 10  # 10 minutes
+
 
 def get_machinery_service_cache_key(service, *parts):
     digest = hashlib.md5(":".join(str(p) for p in parts).encode()).hexdigest()
@@ -54,137 +75,245 @@ def get_google_translate_data(text, locale, format="text", preserve_placeables=F
     return translation
 
 
-def get_google_generic_translation(text, locale_code, format="text"):
-    cache_key = get_machinery_service_cache_key(
-        "google_generic", text, locale_code, format
+def get_google_translate_batch_data(
+    texts, locale, format="text", preserve_placeables=False, session=None
+):
+    """
+    Batched version of `get_google_translate_data()`.
+
+    :returns: A dict mapping each of `texts` to its translation.
+    """
+    translations = (
+        get_google_automl_translations(texts, locale, format, preserve_placeables)
+        if locale.google_automl_model
+        else get_google_generic_translations(
+            texts, locale.google_translate_code, format, session
+        )
     )
-    cached = cache.get(cache_key)
-    if cached is not None:
-        return cached
+    if format == "html":
+        translations = {
+            text: unescape(translation) for text, translation in translations.items()
+        }
+
+    return translations
+
+
+def mt_batches(texts):
+    """
+    Split `texts` into batches of at most `MT_BATCH_SIZE` texts
+    and `MT_BATCH_MAX_CHARS` characters.
+    A text longer than `MT_BATCH_MAX_CHARS` is sent on its own.
+    """
+    batch = []
+    batch_chars = 0
+    for text in texts:
+        if batch and (
+            len(batch) == MT_BATCH_SIZE or batch_chars + len(text) > MT_BATCH_MAX_CHARS
+        ):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += len(text)
+    if batch:
+        yield batch
+
+
+def get_batch_translations(texts, get_cache_key, translate_batch, use_cache=True):
+    """
+    Translate `texts` with as few requests to a machine translation service
+    as possible, using and populating the per-string machinery service cache.
+
+    :arg get_cache_key: Returns the cache key of a text.
+    :arg translate_batch: Returns the translations of a list of texts, in order.
+    :returns: A dict mapping each of `texts` to its translation.
+    """
+    cache_keys = {text: get_cache_key(text) for text in texts}
+    translations = {}
+    if use_cache:
+        cached = cache.get_many(cache_keys.values())
+        for text, key in cache_keys.items():
+            if key in cached:
+                translations[text] = cached[key]
+
+    for batch in mt_batches(text for text in cache_keys if text not in translations):
+        batch_translations = translate_batch(batch)
+        if len(batch_translations) != len(batch):
+            raise ValueError(
+                f"Expected {len(batch)} translations, got {len(batch_translations)}"
+            )
+        translations.update(zip(batch, batch_translations))
+        if use_cache:
+            cache.set_many(
+                {
+                    cache_keys[text]: translation
+                    for text, translation in zip(batch, batch_translations)
+                },
+                settings.MACHINERY_SERVICE_CACHE_TIMEOUT,
+            )
+
+    return translations
 
+
+def get_google_generic_translation(text, locale_code, format="text"):
+    return get_google_generic_translations([text], locale_code, format)[text]
+
+
+def get_google_generic_translations(texts, locale_code, format="text", session=None):
     api_key = settings.GOOGLE_TRANSLATE_API_KEY
 
-    if not api_key:
-        raise ImproperlyConfigured("GOOGLE_TRANSLATE_API_KEY not set")
+    def translate_batch(batch):
+        if not api_key:
+            raise ImproperlyConfigured("GOOGLE_TRANSLATE_API_KEY not set")
 
-    url = "https://translation.googleapis.com/language/translate/v2"
+        payload = {
+            "q": batch,
+            "source": "en",
+            "target": locale_code,
+            "format": format,
+            "key": api_key,
+        }
 
-    payload = {
-        "q": text,
-        "source": "en",
-        "target": locale_code,
-        "format": format,
-        "key": api_key,
-    }
+        r = (session or requests).post(GOOGLE_TRANSLATE_URL, data=payload)
+        r.raise_for_status()
+        root = json.loads(r.content)
 
-    r = requests.post(url, params=payload)
-    r.raise_for_status()
-    root = json.loads(r.content)
+        if "data" not in root:
+            raise ValueError(f"Google Translate error: {root}")
 
-    if "data" not in root:
-        raise ValueError(f"Google Translate error: {root}")
+        return [t["translatedText"] for t in root["data"]["translations"]]
 
-    translation = root["data"]["translations"][0]["translatedText"]
-    set_machinery_service_cache_key(cache_key, translation)
-    return translation
+    return get_batch_translations(
+        texts,
+        lambda text: get_machinery_service_cache_key(
+            "google_generic", text, locale_code, format
+        ),
+        translate_batch,
+    )
 
 
 def get_google_automl_translation(
     text, locale, format="text", preserve_placeables=False, use_cache=True
 ):
-    cache_key = get_machinery_service_cache_key(
-        "google_automl",
-        text,
-        locale.code,
-        format,
-        preserve_placeables,
-    )
-    if use_cache:
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
+    return get_google_automl_translations(
+        [text], locale, format, preserve_placeables, use_cache
+    )[text]
 
-    try:
-        client = translate.TranslationServiceClient()
-    except DefaultCredentialsError as e:
-        raise ImproperlyConfigured(
-            f"Google AutoML credentials incorrectly configured: {e}"
-        )
 
-    project_id = settings.GOOGLE_AUTOML_PROJECT_ID
+def get_google_automl_translations(
+    texts, locale, format="text", preserve_placeables=False, use_cache=True
+):
+    client = None
+
+    def translate_batch(batch):
+        nonlocal client
+        if client is None:
+            try:
+                client = translate.TranslationServiceClient()
+            except DefaultCredentialsError as e:
+                raise ImproperlyConfigured(
+                    f"Google AutoML credentials incorrectly configured: {e}"
+                )
+
+        project_id = settings.GOOGLE_AUTOML_PROJECT_ID
+
+        if not project_id:
+            raise ImproperlyConfigured("GOOGLE_AUTOML_PROJECT_ID not set")
+
+        # Google AutoML Translation requires location "us-central1"
+        location = "us-central1"
+
+        parent = f"projects/{project_id}/locations/{location}"
+        model_id = locale.google_automl_model
+        model_path = f"{parent}/models/{model_id}"
+
+        request_params = {
+            "contents": batch,
+            "target_language_code": locale.google_translate_code,
+            "model": model_path,
+            "source_language_code": "en",
+            "parent": parent,
+            "mime_type": "text/html" if format == "html" else "text/plain",
+        }
 
-    if not project_id:
-        raise ImproperlyConfigured("GOOGLE_AUTOML_PROJECT_ID not set")
+        if preserve_placeables:
+            use_placeables_glossary(
+                "\n".join(batch), client, project_id, location, request_params
+            )
 
-    # Google AutoML Translation requires location "us-central1"
-    location = "us-central1"
+        # Get translations
+        response = client.translate_text(request=request_params)
 
-    parent = f"projects/{project_id}/locations/{location}"
-    model_id = locale.google_automl_model
-    model_path = f"{parent}/models/{model_id}"
+        translations = response.translations
+        if response.glossary_translations:
+            translations = response.glossary_translations
 
-    request_params = {
-        "contents": [text],
-        "target_language_code": locale.google_translate_code,
-        "model": model_path,
-        "source_language_code": "en",
-        "parent": parent,
-        "mime_type": "text/html" if format == "html" else "text/plain",
-    }
+        if len(translations) == 0:
+            raise ValueError("No translations found.")
 
-    if preserve_placeables:
-        use_placeables_glossary(text, client, project_id, location, request_params)
+        return [t.translated_text for t in translations]
 
-    # Get translations
-    response = client.translate_text(request=request_params)
+    return get_batch_translations(
+        texts,
+        lambda text: get_machinery_service_cache_key(
+            "google_automl", text, locale.code, format, preserve_placeables
+        ),
+        translate_batch,
+        use_cache,
+    )
 
-    translations = response.translations
-    if response.glossary_translations:
-        translations = response.glossary_translations
 
-    if len(translations) == 0:
-        raise ValueError("No translations found.")
+def get_microsoft_translator_data(text, locale, preserve_placeables=False):
+    return get_microsoft_translator_batch_data([text], locale, preserve_placeables)[
+        text
+    ]
 
-    translation = translations[0].translated_text
-    if use_cache:
-        set_machinery_service_cache_key(cache_key, translation)
-    return translation
 
+def get_microsoft_translator_batch_data(
+    texts, locale, preserve_placeables=False, session=None
+):
+    """
+    Batched version of `get_microsoft_translator_data()`.
 
-def get_microsoft_translator_data(text, locale, preserve_placeables=False):
+    :returns: A dict mapping each of `texts` to its translation.
+    """
     locale_code = locale.ms_translator_code
-    cache_key = get_machinery_service_cache_key(
-        "microsoft_translator", text, locale_code
-    )
-    cached = cache.get(cache_key)
-    if cached is not None:
-        return cached
-
     api_key = settings.MICROSOFT_TRANSLATOR_API_KEY
 
-    if not api_key:
-        raise ImproperlyConfigured("MICROSOFT_TRANSLATOR_API_KEY not set")
+    def translate_batch(batch):
+        if not api_key:
+            raise ImproperlyConfigured("MICROSOFT_TRANSLATOR_API_KEY not set")
 
-    url = "https://api.cognitive.microsofttranslator.com/translate"
-    headers = {"Ocp-Apim-Subscription-Key": api_key, "Content-Type": "application/json"}
-    payload = {
-        "api-version": "3.0",
-        "from": "en",
-        "to": locale_code,
-        "textType": "html",
-    }
-    body = [{"Text": text}]
+        headers = {
+            "Ocp-Apim-Subscription-Key": api_key,
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "api-version": "3.0",
+            "from": "en",
+            "to": locale_code,
+            "textType": "html",
+        }
+        body = [{"Text": text} for text in batch]
 
-    r = requests.post(url, params=payload, headers=headers, json=body)
-    r.raise_for_status()
-    root = json.loads(r.content)
+        r = (session or requests).post(
+            MICROSOFT_TRANSLATOR_URL, params=payload, headers=headers, json=body
+        )
+        r.raise_for_status()
+        root = json.loads(r.content)
 
-    if "error" in root:
-        raise ValueError(f"Unexpected response: {root}")
+        if "error" in root:
+            raise ValueError(f"Unexpected response: {root}")
 
-    translation = root[0]["translations"][0]["text"]
-    set_machinery_service_cache_key(cache_key, translation)
-    return translation
+        return [item["translations"][0]["text"] for item in root]
+
+    return get_batch_translations(
+        texts,
+        lambda text: get_machinery_service_cache_key(
+            "microsoft_translator", text, locale_code
+        ),
+        translate_batch,
+    )
 
 
 def use_placeables_glossary(text, client, project_id, location, request_params):
@@ -268,7 +397,49 @@ def store_new_terms(url, headers, new_terms):
             log.error(f"Adding new glossary terms failed: {r.content}")
 
 
+def concordance_quality(text):
+    """
+    An expression for the similarity (from 0 to 100) of the search text
+    to the more similar one of a translation memory entry's source and target.
+
+    Uses trigram similarity if the `pg_trgm` module is available,
+    and otherwise the Levenshtein ratio of up to 255 initial characters.
+    """
+    if has_trigram_similarity():
+        similarity = Greatest(
+            TrigramSimilarity(F("source"), Value(text)),
+            TrigramSimilarity(F("target"), Value(text)),
+        )
+    else:
+        text = text.lower()[:255]
+
+        def levenshtein_ratio(field):
+            string = Lower(Substr(field, 1, 255))
+            lengths = Cast(Length(string) + len(text), FloatField())
+            return (
+                lengths - LevenshteinDistance(string, Value(text), 1, 1, 2)
+            ) / lengths
+
+        similarity = Greatest(levenshtein_ratio("source"), levenshtein_ratio("target"))
+
+    return Cast(similarity * 100, IntegerField())
+
+
 def get_concordance_search_data(user, text, locale):
+    """
+    Search for `text` in the translation memory of `locale`.
+
+    The results are ranked in the database by their similarity to `text`
+    and the number of their projects, so that only the requested page is fetched.
+    To bound the cost of common search phrases, only the
+    `CONCORDANCE_MAX_CANDIDATES` most recent matching entries are scored,
+    grouped and ranked. For phrases with more matches, older entries
+    and some projects of the results may be left out.
+
+    :returns: A queryset of dicts with the `source`, `target`, `projects`
+        and `entities` of the results, as well as the `quality` and
+        `project_count` used for ranking them.
+    """
     search_phrases = get_search_phrases(text)
     search_filters = (
         Q(
@@ -285,10 +456,20 @@ def get_concordance_search_data(user, text, locale):
         "project_id", flat=True
     )
 
-    search_results = (
+    # The candidates are limited before they are scored,
+    # and picked by pk so that each page is built from the same candidates.
+    candidates = (
         TranslationMemoryEntry.objects.filter(search_query, project__in=projects)
+        .order_by("-pk")
+        .values("pk")[:CONCORDANCE_MAX_CANDIDATES]
+    )
+
+    return (
+        TranslationMemoryEntry.objects.filter(pk__in=candidates)
         .values("source", "target")
         .annotate(
+            quality=concordance_quality(text),
+            project_count=Count("project", distinct=True),
             projects=JSONBAgg(
                 JSONObject(
                     name="project__name",
@@ -306,23 +487,69 @@ def get_concordance_search_data(user, text, locale):
                 distinct=True,
             ),
         )
+        .order_by("-quality", "-project_count", "source", "target")
     )
 
-    def sort_by_quality(entity):
-        """Sort the results by their best Levenshtein distance from the search query"""
 
-        def levenshtein_distance(s1, s2):
-            return round((1 - normalized_distance(s1.lower(), s2.lower())) * 100)
-
-        return (
-            max(
-                levenshtein_distance(text, entity["target"]),
-                levenshtein_distance(text, entity["source"]),
-            ),
-            len(entity["projects"]),
+def concordance_search_after(results, cursor):
+    """
+    Filter the ranked `results` of `get_concordance_search_data()`
+    to the ones after the result identified by `cursor`.
+    """
+    quality, project_count, source, target = decode_concordance_cursor(cursor)
+    return results.filter(
+        Q(quality__lt=quality)
+        | Q(quality=quality, project_count__lt=project_count)
+        | Q(quality=quality, project_count=project_count, source__gt=source)
+        | Q(
+            quality=quality,
+            project_count=project_count,
+            source=source,
+            target__gt=target,
         )
+    )
+
 
-    return sorted(search_results, key=sort_by_quality, reverse=True)
+def encode_concordance_cursor(result):
+    key = [
+        result["quality"],
+        result["project_count"],
+        result["source"],
+        result["target"],
+    ]
+    return urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_concordance_cursor(cursor):
+    """Raises ValueError for an invalid `cursor`."""
+    key = json.loads(urlsafe_b64decode(cursor.encode()))
+    if not (
+        isinstance(key, list)
+        and len(key) == 4
+        and all(isinstance(value, int) for value in key[:2])
+        and all(isinstance(value, str) for value in key[2:])
+    ):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key
+
+
+def get_project_order():
+    """
+    The position of each project by name, in the order used for listing them:
+    enabled projects first, then by priority and name.
+    """
+    project_order = cache.get(PROJECT_ORDER_CACHE_KEY)
+    if project_order is None:
+        project_order = {
+            name: i
+            for i, name in enumerate(
+                Project.objects.order_by("disabled", "-priority", "name").values_list(
+                    "name", flat=True
+                )
+            )
+        }
+        cache.set(PROJECT_ORDER_CACHE_KEY, project_order, PROJECT_ORDER_CACHE_TIMEOUT)
+    return project_order
 
 
 def get_translation_memory_data(text, locale, pk=None):
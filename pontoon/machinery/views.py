@@ -10,18 +10,20 @@ from moz.l10n.message import message_to_json
 from sacremoses import MosesDetokenizer
 
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import EmptyPage, Paginator
 from django.http import JsonResponse
 from django.template.loader import get_template
 from django.utils.datastructures import MultiValueDictKeyError
 from django.utils.html import strip_tags
 from django.views.decorators.http import require_POST
 
-from pontoon.base.models import Comment, Entity, Locale, Project, Translation
+from pontoon.base.models import Comment, Entity, Locale, Translation
 from pontoon.machinery.utils import (
+    concordance_search_after,
+    encode_concordance_cursor,
     get_concordance_search_data,
     get_google_translate_data,
     get_microsoft_translator_data,
+    get_project_order,
     get_translation_memory_data,
 )
 from pontoon.pretranslation.pretranslate import MTEngine, Pretranslation
@@ -170,50 +172,58 @@ def machinery_composed(request):
 
 
 def concordance_search(request):
-    """Search for translations in the internal translations memory."""
+    """
+    Search for translations in the internal translations memory.
+
+    Results are paginated either by `page` number,
+    or by the `cursor` of the previous page's last result.
+    """
     try:
         text = request.GET["text"]
         locale = Locale.objects.get(code=request.GET["locale"])
         page_results_limit = int(request.GET.get("limit", 100))
         page = int(request.GET.get("page", 1))
+        cursor = request.GET.get("cursor", None)
+        results = get_concordance_search_data(request.user, text, locale)
+        if cursor:
+            results = concordance_search_after(results, cursor)
     except (Locale.DoesNotExist, MultiValueDictKeyError, ValueError) as e:
         return JsonResponse(
             {"status": False, "message": f"Bad Request: {e}"},
             status=400,
         )
 
-    paginator = Paginator(
-        get_concordance_search_data(request.user, text, locale), page_results_limit
-    )
-
-    try:
-        data = paginator.page(page)
-    except EmptyPage:
+    if page < 1 or page_results_limit < 1:
         return JsonResponse({"results": [], "has_next": False})
 
+    offset = 0 if cursor else (page - 1) * page_results_limit
+    results = list(results[offset : offset + page_results_limit + 1])
+    has_next = len(results) > page_results_limit
+    results = results[:page_results_limit]
+
     # JSONBAgg (used in get_concordance_search_data()) does not support using
     # distinct=True in combination with ordering, so we need to do one of them
     # manually - after pagination, to reduce the number of rows processed.
-    project_order = {
-        name: i
-        for i, name in enumerate(
-            list(
-                Project.objects.order_by("disabled", "-priority", "name").values_list(
-                    "name", flat=True
-                )
-            )
-        )
+    project_order = get_project_order()
+    response = {
+        "results": [
+            {
+                "source": result["source"],
+                "target": result["target"],
+                "projects": sorted(
+                    result["projects"],
+                    key=lambda x: project_order.get(x["name"], float("inf")),
+                ),
+                "entities": result["entities"],
+            }
+            for result in results
+        ],
+        "has_next": has_next,
     }
+    if has_next:
+        response["cursor"] = encode_concordance_cursor(results[-1])
 
-    for result in data.object_list:
-        result["projects"] = sorted(
-            result["projects"],
-            key=lambda x: project_order.get(x["name"], float("inf")),
-        )
-
-    return JsonResponse(
-        {"results": data.object_list, "has_next": data.has_next()}, safe=False
-    )
+    return JsonResponse(response, safe=False)
 
 
 @login_required(redirect_field_name="", login_url="/403")
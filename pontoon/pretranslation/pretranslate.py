@@ -1,6 +1,8 @@
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from copy import deepcopy
 from enum import Enum
+from itertools import batched
 from re import compile
 from typing import Literal
 
@@ -20,11 +22,16 @@ from moz.l10n.model import (
     Message,
     Pattern,
     PatternMessage,
+    SelectMessage,
 )
+from requests import Session
 
 from pontoon.base.models import Entity, Locale, Resource, TranslationMemoryEntry
+from pontoon.base.placeables import get_placeables
 from pontoon.machinery.utils import (
+    get_google_translate_batch_data,
     get_google_translate_data,
+    get_microsoft_translator_batch_data,
     get_microsoft_translator_data,
 )
 from pontoon.sync.formats import as_string
@@ -32,8 +39,12 @@ from pontoon.sync.formats import as_string
 
 pt_placeholder = compile(r"{ *\$(\d+) *}")
 
+# Maximum number of source strings included in a single translation memory query
+TM_BATCH_SIZE = 1000
+
 
 MTService = Callable[..., str]
+MTBatchService = Callable[..., dict[str, str]]
 
 
 class MTEngine(Enum):
@@ -65,9 +76,71 @@ class MTEngine(Enum):
             case MTEngine.MICROSOFT_TRANSLATOR:
                 return get_microsoft_translator_data
 
+    @property
+    def batch_service(self) -> MTBatchService:
+        match self:
+            case MTEngine.GOOGLE_TRANSLATE:
+                return get_google_translate_batch_data
+            case MTEngine.MICROSOFT_TRANSLATOR:
+                return get_microsoft_translator_batch_data
+
+
+class TranslationMemoryIndex:
+    """
+    The 100% translation memory matches in a locale for a set of source strings,
+    bulk-loaded once to avoid querying the database separately for each of them.
+
+    For each source, the most frequent target is used, as with a database lookup.
+    """
+
+    def __init__(self, locale: Locale, sources: Iterable[str]):
+        self.locale = locale
+        targets: dict[str, list[str]] = defaultdict(list)
+        for batch in batched(sorted(set(sources)), TM_BATCH_SIZE):
+            for source, target in TranslationMemoryEntry.objects.filter(
+                locale=locale, source__in=batch
+            ).values_list("source", "target"):
+                targets[source].append(target)
+        self.best_targets = {
+            source: max(set(tm_q100), key=tm_q100.count)
+            for source, tm_q100 in targets.items()
+        }
+
+    def get(self, source: str) -> str | None:
+        return self.best_targets.get(source, None)
+
+
+class MachineTranslationIndex:
+    """
+    The machine translations in a locale for a set of source strings,
+    fetched in batches to avoid a separate request for each of them.
+
+    The translations are also stored in the per-string machinery service cache.
+    """
+
+    def __init__(
+        self,
+        locale: Locale,
+        sources: Iterable[str],
+        mt_engine: MTEngine = MTEngine.GOOGLE_TRANSLATE,
+        session: Session | None = None,
+    ):
+        self.locale = locale
+        self.translations = mt_engine.batch_service(
+            texts=sorted(set(sources)), locale=locale, session=session
+        )
+
+    def get(self, source: str) -> str | None:
+        return self.translations.get(source, None)
+
 
 def get_pretranslation(
-    entity: Entity, locale: Locale, preserve_placeables: bool = False
+    entity: Entity,
+    locale: Locale,
+    preserve_placeables: bool = False,
+    tm_index: TranslationMemoryIndex | None = None,
+    mt_index: MachineTranslationIndex | None = None,
+    mt_results: dict[str, str] | None = None,
 ) -> tuple[str, Literal["gt", "tm"]]:
     """
     Get pretranslations for the entity-locale pair using internal translation memory and
@@ -76,11 +149,27 @@ def get_pretranslation(
     For entities with multiple variants and/or Fluent attributes,
     sets the most frequent pretranslation author as the author of the entire pretranslation.
 
+    If `tm_index` is set, it is used instead of
+    querying the database for translation memory matches.
+    If `mt_index` is set, its translations are used when available
+    instead of requesting them separately.
+
+    If `mt_results` is set, the machine translations of the entity are stored in it.
+    When retrying with `preserve_placeables`, passing the same dict
+    limits the new requests to the parts of the entity that include placeables.
+
     :returns: A tuple consisting of:
         - a pretranslation of the entity
         - a pretranslation service identifier, either "gt" or "tm"
     """
-    pt = Pretranslation(entity, locale, preserve_placeables)
+    pt = Pretranslation(
+        entity,
+        locale,
+        preserve_placeables,
+        tm_index=tm_index,
+        mt_index=mt_index,
+        mt_results=mt_results,
+    )
     value, properties = pt.walk_entity()
     pt_res = pt.serialize(value, properties)
     pt_service = max(set(pt.services), key=pt.services.count) if pt.services else "tm"
@@ -102,6 +191,9 @@ class Pretranslation:
         *,
         mt_engine: MTEngine | None = MTEngine.GOOGLE_TRANSLATE,
         exclude_entity: bool = False,
+        tm_index: TranslationMemoryIndex | None = None,
+        mt_index: MachineTranslationIndex | None = None,
+        mt_results: dict[str, str] | None = None,
     ):
         """
         :param mt_engine: Machine-translation engine invoked when a leaf has no
@@ -114,6 +206,15 @@ class Pretranslation:
             A leaf that can only be served by the entity's own translation then
             has no TM match, so a composed result is not reconstructed from the
             current entity. Defaults to False.
+        :param tm_index: Preloaded 100% TM matches for the locale, used instead
+            of per-leaf TM queries. Should include all of the `tm_sources()`.
+            Not used if `exclude_entity` is True.
+        :param mt_index: Prefetched machine translations for the locale,
+            used for the `mt_sources()` that it includes.
+            Not used if `preserve_placeables` is True.
+        :param mt_results: Machine translations by source, updated with
+            all machine translations used. Used instead of requests,
+            except for sources with placeables if `preserve_placeables` is True.
         """
         self.entity = entity
         match entity.resource.format:
@@ -137,6 +238,9 @@ class Pretranslation:
             mt_engine if mt_engine is not None and mt_engine.supports(locale) else None
         )
         self.exclude_entity = exclude_entity
+        self.tm_index = tm_index if not exclude_entity else None
+        self.mt_index = mt_index if not preserve_placeables else None
+        self.mt_results = mt_results
 
     def walk_entity(self) -> tuple[Message, dict[str, Message]]:
         """
@@ -175,6 +279,64 @@ class Pretranslation:
 
         return value, properties
 
+    def tm_sources(self) -> Iterator[str]:
+        """
+        The translation memory source strings that may be looked up
+        by `walk_entity()`, for preloading them into a `TranslationMemoryIndex`.
+        """
+        for pattern in self.patterns(all_variants=True):
+            yield self.tm_source(pattern)
+
+    def mt_sources(self) -> Iterator[str]:
+        """
+        The machine translation source strings that would be requested
+        by `walk_entity()`, for prefetching them into a `MachineTranslationIndex`.
+        """
+        if self.mt_engine is None:
+            return
+        for pattern in self.patterns(all_variants=False):
+            tm_source = self.tm_source(pattern)
+            if (
+                tm_source
+                and not tm_source.isspace()
+                and self.tm_match(tm_source) is None
+            ):
+                mt_source = self.mt_source(pattern)
+                if mt_source is not None:
+                    yield mt_source[0]
+
+    def patterns(self, all_variants: bool) -> Iterator[Pattern]:
+        """
+        The patterns of the entity that are translated,
+        including the unused variants of the locale only if `all_variants` is True.
+        """
+        entity = self.entity
+        messages = [message_from_json(entity.value)] if entity.value else []
+        if entity.properties:
+            messages.extend(
+                message_from_json(prop)
+                for key, prop in entity.properties.items()
+                if not key.lower().endswith("accesskey")
+            )
+        for msg in messages:
+            if isinstance(msg, SelectMessage):
+                unused = set() if all_variants else set(self.unused_variants(msg))
+                for keys, pattern in msg.variants.items():
+                    if keys not in unused:
+                        yield pattern
+            else:
+                yield msg.pattern
+
+    def tm_source(self, pattern: Pattern) -> str:
+        if self.format != Format.fluent:
+            return self.source
+        return "".join(
+            el.value if isinstance(el, FTL.TextElement) else serialize_expression(el)
+            for el in fluent_astify_message(
+                PatternMessage(pattern), escape_syntax=False
+            ).elements
+        )
+
     def serialize(self, value: Message, properties: dict[str, Message]) -> str:
         """Serialize translated `(value, properties)` back to a source string.
 
@@ -193,21 +355,12 @@ class Pretranslation:
             plurals = self.locale.cldr_plurals_list()[:-1]
 
             # Plural selectors need special attention
-            plural_selectors = [
-                idx
-                for idx, sel in enumerate(msg.selector_expressions())
-                if sel.function in ("integer", "number")
-            ]
+            plural_selectors = self.plural_selectors(msg)
 
             # Do not translate plural "one" variants if not used in the target locale
-            has_pc_one = "one" in plurals
-            rm_keys = []
+            rm_keys = self.unused_variants(msg)
             for keys, pattern in msg.variants.items():
-                if not has_pc_one and any(
-                    keys[idx] == "one" for idx in plural_selectors
-                ):
-                    rm_keys.append(keys)
-                else:
+                if keys not in rm_keys:
                     pattern[:] = self.pattern(pattern)
             for keys in rm_keys:
                 del msg.variants[keys]
@@ -226,38 +379,45 @@ class Pretranslation:
                         tgt_variants[keys] = pattern
                     msg.variants = tgt_variants
 
-    def pattern(self, pattern: Pattern) -> Pattern:
-        # First try to get a 100% match from Translation Memory
-        tm_source = (
-            "".join(
-                el.value
-                if isinstance(el, FTL.TextElement)
-                else serialize_expression(el)
-                for el in fluent_astify_message(
-                    PatternMessage(pattern), escape_syntax=False
-                ).elements
-            )
-            if self.format == Format.fluent
-            else self.source
-        )
-        if not tm_source or tm_source.isspace():
-            return pattern
+    def plural_selectors(self, msg: SelectMessage) -> list[int]:
+        return [
+            idx
+            for idx, sel in enumerate(msg.selector_expressions())
+            if sel.function in ("integer", "number")
+        ]
+
+    def unused_variants(
+        self, msg: SelectMessage
+    ) -> list[tuple[str | CatchallKey, ...]]:
+        """The plural "one" variants of `msg`, if not used in the target locale."""
+        if "one" in self.locale.cldr_plurals_list()[:-1]:
+            return []
+        plural_selectors = self.plural_selectors(msg)
+        return [
+            keys
+            for keys in msg.variants
+            if any(keys[idx] == "one" for idx in plural_selectors)
+        ]
+
+    def tm_match(self, tm_source: str) -> str | None:
+        """The most frequent 100% translation memory match for `tm_source`."""
+        if self.tm_index is not None:
+            return self.tm_index.get(tm_source)
         tm_entries = TranslationMemoryEntry.objects.filter(
             locale=self.locale, source=tm_source
         )
         if self.exclude_entity:
             tm_entries = tm_entries.exclude(entity=self.entity)
         tm_q100 = list(tm_entries.values_list("target", flat=True))
-        if tm_q100:
-            tm_best = max(set(tm_q100), key=tm_q100.count)
-            self.services.append("tm")
-            if self.format == Format.fluent:
-                te = fluent_parse_entry(f"key = {tm_best}\n")
-                assert isinstance(te.value, PatternMessage)
-                return te.value.pattern
-            else:
-                return [tm_best]
+        return max(set(tm_q100), key=tm_q100.count) if tm_q100 else None
 
+    def mt_source(
+        self, pattern: Pattern
+    ) -> tuple[str, list[Expression | Markup]] | None:
+        """
+        The machine translation source for `pattern`, with its placeholders,
+        or None if it has no text to translate.
+        """
         placeholders: list[Expression | Markup] = []
         gt_source = ""
         has_text = False
@@ -272,15 +432,48 @@ class Pretranslation:
                 idx = len(placeholders)
                 placeholders.append(el)
                 gt_source += "{$" + str(idx) + "}"
-        if not has_text:
+        return (gt_source, placeholders) if has_text else None
+
+    def mt_result(self, gt_source: str) -> str | None:
+        """An available machine translation for `gt_source`, if any."""
+        if self.mt_results is not None and gt_source in self.mt_results:
+            # Placeables only affect the translation of sources that include them
+            if not self.preserve_placeables or not get_placeables(gt_source):
+                return self.mt_results[gt_source]
+        if self.mt_index is not None:
+            return self.mt_index.get(gt_source)
+        return None
+
+    def pattern(self, pattern: Pattern) -> Pattern:
+        # First try to get a 100% match from Translation Memory
+        tm_source = self.tm_source(pattern)
+        if not tm_source or tm_source.isspace():
+            return pattern
+        tm_best = self.tm_match(tm_source)
+        if tm_best is not None:
+            self.services.append("tm")
+            if self.format == Format.fluent:
+                te = fluent_parse_entry(f"key = {tm_best}\n")
+                assert isinstance(te.value, PatternMessage)
+                return te.value.pattern
+            else:
+                return [tm_best]
+
+        mt_source = self.mt_source(pattern)
+        if mt_source is None:
             return pattern
+        gt_source, placeholders = mt_source
 
         if self.mt_engine is not None:
-            mt_translation = self.mt_engine.service(
-                text=gt_source,
-                locale=self.locale,
-                preserve_placeables=self.preserve_placeables,
-            )
+            mt_translation = self.mt_result(gt_source)
+            if mt_translation is None:
+                mt_translation = self.mt_engine.service(
+                    text=gt_source,
+                    locale=self.locale,
+                    preserve_placeables=self.preserve_placeables,
+                )
+            if self.mt_results is not None:
+                self.mt_results[gt_source] = mt_translation
             self.services.append(self.mt_engine.service_name)
             return [
                 el
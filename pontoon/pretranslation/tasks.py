@@ -1,18 +1,23 @@
 import logging
 import operator
 
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from functools import reduce
+from time import sleep
 
-from celery import shared_task
+from celery import group, shared_task
+from requests import Session
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import CharField, Q, Value as V
-from django.db.models.functions import Concat
+from django.db.models import Q
 
 from pontoon.actionlog.models import ActionLog
 from pontoon.base.models import (
     Entity,
+    Locale,
     Project,
     TranslatedResource,
     Translation,
@@ -20,16 +25,83 @@ from pontoon.base.models import (
 from pontoon.base.tasks import PontoonTask
 from pontoon.base.user_utils import get_pretranslation_authors
 from pontoon.checks.libraries import run_checks
-from pontoon.checks.utils import bulk_run_checks
+from pontoon.checks.utils import bulk_run_checks, get_translations_for_checks
 from pontoon.translations.utils import parse_source_string_to_json
 
-from .pretranslate import get_pretranslation
+from .pretranslate import (
+    MachineTranslationIndex,
+    Pretranslation,
+    TranslationMemoryIndex,
+    get_pretranslation,
+)
 
 
 log = logging.getLogger(__name__)
 
+# Longest time (in seconds) that the queued paths of a project are locked for
+QUEUE_LOCK_TIMEOUT = 10
+
+
+def pretranslation_locales(project: Project):
+    return project.locales.filter(
+        project_locale__pretranslation_enabled=True,
+        project_locale__readonly=False,
+    )
+
 
-def pretranslate(project: Project, paths: set[str] | None):
+def pretranslation_candidates(
+    project: Project, locales, entities, pt_authors
+) -> dict[int, list[int]]:
+    """
+    Find the entities to pretranslate in each locale:
+    those with a translated resource in the locale,
+    and without any non-rejected or pretranslated translations.
+
+    Only the primary keys of the entities are loaded,
+    with a single streaming query for each of the lookups.
+
+    :returns: The candidate entity pks, by locale pk.
+    """
+    # All available (locale, resource) pairs, i.e. TranslatedResource objects
+    tr_pairs = set(
+        TranslatedResource.objects.filter(
+            resource__project=project,
+            locale__in=locales,
+        )
+        .values_list("locale_id", "resource_id")
+        .iterator()
+    )
+
+    # All locale-entity pairs with non-rejected or pretranslated translations
+    translated_entities: dict[int, set[int]] = defaultdict(set)
+    for locale_id, entity_id in (
+        Translation.objects.filter(
+            locale__in=locales,
+            entity__in=entities,
+        )
+        .filter(Q(rejected=False) | Q(user__in=pt_authors.values()))
+        .values_list("locale_id", "entity_id")
+        .distinct()
+        .iterator()
+    ):
+        translated_entities[locale_id].add(entity_id)
+
+    locale_pks = [locale.pk for locale in locales]
+    candidates: dict[int, list[int]] = {locale_pk: [] for locale_pk in locale_pks}
+    for entity_id, resource_id in entities.values_list("pk", "resource_id").iterator():
+        for locale_pk in locale_pks:
+            if entity_id in translated_entities[locale_pk]:
+                continue
+            if (locale_pk, resource_id) in tr_pairs:
+                candidates[locale_pk].append(entity_id)
+    return candidates
+
+
+def pretranslate(
+    project: Project,
+    paths: set[str] | None,
+    locale_pks: Iterable[int] | None = None,
+):
     """
     Identifies strings without any translations and any suggestions.
     Engages TheAlgorithm (bug 1552796) to gather pretranslations.
@@ -38,6 +110,8 @@ def pretranslate(project: Project, paths: set[str] | None):
     :arg project: The project to be pretranslated
     :arg paths: Paths of the project resources to be pretranslated,
       or None to pretranslate all resources.
+    :arg locale_pks: Primary keys of the locales to be pretranslated,
+      or None to pretranslate all locales with pretranslation enabled.
 
     :returns: None
     """
@@ -45,10 +119,9 @@ def pretranslate(project: Project, paths: set[str] | None):
         log.info(f"Pretranslation not enabled for project {project.name}")
         return
 
-    locales = project.locales.filter(
-        project_locale__pretranslation_enabled=True,
-        project_locale__readonly=False,
-    )
+    locales = pretranslation_locales(project)
+    if locale_pks is not None:
+        locales = locales.filter(pk__in=locale_pks)
 
     if not locales:
         log.info(
@@ -61,41 +134,18 @@ def pretranslate(project: Project, paths: set[str] | None):
     entities = Entity.objects.filter(resource__project=project, obsolete=False)
     if paths:
         entities = entities.filter(resource__path__in=paths)
-    entities = entities.prefetch_related("resource")
-
-    # Fetch all available locale-resource pairs (TranslatedResource objects)
-    tr_pairs = (
-        TranslatedResource.objects.filter(
-            resource__project=project,
-            locale__in=locales,
-        )
-        .annotate(
-            locale_resource=Concat(
-                "locale_id", V("-"), "resource_id", output_field=CharField()
-            )
-        )
-        .values_list("locale_resource", flat=True)
-        .distinct()
-    )
 
-    # Fetch all locale-entity pairs with non-rejected or pretranslated translations
     pt_authors = get_pretranslation_authors()
-    translated_entities = (
-        Translation.objects.filter(
-            locale__in=locales,
-            entity__in=entities,
-        )
-        .filter(Q(rejected=False) | Q(user__in=pt_authors.values()))
-        .annotate(
-            locale_entity=Concat(
-                "locale_id", V("-"), "entity_id", output_field=CharField()
-            )
-        )
-        .values_list("locale_entity", flat=True)
-        .distinct()
+    candidates = pretranslation_candidates(project, locales, entities, pt_authors)
+    entities_by_pk = entities.prefetch_related("resource").in_bulk(
+        {pk for entity_pks in candidates.values() for pk in entity_pks}
     )
 
-    translated_entities = list(translated_entities)
+    # Translation memory source strings of each entity, for preloading matches
+    entity_tm_sources: dict[int, list[str]] = {}
+
+    # Reuse connections to the machine translation service across requests
+    mt_session = Session()
 
     for locale in locales:
         log.info(f"Fetching pretranslations for locale {locale.code} started")
@@ -107,14 +157,58 @@ def pretranslate(project: Project, paths: set[str] | None):
         tr_filter = []
         index = -1
 
-        for entity in entities:
-            locale_entity = f"{locale.id}-{entity.id}"
-            locale_resource = f"{locale.id}-{entity.resource.id}"
-            if locale_entity in translated_entities or locale_resource not in tr_pairs:
+        locale_entities = [entities_by_pk[pk] for pk in candidates[locale.id]]
+        for entity in locale_entities:
+            if entity.id not in entity_tm_sources:
+                entity_tm_sources[entity.id] = list(
+                    Pretranslation(entity, locale, False).tm_sources()
+                )
+
+        # Load all 100% translation memory matches with a few queries,
+        # rather than separately for each part of each entity.
+        tm_index = TranslationMemoryIndex(
+            locale,
+            (
+                source
+                for entity in locale_entities
+                for source in entity_tm_sources[entity.id]
+            ),
+        )
+
+        # Fetch the machine translations of all strings without a 100% match
+        # in batches, rather than separately for each of them.
+        mt_sources: list[str] = []
+        for entity in locale_entities:
+            try:
+                mt_sources.extend(
+                    Pretranslation(
+                        entity, locale, False, tm_index=tm_index
+                    ).mt_sources()
+                )
+            except ValueError:
+                # Reported when pretranslating the entity
                 continue
+        try:
+            mt_index = MachineTranslationIndex(locale, mt_sources, session=mt_session)
+        except ValueError as e:
+            log.info(
+                f"Pretranslation error: {e}. Requesting machine translations separately."
+            )
+            mt_index = None
+
+        for entity in locale_entities:
+            locale_resource = (locale.id, entity.resource_id)
 
+            # Machine translations of the entity, reused when retrying
+            mt_results: dict[str, str] = {}
             try:
-                pretranslation = get_pretranslation(entity, locale)
+                pretranslation = get_pretranslation(
+                    entity,
+                    locale,
+                    tm_index=tm_index,
+                    mt_index=mt_index,
+                    mt_results=mt_results,
+                )
             except ValueError as e:
                 log.info(f"Pretranslation error: {e}")
                 continue
@@ -129,7 +223,11 @@ def pretranslate(project: Project, paths: set[str] | None):
             if failed_checks:
                 try:
                     pretranslation = get_pretranslation(
-                        entity, locale, preserve_placeables=True
+                        entity,
+                        locale,
+                        preserve_placeables=True,
+                        tm_index=tm_index,
+                        mt_results=mt_results,
                     )
                 except ValueError as e:
                     log.info(f"Pretranslation error: {e}")
@@ -188,7 +286,11 @@ def pretranslate(project: Project, paths: set[str] | None):
 
         # Run checks on all translations
         translation_pks = {translation.pk for translation in translations}
-        bulk_run_checks(Translation.objects.for_checks().filter(pk__in=translation_pks))
+        bulk_run_checks(
+            get_translations_for_checks(
+                Translation.objects.filter(pk__in=translation_pks)
+            )
+        )
 
         # Mark translations as changed
         changed_translations = Translation.objects.filter(
@@ -203,32 +305,181 @@ def pretranslate(project: Project, paths: set[str] | None):
         # `operator.ior` is the '|' Python operator, which turns into a logical OR
         # when used between django ORM query objects.
         tr_query = reduce(operator.ior, tr_filter)
-        translatedresources = TranslatedResource.objects.filter(tr_query).annotate(
-            locale_resource=Concat(
-                "locale_id", V("-"), "resource_id", output_field=CharField()
-            )
-        )
+        translatedresources = TranslatedResource.objects.filter(tr_query)
         translatedresources.calculate_stats()
         for tr in translatedresources:
-            index = tr_dict[tr.locale_resource]
+            index = tr_dict[(tr.locale_id, tr.resource_id)]
             translation = translations[index]
             translation.update_latest_translation()
 
         log.info(f"Fetching pretranslations for locale {locale.code} done")
 
+    mt_session.close()
     log.info(f"Fetching pretranslations for project {project.name} done")
 
 
+def start_locale_subtasks(project: Project, paths: set[str] | None) -> bool:
+    """
+    Pretranslate the project in a separate subtask for each locale,
+    so that the locales may be processed concurrently by multiple workers.
+
+    The project pretranslation lock is released by the last subtask to finish.
+    Their pending count is set after the lock, with the same timeout,
+    so that it does not expire before the lock.
+
+    :returns: True if any subtasks were started.
+    """
+    if not project.pretranslation_enabled:
+        log.info(f"Pretranslation not enabled for project {project.name}")
+        return False
+
+    locale_pks = list(pretranslation_locales(project).values_list("pk", flat=True))
+    if not locale_pks:
+        log.info(
+            f"Pretranslation not enabled for any locale within project {project.name}"
+        )
+        return False
+
+    cache.set(
+        f"pretranslate_{project.pk}_pending",
+        len(locale_pks),
+        timeout=settings.SYNC_TASK_TIMEOUT,
+    )
+    str_locales = "locale" if len(locale_pks) == 1 else "locales"
+    log.info(
+        f"Pretranslating project {project.name} in {len(locale_pks)} {str_locales}"
+    )
+    group(
+        pretranslate_locale_task.si(project.pk, locale_pk, paths)
+        for locale_pk in locale_pks
+    ).apply_async()
+    return True
+
+
+@contextmanager
+def queue_lock(project_pk) -> Iterator[None]:
+    """
+    Hold the lock of the queued paths of a project,
+    so that concurrent updates of the queue are not lost.
+
+    If the lock is not released, it expires after `QUEUE_LOCK_TIMEOUT` seconds.
+    """
+    lock_name = f"pretranslate_{project_pk}_queued_lock"
+    while not cache.add(lock_name, True, timeout=QUEUE_LOCK_TIMEOUT):
+        sleep(0.1)
+    try:
+        yield
+    finally:
+        cache.delete(lock_name)
+
+
+def queue_paths(project_pk, paths: Iterable[str] | None) -> None:
+    """
+    Queue the `paths` of a project (or all of its paths, if None)
+    to be pretranslated once its current pretranslation is done.
+    """
+    queue_key = f"pretranslate_{project_pk}_queued"
+    with queue_lock(project_pk):
+        queued = cache.get(queue_key)
+        if queued is None:
+            queued = {"paths": set(paths) if paths is not None else None}
+        elif queued["paths"] is not None:
+            if paths is None:
+                queued["paths"] = None
+            else:
+                queued["paths"].update(paths)
+        cache.set(queue_key, queued, timeout=None)
+
+
+def pop_queued_paths(project_pk) -> tuple[bool, set[str] | None]:
+    """
+    Remove the queued paths of a project.
+
+    :returns: Whether any paths were queued, and the queued paths
+        (or None, if all paths were queued).
+    """
+    queue_key = f"pretranslate_{project_pk}_queued"
+    with queue_lock(project_pk):
+        queued = cache.get(queue_key)
+        if queued is None:
+            return False, None
+        cache.delete(queue_key)
+    return True, queued["paths"]
+
+
+def release_project_lock(project_pk) -> None:
+    """
+    Release the pretranslation lock of a project,
+    and start pretranslating any paths queued while it was held.
+    """
+    cache.delete(f"pretranslate_{project_pk}")
+    is_queued, paths = pop_queued_paths(project_pk)
+    if is_queued:
+        pretranslate_task.delay(project_pk, paths)
+
+
 @shared_task(base=PontoonTask, name="pretranslate")
-def pretranslate_task(project_pk):
+def pretranslate_task(project_pk, paths=None):
     project = Project.objects.get(pk=project_pk)
     lock_name = f"pretranslate_{project_pk}"
     if not cache.add(lock_name, True, timeout=settings.SYNC_TASK_TIMEOUT):
-        raise RuntimeError(
-            f"Cannot pretranslate {project.slug} because its previous pretranslation is still running."
-        )
+        # Pretranslate the paths once the previous pretranslation is done,
+        # unless it finished in the meantime.
+        queue_paths(project_pk, paths)
+        if not cache.add(lock_name, True, timeout=settings.SYNC_TASK_TIMEOUT):
+            log.info(
+                f"Pretranslation of project {project.name} queued, as its previous pretranslation is still running"
+            )
+            return
+        is_queued, paths = pop_queued_paths(project_pk)
+        if not is_queued:
+            # The queued paths were already picked up when releasing the lock
+            release_project_lock(project_pk)
+            return
+    has_subtasks = False
     try:
-        pretranslate(project, None)
+        if settings.PRETRANSLATION_LOCALE_SUBTASKS:
+            has_subtasks = start_locale_subtasks(project, paths)
+        else:
+            pretranslate(project, paths)
     finally:
-        # release the lock
-        cache.delete(lock_name)
+        # release the lock, unless held by the locale subtasks
+        if not has_subtasks:
+            release_project_lock(project_pk)
+
+
+@shared_task(base=PontoonTask, name="pretranslate_locale")
+def pretranslate_locale_task(project_pk, locale_pk, paths=None):
+    project = Project.objects.get(pk=project_pk)
+    locale = Locale.objects.get(pk=locale_pk)
+    lock_name = f"pretranslate_{project_pk}_{locale_pk}"
+    pending_key = f"pretranslate_{project_pk}_pending"
+    try:
+        if not cache.add(lock_name, True, timeout=settings.SYNC_TASK_TIMEOUT):
+            raise RuntimeError(
+                f"Cannot pretranslate {project.slug} for {locale.code} because its previous pretranslation is still running."
+            )
+        try:
+            pretranslate(project, paths, [locale_pk])
+        finally:
+            cache.delete(lock_name)
+    finally:
+        try:
+            pending = cache.decr(pending_key)
+        except ValueError:
+            # The counter has expired along with the project lock,
+            # so other subtasks may still be running.
+            log.warning(
+                f"Pretranslating project {project.name}: lost track of remaining locales"
+            )
+        else:
+            if pending > 0:
+                str_locales = "locale" if pending == 1 else "locales"
+                log.info(
+                    f"Pretranslating project {project.name}: {pending} {str_locales} remaining"
+                )
+            else:
+                # This is the last subtask, release the project lock
+                cache.delete(pending_key)
+                log.info(f"Pretranslating project {project.name} in all locales done")
+                release_project_lock(project_pk)
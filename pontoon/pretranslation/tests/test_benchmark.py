@@ -0,0 +1,95 @@
+"""
+Benchmark of pretranslation candidate selection for a large synthetic project.
+
+Skipped unless `PRETRANSLATION_BENCHMARK_ENTITIES` sets the number of entities
+to create. Timings are logged at INFO level, e.g.
+
+    PRETRANSLATION_BENCHMARK_ENTITIES=50000 pytest --log-cli-level=INFO pontoon/pretranslation/tests/test_benchmark.py
+"""
+
+import logging
+import os
+
+from time import perf_counter
+
+import pytest
+
+from pontoon.base.models import Entity, Translation
+from pontoon.base.user_utils import get_pretranslation_authors
+from pontoon.pretranslation.tasks import pretranslation_candidates
+from pontoon.test.factories import (
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+    SectionFactory,
+    TranslatedResourceFactory,
+)
+
+
+log = logging.getLogger(__name__)
+
+ENTITY_COUNT = int(os.environ.get("PRETRANSLATION_BENCHMARK_ENTITIES", 0))
+RESOURCE_COUNT = 10
+
+pytestmark = pytest.mark.skipif(
+    not ENTITY_COUNT, reason="PRETRANSLATION_BENCHMARK_ENTITIES is not set"
+)
+
+
+@pytest.mark.django_db
+def test_benchmark_pretranslation_candidates():
+    locales = [LocaleFactory.create(code=f"x{i}-Test") for i in range(3)]
+    project = ProjectFactory.create(name="test-benchmark", locales=locales)
+    resources = [
+        ResourceFactory.create(project=project, path=f"res{i}.po", format="gettext")
+        for i in range(RESOURCE_COUNT)
+    ]
+    for res in resources:
+        SectionFactory.create(resource=res, key=[])
+        # The last locale has no translated resources for the last resource
+        for locale in locales if res != resources[-1] else locales[:-1]:
+            TranslatedResourceFactory.create(resource=res, locale=locale)
+    entities = Entity.objects.bulk_create(
+        Entity(
+            resource=resources[i % RESOURCE_COUNT],
+            section=resources[i % RESOURCE_COUNT].sections.first(),
+            key=[f"Message {i}"],
+            string=f"Message {i}",
+            value=[f"Message {i}"],
+            order=i,
+        )
+        for i in range(ENTITY_COUNT)
+    )
+    # Every other entity is translated in the first locale
+    Translation.objects.bulk_create(
+        Translation(
+            entity=entity,
+            locale=locales[0],
+            string=f"Translation {i}",
+            value=[f"Translation {i}"],
+            active=True,
+            approved=True,
+        )
+        for i, entity in enumerate(entities)
+        if i % 2 == 0
+    )
+    pt_authors = get_pretranslation_authors()
+
+    # Test
+    start = perf_counter()
+    candidates = pretranslation_candidates(
+        project,
+        project.locales.all(),
+        Entity.objects.filter(resource__project=project, obsolete=False),
+        pt_authors,
+    )
+    elapsed = perf_counter() - start
+    log.info(
+        f"pretranslation_candidates: {ENTITY_COUNT} entities in {len(locales)} locales in {elapsed:.3f}s"
+    )
+
+    assert len(candidates[locales[0].pk]) == ENTITY_COUNT // 2
+    assert len(candidates[locales[1].pk]) == ENTITY_COUNT
+    assert (
+        len(candidates[locales[2].pk]) == ENTITY_COUNT - ENTITY_COUNT // RESOURCE_COUNT
+    )
@@ -5,7 +5,12 @@ import pytest
 
 from fluent.syntax import FluentParser, FluentSerializer
 
-from pontoon.pretranslation.pretranslate import get_pretranslation
+from pontoon.pretranslation.pretranslate import (
+    MachineTranslationIndex,
+    Pretranslation,
+    TranslationMemoryIndex,
+    get_pretranslation,
+)
 from pontoon.test.factories import (
     EntityFactory,
     ResourceFactory,
@@ -847,3 +852,144 @@ def test_get_pretranslations_fluent_sibling_selectors(
     google_translate_locale.cldr_plurals = "1,5"
     response = get_pretranslation(fluent_entity, google_translate_locale)
     assert response == (pretranslated_string, "tm")
+
+
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_data")
+@pytest.mark.django_db
+def test_get_pretranslations_fluent_tm_index(
+    gt_mock,
+    entity_a,
+    fluent_resource,
+    google_translate_locale,
+    django_assert_num_queries,
+):
+    # Preloaded TM matches are used without querying the database
+    gt_mock.return_value = "GT: Open Options and select Search."
+
+    for target in ["TM: Preferences", "TM: Preferences", "TM: Prefs"]:
+        TranslationMemoryFactory.create(
+            entity=entity_a,
+            source="Open Preferences and select Search.",
+            target=target,
+            locale=google_translate_locale,
+        )
+
+    fluent_string = dedent(
+        """
+        complex-entry =
+            Open { PLATFORM() ->
+                [mac] Preferences
+                *[other] Options
+            } and select Search.
+            .title = Preferences
+            .accesskey = P
+    """
+    )
+    fluent_entity = EntityFactory(resource=fluent_resource, string=fluent_string)
+
+    pt = Pretranslation(fluent_entity, google_translate_locale, False)
+    assert sorted(pt.tm_sources()) == [
+        "Open Options and select Search.",
+        "Open Preferences and select Search.",
+        "Preferences",
+    ]
+
+    tm_index = TranslationMemoryIndex(google_translate_locale, pt.tm_sources())
+    assert tm_index.get("Open Preferences and select Search.") == "TM: Preferences"
+    assert tm_index.get("Preferences") is None
+
+    expected = get_pretranslation(fluent_entity, google_translate_locale)
+    with django_assert_num_queries(0):
+        response = get_pretranslation(
+            fluent_entity, google_translate_locale, tm_index=tm_index
+        )
+    assert response == expected
+
+
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_batch_data")
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_data")
+@pytest.mark.django_db
+def test_get_pretranslations_fluent_mt_index(
+    gt_mock, gt_batch_mock, fluent_resource, google_translate_locale
+):
+    # Prefetched machine translations are used without separate requests
+    gt_batch_mock.side_effect = lambda texts, **kwargs: {
+        text: f"GT: {text}" for text in texts
+    }
+    TranslationMemoryFactory.create(
+        source="Title", target="TM: Title", locale=google_translate_locale
+    )
+
+    fluent_string = dedent(
+        """
+        hello = Hello { $name }!
+            .title = Title
+            .label = Label
+    """
+    )
+    fluent_entity = EntityFactory(resource=fluent_resource, string=fluent_string)
+
+    pt = Pretranslation(fluent_entity, google_translate_locale, False)
+    assert sorted(pt.mt_sources()) == ["Hello {$0}!", "Label"]
+
+    mt_index = MachineTranslationIndex(google_translate_locale, pt.mt_sources())
+    gt_batch_mock.assert_called_once()
+
+    response = get_pretranslation(
+        fluent_entity, google_translate_locale, mt_index=mt_index
+    )
+    assert response == (
+        dedent(
+            """\
+            hello = GT: Hello { $name }!
+                .title = TM: Title
+                .label = GT: Label
+            """
+        ),
+        "gt",
+    )
+    gt_mock.assert_not_called()
+
+
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_data")
+@pytest.mark.django_db
+def test_get_pretranslations_fluent_retry_placeables(
+    gt_mock, fluent_resource, google_translate_locale
+):
+    # The retry only requests the parts with placeables
+    gt_mock.side_effect = lambda text, preserve_placeables, **kwargs: (
+        f"{'PP' if preserve_placeables else 'GT'}: {text}"
+    )
+
+    fluent_string = dedent(
+        """
+        hello = Hello { $name }!
+            .title = Title
+    """
+    )
+    fluent_entity = EntityFactory(resource=fluent_resource, string=fluent_string)
+
+    mt_results = {}
+    get_pretranslation(fluent_entity, google_translate_locale, mt_results=mt_results)
+    assert mt_results == {"Hello {$0}!": "GT: Hello {$0}!", "Title": "GT: Title"}
+    assert gt_mock.call_count == 2
+
+    gt_mock.reset_mock()
+    response = get_pretranslation(
+        fluent_entity,
+        google_translate_locale,
+        preserve_placeables=True,
+        mt_results=mt_results,
+    )
+    assert response == (
+        dedent(
+            """\
+            hello = PP: Hello { $name }!
+                .title = GT: Title
+            """
+        ),
+        "gt",
+    )
+    gt_mock.assert_called_once_with(
+        text="Hello {$0}!", locale=google_translate_locale, preserve_placeables=True
+    )
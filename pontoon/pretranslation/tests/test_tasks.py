@@ -2,8 +2,16 @@ from unittest.mock import patch
 
 import pytest
 
+from django.core.cache import cache
+
 from pontoon.base.models import ChangedEntityLocale, Translation
-from pontoon.pretranslation.tasks import pretranslate_task
+from pontoon.pretranslation.tasks import (
+    pop_queued_paths,
+    pretranslate_locale_task,
+    pretranslate_task,
+    queue_paths,
+    release_project_lock,
+)
 from pontoon.test.factories import (
     EntityFactory,
     ProjectLocaleFactory,
@@ -110,3 +118,153 @@ def test_which_strings_to_pretranslate(
     assert len(non_rejected.translation_set.filter(string="pretranslation")) == 0
     assert len(rejected_by_human.translation_set.filter(string="pretranslation")) == 1
     assert len(rejected_by_machine.translation_set.filter(string="pretranslation")) == 0
+
+
+@patch("pontoon.pretranslation.tasks.get_pretranslation")
+@pytest.mark.django_db
+def test_pretranslate_locale_subtasks(
+    gt_mock, settings, project_a, locale_a, locale_b, gt_user
+):
+    settings.PRETRANSLATION_LOCALE_SUBTASKS = True
+    project_a.pretranslation_enabled = True
+    project_a.save()
+
+    resource = ResourceFactory.create(
+        project=project_a, path="resource.po", format="gettext"
+    )
+    EntityFactory.create(resource=resource, string="abaa")
+    for locale in [locale_a, locale_b]:
+        TranslatedResourceFactory.create(resource=resource, locale=locale)
+        ProjectLocaleFactory.create(
+            project=project_a, locale=locale, pretranslation_enabled=True
+        )
+
+    gt_mock.return_value = ("pretranslation", "gt")
+
+    pretranslate_task(project_a.pk)
+    project_a.refresh_from_db()
+
+    translations = Translation.objects.filter(user=gt_user)
+    assert {t.locale for t in translations} == {locale_a, locale_b}
+    assert project_a.pretranslated_strings == 2
+
+    # The last subtask releases the project lock
+    assert cache.get(f"pretranslate_{project_a.pk}") is None
+    assert cache.get(f"pretranslate_{project_a.pk}_pending") is None
+
+
+@patch("pontoon.pretranslation.tasks.get_pretranslation")
+@pytest.mark.django_db
+def test_pretranslate_queued_while_locked(gt_mock, project_a, locale_a, gt_user):
+    project_a.pretranslation_enabled = True
+    project_a.save()
+
+    resources = [
+        ResourceFactory.create(project=project_a, path=path, format="gettext")
+        for path in ["resource_x.po", "resource_y.po", "resource_z.po"]
+    ]
+    for resource in resources:
+        EntityFactory.create(resource=resource, string="abaa")
+        TranslatedResourceFactory.create(resource=resource, locale=locale_a)
+    ProjectLocaleFactory.create(
+        project=project_a, locale=locale_a, pretranslation_enabled=True
+    )
+
+    gt_mock.return_value = ("pretranslation", "gt")
+
+    # While a previous pretranslation is running, the paths are queued
+    lock_name = f"pretranslate_{project_a.pk}"
+    cache.add(lock_name, True)
+    pretranslate_task(project_a.pk, {"resource_x.po"})
+    pretranslate_task(project_a.pk, {"resource_y.po"})
+    assert not Translation.objects.filter(user=gt_user).exists()
+
+    # The queued paths are pretranslated when the previous pretranslation is done
+    release_project_lock(project_a.pk)
+    translations = Translation.objects.filter(user=gt_user)
+    assert {t.entity.resource.path for t in translations} == {
+        "resource_x.po",
+        "resource_y.po",
+    }
+    assert cache.get(lock_name) is None
+    assert cache.get(f"pretranslate_{project_a.pk}_queued") is None
+
+
+def test_queue_paths_concurrently():
+    """
+    Paths queued while the queue is locked are not lost.
+    """
+    lock_name = "pretranslate_1_queued_lock"
+    queue_paths(1, {"resource_x.po"})
+    cache.add(lock_name, True)
+
+    def concurrent_update(_):
+        # The lock holder queues another path, and releases the lock
+        queued = cache.get("pretranslate_1_queued")
+        queued["paths"].add("resource_y.po")
+        cache.set("pretranslate_1_queued", queued)
+        cache.delete(lock_name)
+
+    with patch("pontoon.pretranslation.tasks.sleep", side_effect=concurrent_update):
+        queue_paths(1, {"resource_z.po"})
+
+    assert pop_queued_paths(1) == (
+        True,
+        {"resource_x.po", "resource_y.po", "resource_z.po"},
+    )
+    assert pop_queued_paths(1) == (False, None)
+    assert cache.get(lock_name) is None
+
+
+@patch("pontoon.pretranslation.tasks.pretranslate")
+@pytest.mark.django_db
+def test_pretranslate_locale_expired_pending(pretranslate_mock, project_a, locale_a):
+    """
+    If the pending count has expired, other locale subtasks may still be running,
+    so the project lock is not released.
+    """
+    lock_name = f"pretranslate_{project_a.pk}"
+    cache.add(lock_name, True)
+    queue_paths(project_a.pk, {"resource_x.po"})
+
+    with patch("pontoon.pretranslation.tasks.pretranslate_task") as task_mock:
+        pretranslate_locale_task(project_a.pk, locale_a.pk)
+
+    pretranslate_mock.assert_called_once()
+    task_mock.delay.assert_not_called()
+    assert cache.get(lock_name) is True
+    assert pop_queued_paths(project_a.pk) == (True, {"resource_x.po"})
+    cache.delete(lock_name)
+
+
+@patch("pontoon.pretranslation.tasks.get_pretranslation")
+@patch("pontoon.pretranslation.tasks.MachineTranslationIndex")
+@pytest.mark.django_db
+def test_pretranslate_mt_index_error(
+    mt_index_mock, gt_mock, project_a, locale_a, locale_b, gt_user
+):
+    """
+    If fetching machine translations in batches fails,
+    they are requested separately for each string.
+    """
+    project_a.pretranslation_enabled = True
+    project_a.save()
+
+    resource = ResourceFactory.create(
+        project=project_a, path="resource.po", format="gettext"
+    )
+    EntityFactory.create(resource=resource, string="abaa")
+    for locale in [locale_a, locale_b]:
+        TranslatedResourceFactory.create(resource=resource, locale=locale)
+        ProjectLocaleFactory.create(
+            project=project_a, locale=locale, pretranslation_enabled=True
+        )
+
+    mt_index_mock.side_effect = ValueError("Google Translate error")
+    gt_mock.return_value = ("pretranslation", "gt")
+
+    pretranslate_task(project_a.pk)
+
+    translations = Translation.objects.filter(user=gt_user)
+    assert {t.locale for t in translations} == {locale_a, locale_b}
+    assert all(call.kwargs["mt_index"] is None for call in gt_mock.call_args_list)
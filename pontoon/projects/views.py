@@ -9,7 +9,7 @@ from django.shortcuts import get_object_or_404, render
 from django.views.generic.detail import DetailView
 
 from pontoon.base.aggregated_stats import get_top_instances
-from pontoon.base.models import Locale, Project, TranslatedResource, Translation
+from pontoon.base.models import Locale, Project, ProjectLocale, Translation
 from pontoon.base.models.locale import LocaleQuerySet
 from pontoon.base.models.project import ProjectQuerySet
 from pontoon.base.services import get_project_or_redirect
@@ -41,7 +41,7 @@ def projects(request):
         "projects/projects.html",
         {
             "projects": projects,
-            "all_projects_stats": TranslatedResource.objects.string_stats(request.user),
+            "all_projects_stats": ProjectLocale.objects.string_stats(request.user),
             "project_stats": project_stats,
             "top_instances": get_top_instances(projects, project_stats),
         },
@@ -57,20 +57,18 @@ def project(request, slug):
         return project
 
     project_locales = project.project_locale
-    project_tr = TranslatedResource.objects.filter(resource__project=project)
 
     # Only include filtered teams if provided
     teams = request.GET.get("teams", "").split(",")
     filtered_locales = Locale.objects.filter(code__in=teams)
     if filtered_locales.exists():
         project_locales = project_locales.filter(locale__in=filtered_locales)
-        project_tr = project_tr.filter(locale__in=filtered_locales)
 
     return render(
         request,
         "projects/project.html",
         {
-            "project_stats": project_tr.string_stats(count_system_projects=True),
+            "project_stats": project_locales.string_stats(count_system_projects=True),
             "count": project_locales.count(),
             "project": project,
             "tags_count": (
@@ -1065,7 +1065,7 @@ ALLOWED_ATTRIBUTES = {
     "acronym": ["title"],
 }
 
-# Multiple sync tasks for the same project cannot run concurrently to prevent
+# Multiple sync tasks for the same repository cannot run concurrently to prevent
 # potential DB and VCS inconsistencies. We store the information about the
 # running task in cache and clear it after the task completes. In case of an
 # error, we might never clear the cache, so we use SYNC_TASK_TIMEOUT as the
@@ -1079,6 +1079,38 @@ except ValueError:
 
 SYNC_LOG_RETENTION = 90  # days
 
+# Maximum number of project syncs run concurrently by the sync_projects
+# command. Projects that share a repository are always synced one at a time.
+# With a value of 0, all other projects are synced concurrently.
+# Otherwise, each sync queues the next one in its sequence when done, so if a
+# worker is killed during a sync, the rest of its sequence is only synced by
+# the next sync_projects run.
+try:
+    SYNC_MAX_CONCURRENT = int(os.environ.get("SYNC_MAX_CONCURRENT", ""))
+except ValueError:
+    SYNC_MAX_CONCURRENT = 0
+
+# Number of worker processes used by sync to write translated files to the
+# target repository. With a value of 0 or 1, files are written one at a time.
+try:
+    SYNC_FILE_WORKERS = int(os.environ.get("SYNC_FILE_WORKERS", ""))
+except ValueError:
+    SYNC_FILE_WORKERS = 0
+
+# Check out the source and target repositories of a project at the same time,
+# rather than one after the other.
+SYNC_PARALLEL_CHECKOUTS = os.environ.get("SYNC_PARALLEL_CHECKOUTS", "False") != "False"
+
+# Sync only compares the changed lines of target files with the database.
+# Every SYNC_FULL_COMPARE_INTERVAL successful syncs of a project, all
+# translations of its changed target files are compared instead, fixing any
+# differences left by earlier syncs. With a value of 0, this is only done
+# by forced syncs.
+try:
+    SYNC_FULL_COMPARE_INTERVAL = int(os.environ.get("SYNC_FULL_COMPARE_INTERVAL", ""))
+except ValueError:
+    SYNC_FULL_COMPARE_INTERVAL = 10
+
 MANUAL_SYNC = os.environ.get("MANUAL_SYNC", "True") != "False"
 
 # Celery
@@ -1331,3 +1363,8 @@ SPECTACULAR_SETTINGS = {
 
 # Maximum length of input text allowed for pretranslation
 PRETRANSLATION_API_MAX_CHARS = int(os.environ.get("PRETRANSLATION_API_MAX_CHARS", 2048))
+
+# Pretranslate each locale of a project in a separate Celery task
+PRETRANSLATION_LOCALE_SUBTASKS = (
+    os.environ.get("PRETRANSLATION_LOCALE_SUBTASKS", "False") != "False"
+)
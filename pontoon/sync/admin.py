@@ -5,7 +5,16 @@ from pontoon.sync.models import Sync
 
 class SyncAdmin(admin.ModelAdmin):
     search_fields = ("project__slug",)
-    list_display = ("project", "status", "start_time", "end_time", "error")
+    list_display = (
+        "project",
+        "status",
+        "queued_time",
+        "start_time",
+        "end_time",
+        "wait_time",
+        "run_time",
+        "error",
+    )
 
 
 admin.site.register(Sync, SyncAdmin)
@@ -3,6 +3,7 @@ import logging
 from collections import defaultdict
 from datetime import datetime
 
+from django.conf import settings
 from django.db.models import Count
 from django.utils import timezone
 
@@ -17,11 +18,12 @@ from pontoon.base.models import (
 )
 from pontoon.base.user_utils import human_users
 from pontoon.messaging.notifications import send_notification
-from pontoon.pretranslation.tasks import pretranslate
+from pontoon.pretranslation.tasks import pretranslate, pretranslate_task
 from pontoon.sync.core.checkout import checkout_repos
 from pontoon.sync.core.entities import sync_resources_from_repo
 from pontoon.sync.core.paths import find_paths
-from pontoon.sync.core.stats import update_stats
+from pontoon.sync.core.reference import ReferenceCache
+from pontoon.sync.core.stats import update_scoped_stats
 from pontoon.sync.core.translations_from_repo import sync_translations_from_repo
 from pontoon.sync.core.translations_to_repo import sync_translations_to_repo
 
@@ -35,8 +37,14 @@ def sync_project(
     pull: bool = True,
     commit: bool = True,
     force: bool = False,
+    full_compare: bool = False,
 ) -> tuple[bool, bool]:
-    """`(db_changed, repo_changed)`"""
+    """
+    `(db_changed, repo_changed)`
+
+    With `full_compare`, all translations of changed target files
+    are compared with the database, rather than only their changed lines.
+    """
     # Mark "now" at the start of sync to avoid messing with
     # translations submitted during sync.
     now = timezone.now()
@@ -75,15 +83,23 @@ def sync_project(
         locale_map = {lc.code: lc for lc in project.locales.order_by("code")}
     paths.locales = list(locale_map.keys())
 
+    ref_cache = ReferenceCache()
     added_entities_count, changed_paths, removed_paths = sync_resources_from_repo(
-        project, locale_map, checkouts.source, paths, now
+        project, locale_map, checkouts.source, paths, now, ref_cache
     )
 
     db_changes = ChangedEntityLocale.objects.filter(
         entity__resource__project=project, when__lte=now
     ).select_related("entity__resource", "locale")
-    del_trans_count, updated_trans_count = sync_translations_from_repo(
-        project, locale_map, checkouts, paths, db_changes, now
+    del_trans_count, updated_trans_count, updated_tr_keys = sync_translations_from_repo(
+        project,
+        locale_map,
+        checkouts,
+        paths,
+        db_changes,
+        now,
+        changed_paths,
+        full_compare,
     )
     db_changed = bool(
         added_entities_count
@@ -104,6 +120,7 @@ def sync_project(
         changed_paths,
         removed_paths,
         now,
+        ref_cache,
     )
     if commit:
         db_changes.delete()
@@ -112,12 +129,21 @@ def sync_project(
     if checkouts.target != checkouts.source:
         checkouts.target.repo.last_synced_revision = checkouts.target.commit
     if db_changed:
-        update_stats(project)
+        update_scoped_stats(
+            project,
+            project.resources.filter(path__in=changed_paths).values_list(
+                "pk", flat=True
+            ),
+            updated_tr_keys,
+        )
     log.info(f"{log_prefix} Sync done")
 
     if project.pretranslation_enabled and changed_paths:
         # Pretranslate changed and added resources for all locales
-        pretranslate(project, changed_paths)
+        if settings.PRETRANSLATION_LOCALE_SUBTASKS:
+            pretranslate_task.delay(project.pk, changed_paths)
+        else:
+            pretranslate(project, changed_paths)
 
     return db_changed, repo_changed
 
@@ -1,9 +1,13 @@
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
 from os import walk
-from os.path import join, normpath, relpath
+from os.path import isfile, join, normpath, relpath
+from time import perf_counter
 from typing import NamedTuple
 
+from django.conf import settings
+
 from pontoon.base.models import Project, Repository
 from pontoon.sync.repositories import get_repo
 
@@ -24,6 +28,9 @@ class Checkout:
     """Relative paths from the checkout base"""
     renamed: list[tuple[str, str]]
     """Relative paths (old, new) from the checkout base"""
+    sparse: bool
+    sparse_patterns: list[str] | None
+    """For sparse checkouts, the patterns of the checked out files"""
 
     def __init__(
         self,
@@ -39,12 +46,23 @@ class Checkout:
         self.url = db_repo.url
         self.path = normpath(db_repo.checkout_path)
         self.prev_commit = db_repo.last_synced_revision
+        self.sparse = db_repo.sparse_checkout and db_repo.type == Repository.Type.GIT
+        if db_repo.sparse_checkout and not self.sparse:
+            log.warning(f"[{slug}] Sparse checkouts are only supported for git repos")
 
         versioncontrol = get_repo(db_repo.type)
+        self._vcs = versioncontrol
+        self._slug = slug
+        self._diff_base: str | None = None
         if pull:
-            versioncontrol.update(self.url, self.path, db_repo.branch, shallow)
+            versioncontrol.update(
+                self.url, self.path, db_repo.branch, shallow, self.sparse
+            )
         else:
             log.info(f"[{slug}] Skipping pull")
+        self.sparse_patterns = (
+            versioncontrol.sparse_patterns(self.path) if self.sparse else None
+        )
         self.commit = versioncontrol.revision(self.path)
         str_updated = (
             f"at {self.commit}"
@@ -64,18 +82,62 @@ class Checkout:
             self.renamed = []
         elif delta is not None and not force:
             self.changed, self.removed, self.renamed = delta
+            self._diff_base = self.prev_commit
+            if self.sparse:
+                # Ignore changes to files that are not checked out
+                self.changed = [
+                    path for path in self.changed if isfile(join(self.path, path))
+                ]
+                self.renamed = [
+                    (old, new)
+                    for old, new in self.renamed
+                    if isfile(join(self.path, new))
+                ]
         else:
             # Initially and on error & when forced, consider all files changed
-            log.warning(f"[{slug}] Considering all files as changed")
-            self.changed = []
-            for root, dirnames, filenames in walk(self.path):
-                dirnames[:] = (dn for dn in dirnames if not dn.startswith("."))
-                rel_root = relpath(root, self.path) if root != self.path else ""
-                self.changed.extend(
-                    join(rel_root, fn) for fn in filenames if not fn.startswith(".")
-                )
+            self._set_all_changed()
             self.removed = delta[1] if delta else []
-            self.renamed = []
+
+    def _set_all_changed(self) -> None:
+        log.warning(f"[{self._slug}] Considering all files as changed")
+        self.changed = []
+        for root, dirnames, filenames in walk(self.path):
+            dirnames[:] = (dn for dn in dirnames if not dn.startswith("."))
+            rel_root = relpath(root, self.path) if root != self.path else ""
+            self.changed.extend(
+                join(rel_root, fn) for fn in filenames if not fn.startswith(".")
+            )
+        self.renamed = []
+        self._diff_base = None
+
+    def set_sparse_patterns(self, patterns: list[str]) -> None:
+        """
+        For a sparse checkout, check out only the files matching `patterns`.
+
+        If the patterns are changed,
+        all files are considered as changed.
+        """
+        if not self.sparse or patterns == self.sparse_patterns:
+            return
+        self._vcs.set_sparse_patterns(self.path, patterns)
+        self.sparse_patterns = patterns
+        log.info(f"[{self._slug}] Set sparse checkout patterns: {patterns}")
+        self._set_all_changed()
+
+    def changed_lines(self) -> dict[str, list[tuple[int, int]]] | None:
+        """
+        For each changed file, the `(start, end)` line ranges that include changes,
+        or `None` if all files are considered as changed.
+        """
+        if self._diff_base is None:
+            return None
+        if self.sparse:
+            # Avoid fetching the contents of files that are not checked out
+            files = self.changed + [new for _, new in self.renamed]
+            if not files:
+                return {}
+            return self._vcs.changed_lines(self.path, self._diff_base, files)
+        return self._vcs.changed_lines(self.path, self._diff_base)
 
 
 class Checkouts(NamedTuple):
@@ -95,23 +157,45 @@ def checkout_repos(
     update its local checkout (unless `pull` is false),
     and provide a `Checkout` representing their current state.
     """
-    source: Checkout | None = None
-    target: Checkout | None = None
+    source_repo: Repository | None = None
+    target_repo: Repository | None = None
     for repo in project.repositories.all():
         if repo.source_repo:
-            if source:
+            if source_repo:
                 raise Exception("Multiple source repositories")
-            source = Checkout(
-                project.slug, repo, force=force, pull=pull, shallow=shallow
-            )
-            log.debug(f"[{project.slug}] source root: {source.path}")
-        elif target:
+            source_repo = repo
+        elif target_repo:
             raise Exception("Multiple target repositories")
         else:
-            target = Checkout(
-                project.slug, repo, force=force, pull=pull, shallow=shallow
-            )
-            log.debug(f"[{project.slug}] target root: {target.path}")
-    if source is None and target is None:
+            target_repo = repo
+    if source_repo is None and target_repo is None:
         raise Exception("No repository found")
+
+    def checkout(repo: Repository, kind: str) -> Checkout:
+        start = perf_counter()
+        co = Checkout(project.slug, repo, force=force, pull=pull, shallow=shallow)
+        log.info(
+            f"[{project.slug}] Checked out {kind} repo in {perf_counter() - start:.2f}s"
+        )
+        log.debug(f"[{project.slug}] {kind} root: {co.path}")
+        return co
+
+    source: Checkout | None = None
+    target: Checkout | None = None
+    if (
+        source_repo is not None
+        and target_repo is not None
+        and settings.SYNC_PARALLEL_CHECKOUTS
+    ):
+        # Fetch both repositories at the same time
+        with ThreadPoolExecutor(2) as executor:
+            source_future = executor.submit(checkout, source_repo, "source")
+            target_future = executor.submit(checkout, target_repo, "target")
+            source = source_future.result()
+            target = target_future.result()
+    else:
+        if source_repo is not None:
+            source = checkout(source_repo, "source")
+        if target_repo is not None:
+            target = checkout(target_repo, "target")
     return Checkouts(source or target, target or source)
@@ -18,11 +18,13 @@ from pontoon.base.models import (
     Entity,
     Locale,
     Project,
+    ProjectLocale,
     Resource,
     Section,
     TranslatedResource,
 )
 from pontoon.sync.core.checkout import Checkout
+from pontoon.sync.core.reference import ReferenceCache
 from pontoon.sync.formats import as_entity
 
 
@@ -35,6 +37,7 @@ def sync_resources_from_repo(
     checkout: Checkout,
     paths: L10nConfigPaths | L10nDiscoverPaths,
     now: datetime,
+    ref_cache: ReferenceCache | None = None,
 ) -> tuple[int, set[str], set[str]]:
     """(added_entities_count, changed_source_paths, removed_source_paths"""
     if not checkout.changed and not checkout.removed and not checkout.renamed:
@@ -59,6 +62,8 @@ def sync_resources_from_repo(
                 try:
                     Resource.Format(res.format.name)
                     updates[db_path] = res
+                    if ref_cache is not None:
+                        ref_cache.add(path, res)
                 except ValueError:
                     log.error(
                         f"[{project.slug}:{db_path}] Skipping resource with unsupported format: {res.format.name}"
@@ -414,6 +419,9 @@ def update_translated_resources(
             del_tr_q |= Q(resource_id=resource_id, locale_id=locale_id)
         _, del_dict = TranslatedResource.objects.filter(del_tr_q).delete()
         del_count = del_dict.get("base.translatedresource", 0)
+        ProjectLocale.objects.filter(
+            project=project, locale__in={locale_id for _, locale_id in prev_tr_keys}
+        ).calculate_stats()
         str_tr = "translated resource" if del_count == 1 else "translated resources"
         log.info(f"[{project.slug}] Removed {del_count} {str_tr}")
 
@@ -1,11 +1,15 @@
 import logging
+import re
+import tomllib
 
-from os.path import join, relpath
+from os.path import dirname, isfile, join, normpath, relpath, sep
+from typing import Any
 
 from moz.l10n.paths import L10nConfigPaths, L10nDiscoverPaths, get_android_locale
+from moz.l10n.paths.config import path_regex
 
 from pontoon.base.models import Project
-from pontoon.sync.core.checkout import Checkouts
+from pontoon.sync.core.checkout import Checkout, Checkouts
 
 
 log = logging.getLogger(__name__)
@@ -22,15 +26,25 @@ def find_paths(
 
     force_paths = [join(src_root, path) for path in checkouts.source.removed]
     if project.configuration_file:
+        cfg_path = join(src_root, project.configuration_file)
+        sparse = checkouts.source.sparse or checkouts.target.sparse
+        if sparse:
+            ref_patterns = checkout_config_references(checkouts.source, cfg_path)
         paths = L10nConfigPaths(
-            join(src_root, project.configuration_file),
+            cfg_path,
             locale_map={"android_locale": get_android_locale},
             force_paths=force_paths,
         )
         if checkouts.target != checkouts.source:
             paths.base = checkouts.target.path
+        if sparse:
+            set_config_sparse_patterns(checkouts, paths, ref_patterns)
         name = f"cfg={project.configuration_file}"
     else:
+        # Discovery needs a complete checkout at first
+        for co in {checkouts.source, checkouts.target}:
+            if co.sparse and not co.sparse_patterns:
+                co.set_sparse_patterns(["/*"])
         paths = L10nDiscoverPaths(
             project.checkout_path,
             ref_root=src_root,
@@ -42,6 +56,7 @@ def find_paths(
                 "Base localization directory not found. At least one localized file (which may be empty) is required for automatic path discovery."
             )
         name = "auto"
+        set_discovered_sparse_patterns(checkouts, paths.ref_root, paths.base)
 
     rel_root = relpath(paths.ref_root, src_root)
     rel_base = relpath(paths.base, src_root)
@@ -50,6 +65,99 @@ def find_paths(
     return paths
 
 
+def checkout_config_references(source: Checkout, cfg_path: str) -> list[str]:
+    """
+    Check out the configuration files and their reference files,
+    and return the sparse checkout patterns for them.
+
+    Wildcard references are only found by moz.l10n if they're already present,
+    so those are matched by their `[[paths]]` pattern rather than by file.
+    """
+    wildcards: list[str] = []
+
+    def load_config(path: str) -> dict[str, Any]:
+        if not isfile(path):
+            # Check out each configuration file as it's needed
+            add_sparse_patterns(source, [sparse_pattern(source, path)])
+        with open(path, mode="rb") as file:
+            cfg = tomllib.load(file)
+        base = normpath(join(dirname(path), cfg.get("basepath", ".")))
+        for entry in cfg.get("paths", []):
+            ref_path = normpath(join(base, entry["reference"]))
+            if "*" in ref_path:
+                wildcards.append(ref_path)
+        return cfg
+
+    cfg_paths = L10nConfigPaths(cfg_path, cfg_load=load_config)
+    wildcard_res = [path_regex(ref.replace(sep, "/")) for ref in wildcards]
+    ref_paths = [
+        path
+        for path in cfg_paths.ref_paths
+        if not any(ref_re.fullmatch(path.replace(sep, "/")) for ref_re in wildcard_res)
+    ]
+    patterns = list(
+        dict.fromkeys(
+            sparse_pattern(source, path)
+            for path in [*cfg_paths.config_paths(), *ref_paths, *wildcards]
+        )
+    )
+    add_sparse_patterns(source, patterns)
+    return patterns
+
+
+def set_config_sparse_patterns(
+    checkouts: Checkouts, paths: L10nConfigPaths, ref_patterns: list[str]
+) -> None:
+    """
+    Limit sparse checkouts to the configuration and reference files
+    and the target files of `paths`.
+    """
+    source, target = checkouts
+    target_patterns = list(
+        dict.fromkeys(sparse_pattern(target, path) for _, path in paths.all())
+    )
+    if target == source:
+        source.set_sparse_patterns(list(dict.fromkeys(ref_patterns + target_patterns)))
+    else:
+        source.set_sparse_patterns(ref_patterns)
+        target.set_sparse_patterns(target_patterns)
+
+
+def add_sparse_patterns(checkout: Checkout, patterns: list[str]) -> None:
+    """Extend a sparse checkout with `patterns`, keeping its current files."""
+    current = checkout.sparse_patterns or []
+    checkout.set_sparse_patterns(list(dict.fromkeys(current + patterns)))
+
+
+def set_discovered_sparse_patterns(
+    checkouts: Checkouts, ref_root: str, base: str
+) -> None:
+    """Limit sparse checkouts to the discovered reference and target directories."""
+    source, target = checkouts
+    ref_pattern = sparse_pattern(source, ref_root, directory=True)
+    target_pattern = sparse_pattern(target, base, directory=True)
+    if target == source:
+        source.set_sparse_patterns(list(dict.fromkeys([ref_pattern, target_pattern])))
+    else:
+        source.set_sparse_patterns([ref_pattern])
+        target.set_sparse_patterns([target_pattern])
+
+
+path_var_re = re.compile(r"{[^{}]*}")
+
+
+def sparse_pattern(checkout: Checkout, path: str, *, directory: bool = False) -> str:
+    """
+    A sparse checkout pattern for `path`,
+    with any `{variables}` in it matching any path segment part.
+    """
+    rel_path = relpath(path, checkout.path).replace(sep, "/")
+    if rel_path == ".":
+        return "/*"
+    pattern = "/" + path_var_re.sub("*", rel_path)
+    return pattern + "/" if directory else pattern
+
+
 class UploadPaths:
     """
     moz.l10n.paths -like interface for sync'ing content from a single file.
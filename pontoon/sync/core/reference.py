@@ -0,0 +1,81 @@
+from copy import copy
+from os.path import normpath
+
+from moz.l10n.formats import Format
+from moz.l10n.model import Entry, Message, Metadata, Resource, Section, SelectMessage
+from moz.l10n.resource import parse_resource
+
+
+class ReferenceCache:
+    """
+    Parsed reference (source) resources, shared across locales during a sync.
+
+    Each reference file is parsed at most once,
+    and callers get a clone of it that they are free to modify.
+    """
+
+    def __init__(self) -> None:
+        # normpath(ref_path) -> parsed resource
+        self._parsed: dict[str, Resource[Message]] = {}
+
+    def add(self, ref_path: str, res: Resource[Message]) -> None:
+        """
+        Reuse a resource already parsed with other options, e.g. during entity sync.
+
+        Gettext and XLIFF parses depend on their parse options,
+        so those are not reused.
+        """
+        if res.format not in (Format.gettext, Format.xliff):
+            self._parsed[normpath(ref_path)] = res
+
+    def get(self, ref_path: str) -> Resource[Message]:
+        """A modifiable clone of the parsed reference resource."""
+        key = normpath(ref_path)
+        res = self._parsed.get(key, None)
+        if res is None:
+            res = parse_resource(ref_path)
+            self._parsed[key] = res
+        return clone_resource(res)
+
+
+def clone_resource(res: Resource[Message]) -> Resource[Message]:
+    """
+    Copy the parts of `res` that `set_translations()` modifies in place.
+
+    Messages, patterns and comments are shared with the original,
+    as they are only ever replaced rather than modified.
+    """
+    return Resource(
+        res.format,
+        [clone_section(section) for section in res.sections],
+        res.comment,
+        list(res.meta),
+    )
+
+
+def clone_section(section: Section[Message]) -> Section[Message]:
+    return Section(
+        section.id,
+        [
+            (
+                Entry(
+                    entry.id,
+                    (
+                        copy(entry.value)
+                        if isinstance(entry.value, SelectMessage)
+                        else entry.value
+                    ),
+                    dict(entry.properties),
+                    entry.comment,
+                    list(entry.meta),
+                    entry.linepos,
+                )
+                if isinstance(entry, Entry)
+                else entry
+            )
+            for entry in section.entries
+        ],
+        section.comment,
+        [Metadata(m.key, m.value) for m in section.meta],
+        section.linepos,
+    )
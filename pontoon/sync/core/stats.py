@@ -1,17 +1,91 @@
 import logging
 
+from collections.abc import Iterable
 from textwrap import dedent
 
 from django.db import connection
+from django.db.models import Count
 
-from pontoon.base.models import Project
+from pontoon.base.models import Project, Resource, TranslatedResource
 
 
 log = logging.getLogger(__name__)
 
+# Whether an approved, pretranslated or fuzzy translation has errors or warnings.
+# Semi-joins avoid multiplying translation rows by their failed checks.
+FAILED_CHECKS_SQL = """
+    SELECT
+        (trans.approved OR trans.pretranslated OR trans.fuzzy) AND EXISTS (
+            SELECT 1 FROM "checks_error" err WHERE err.translation_id = trans.id
+        ) AS "errors",
+        (trans.approved OR trans.pretranslated OR trans.fuzzy) AND EXISTS (
+            SELECT 1 FROM "checks_warning" warn WHERE warn.translation_id = trans.id
+        ) AS "warnings"
+"""
+
+# String counts of the translated resources with the given resource & locale ids.
+SCOPED_COUNTS_SQL = f"""
+    SELECT
+        sel.locale_id AS "locale_id",
+        sel.resource_id AS "resource_id",
+        COUNT(trans.id) FILTER (WHERE trans.approved AND NOT failed.errors AND NOT failed.warnings) AS "approved",
+        COUNT(trans.id) FILTER (WHERE trans.pretranslated AND NOT failed.errors AND NOT failed.warnings) AS "pretranslated",
+        COUNT(trans.id) FILTER (WHERE failed.errors) AS "errors",
+        COUNT(trans.id) FILTER (WHERE failed.warnings) AS "warnings",
+        COUNT(trans.id) FILTER (WHERE NOT trans.approved AND NOT trans.pretranslated AND NOT trans.rejected AND NOT trans.fuzzy) AS "unreviewed"
+    FROM unnest(%s::int[], %s::int[]) AS sel(resource_id, locale_id)
+    LEFT OUTER JOIN "base_entity" ent ON (ent.resource_id = sel.resource_id AND NOT ent.obsolete)
+    LEFT OUTER JOIN "base_translation" trans ON (trans.entity_id = ent.id AND trans.locale_id = sel.locale_id)
+    CROSS JOIN LATERAL ({FAILED_CHECKS_SQL}) AS failed
+    GROUP BY sel.locale_id, sel.resource_id
+"""
+
+# Sums of the string counts of the project locales of the given project & locale ids,
+# summed from their translated resources. All locales are included if the locale ids are NULL.
+PROJECT_LOCALE_COUNTS_SQL = """
+    SELECT
+        pl.id AS "id",
+        COALESCE(SUM(tr.total_strings), 0) AS "total",
+        COALESCE(SUM(tr.approved_strings), 0) AS "approved",
+        COALESCE(SUM(tr.pretranslated_strings), 0) AS "pretranslated",
+        COALESCE(SUM(tr.strings_with_errors), 0) AS "errors",
+        COALESCE(SUM(tr.strings_with_warnings), 0) AS "warnings",
+        COALESCE(SUM(tr.unreviewed_strings), 0) AS "unreviewed"
+    FROM "base_projectlocale" pl
+    LEFT OUTER JOIN "base_resource" res ON (res.project_id = pl.project_id)
+    LEFT OUTER JOIN "base_translatedresource" tr ON (
+        tr.resource_id = res.id AND tr.locale_id = pl.locale_id
+    )
+    WHERE pl.project_id = %s AND (%s::int[] IS NULL OR pl.locale_id = ANY(%s))
+    GROUP BY pl.id
+"""
+
+# Whether the stored project locale string counts differ from `agg`.
+PROJECT_LOCALE_DRIFT_SQL = """
+    (
+        pl.total_strings,
+        pl.approved_strings,
+        pl.pretranslated_strings,
+        pl.strings_with_errors,
+        pl.strings_with_warnings,
+        pl.unreviewed_strings
+    ) IS DISTINCT FROM (
+        agg.total,
+        agg.approved,
+        agg.pretranslated,
+        agg.errors,
+        agg.warnings,
+        agg.unreviewed
+    )
+"""
+
 
 def update_stats(project: Project) -> None:
-    """Uses raw SQL queries for performance."""
+    """
+    Update the stats of all resources and translated resources of the project.
+
+    Uses raw SQL queries for performance.
+    """
 
     with connection.cursor() as cursor:
         # Resources, counted from entities
@@ -49,7 +123,7 @@ def update_stats(project: Project) -> None:
         # Other translated resource string counts, counted directly from translations
         cursor.execute(
             dedent(
-                """
+                f"""
                 UPDATE base_translatedresource tr
                 SET
                     approved_strings = agg.approved,
@@ -61,16 +135,15 @@ def update_stats(project: Project) -> None:
                     SELECT
                         trans.locale_id AS "locale_id",
                         ent.resource_id AS "resource_id",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE trans.approved AND err.id IS NULL AND warn.id IS NULL) AS "approved",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE trans.pretranslated AND err.id IS NULL AND warn.id IS NULL) AS "pretranslated",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE (trans.approved OR trans.pretranslated OR trans.fuzzy) AND err.id IS NOT NULL) AS "errors",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE (trans.approved OR trans.pretranslated OR trans.fuzzy) AND warn.id IS NOT NULL) AS "warnings",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE NOT trans.approved AND NOT trans.pretranslated AND NOT trans.rejected AND NOT trans.fuzzy) AS "unreviewed"
+                        COUNT(trans.id) FILTER (WHERE trans.approved AND NOT failed.errors AND NOT failed.warnings) AS "approved",
+                        COUNT(trans.id) FILTER (WHERE trans.pretranslated AND NOT failed.errors AND NOT failed.warnings) AS "pretranslated",
+                        COUNT(trans.id) FILTER (WHERE failed.errors) AS "errors",
+                        COUNT(trans.id) FILTER (WHERE failed.warnings) AS "warnings",
+                        COUNT(trans.id) FILTER (WHERE NOT trans.approved AND NOT trans.pretranslated AND NOT trans.rejected AND NOT trans.fuzzy) AS "unreviewed"
                     FROM "base_translation" trans
-                    LEFT OUTER JOIN "checks_error" err ON (trans.id = err.translation_id)
-                    LEFT OUTER JOIN "checks_warning" warn ON (trans.id = warn.translation_id)
                     LEFT OUTER JOIN "base_entity" ent ON (trans.entity_id = ent.id)
                     LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
+                    CROSS JOIN LATERAL ({FAILED_CHECKS_SQL}) AS failed
                     WHERE NOT ent.obsolete AND res.project_id = %s
                     GROUP BY trans.locale_id, ent.resource_id
                 ) AS agg
@@ -85,3 +158,240 @@ def update_stats(project: Project) -> None:
         "1 translated resource" if tr_count == 1 else f"{tr_count} translated resources"
     )
     log.info(f"[{project.slug}] Updated stats for {tr_str}")
+    update_project_locale_stats(project)
+
+
+def update_scoped_stats(
+    project: Project,
+    resource_ids: Iterable[int],
+    translated_resources: Iterable[tuple[int, int]],
+    *,
+    include_outdated: bool = True,
+    update_project_locales: bool = True,
+) -> None:
+    """
+    Update the stats of only the resources with `resource_ids`
+    and their translated resources,
+    the `(resource.id, locale.id)` translated resources,
+    and if `include_outdated` is set,
+    any translated resources with an outdated total string count,
+    such as ones added during the sync.
+
+    If `update_project_locales` is set, the stats of the affected
+    project locales are then summed up from their translated resources.
+
+    Uses raw SQL queries for performance.
+    """
+    resource_ids = sorted(set(resource_ids))
+    tr_keys = set(translated_resources)
+
+    with connection.cursor() as cursor:
+        if resource_ids:
+            # Resources, counted from entities
+            cursor.execute(
+                dedent(
+                    """
+                    UPDATE base_resource res
+                    SET total_strings = (
+                        SELECT COUNT(*)
+                        FROM "base_entity" ent
+                        WHERE ent.resource_id = res.id AND NOT ent.obsolete
+                    )
+                    WHERE res.project_id = %s AND res.id = ANY(%s)
+                    """
+                ),
+                [project.id, resource_ids],
+            )
+
+        # Translated resources, copied from resources
+        cursor.execute(
+            dedent(
+                """
+                UPDATE "base_translatedresource" tr
+                SET total_strings = res.total_strings
+                FROM "base_resource" res
+                WHERE tr.resource_id = res.id AND res.project_id = %s
+                    AND (res.id = ANY(%s) OR (%s AND tr.total_strings != res.total_strings))
+                RETURNING tr.resource_id, tr.locale_id
+                """
+            ),
+            [project.id, resource_ids, include_outdated],
+        )
+        tr_keys.update(cursor.fetchall())
+
+        if tr_keys:
+            # Other translated resource string counts, counted directly from translations
+            res_ids, locale_ids = zip(*sorted(tr_keys))
+            cursor.execute(
+                dedent(
+                    f"""
+                    UPDATE base_translatedresource tr
+                    SET
+                        approved_strings = agg.approved,
+                        pretranslated_strings = agg.pretranslated,
+                        strings_with_errors = agg.errors,
+                        strings_with_warnings = agg.warnings,
+                        unreviewed_strings = agg.unreviewed
+                    FROM ({SCOPED_COUNTS_SQL}) AS agg
+                    WHERE agg.locale_id = tr.locale_id AND agg.resource_id = tr.resource_id
+                        AND (
+                            tr.approved_strings,
+                            tr.pretranslated_strings,
+                            tr.strings_with_errors,
+                            tr.strings_with_warnings,
+                            tr.unreviewed_strings
+                        ) IS DISTINCT FROM (
+                            agg.approved,
+                            agg.pretranslated,
+                            agg.errors,
+                            agg.warnings,
+                            agg.unreviewed
+                        )
+                    """
+                ),
+                [list(res_ids), list(locale_ids)],
+            )
+            tr_count = cursor.rowcount
+        else:
+            tr_count = 0
+
+    tr_str = (
+        "1 translated resource" if tr_count == 1 else f"{tr_count} translated resources"
+    )
+    log.info(f"[{project.slug}] Updated stats for {tr_str}")
+    if tr_keys and update_project_locales:
+        update_project_locale_stats(project, {locale_id for _, locale_id in tr_keys})
+
+
+def update_project_locale_stats(
+    project: Project, locale_ids: Iterable[int] | None = None
+) -> None:
+    """
+    Update the stored stats of the project locales with `locale_ids`,
+    or all of the project's locales if `locale_ids` is None,
+    by summing up the stats of their translated resources.
+
+    Only project locales with changed stats are written.
+    """
+    if locale_ids is not None:
+        locale_ids = sorted(set(locale_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            dedent(
+                f"""
+                UPDATE base_projectlocale pl
+                SET
+                    total_strings = agg.total,
+                    approved_strings = agg.approved,
+                    pretranslated_strings = agg.pretranslated,
+                    strings_with_errors = agg.errors,
+                    strings_with_warnings = agg.warnings,
+                    unreviewed_strings = agg.unreviewed
+                FROM ({PROJECT_LOCALE_COUNTS_SQL}) AS agg
+                WHERE pl.id = agg.id AND {PROJECT_LOCALE_DRIFT_SQL}
+                """
+            ),
+            [project.id, locale_ids, locale_ids],
+        )
+        pl_count = cursor.rowcount
+    if pl_count:
+        str_pl = "1 project locale" if pl_count == 1 else f"{pl_count} project locales"
+        log.info(f"[{project.slug}] Updated stats for {str_pl}")
+
+
+def count_project_locale_stats_drift(project: Project) -> int:
+    """
+    The number of the project's locales with stored stats
+    that do not match the stats of their translated resources.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            dedent(
+                f"""
+                SELECT COUNT(*)
+                FROM "base_projectlocale" pl
+                INNER JOIN ({PROJECT_LOCALE_COUNTS_SQL}) AS agg ON (pl.id = agg.id)
+                WHERE {PROJECT_LOCALE_DRIFT_SQL}
+                """
+            ),
+            [project.id, None, None],
+        )
+        return cursor.fetchone()[0]
+
+
+def resource_chunks(project: Project, chunk_size: int) -> list[list[int]]:
+    """
+    The ids of the project's resources,
+    in chunks with at most `chunk_size` translated resources each,
+    unless a single resource has more than that.
+
+    If `chunk_size` is not positive, all resources are in a single chunk.
+    """
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    chunk_tr_count = 0
+    for resource_id, tr_count in (
+        Resource.objects.filter(project=project)
+        .annotate(tr_count=Count("translatedresources"))
+        .order_by("id")
+        .values_list("id", "tr_count")
+    ):
+        if chunk and chunk_size > 0 and chunk_tr_count + tr_count > chunk_size:
+            chunks.append(chunk)
+            chunk = []
+            chunk_tr_count = 0
+        chunk.append(resource_id)
+        chunk_tr_count += tr_count
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def count_stats_drift(project: Project, resource_ids: list[int]) -> int:
+    """
+    The number of translated resources of the resources with `resource_ids`
+    with stats that do not match their current entities and translations.
+    """
+    tr_keys = sorted(
+        TranslatedResource.objects.filter(
+            resource__project=project, resource_id__in=resource_ids
+        ).values_list("resource_id", "locale_id")
+    )
+    if not tr_keys:
+        return 0
+    res_ids, locale_ids = zip(*tr_keys)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            dedent(
+                f"""
+                SELECT COUNT(*)
+                FROM "base_translatedresource" tr
+                INNER JOIN ({SCOPED_COUNTS_SQL}) AS agg ON (
+                    agg.locale_id = tr.locale_id AND agg.resource_id = tr.resource_id
+                )
+                LEFT OUTER JOIN (
+                    SELECT ent.resource_id AS "resource_id", COUNT(*) AS "total"
+                    FROM "base_entity" ent
+                    WHERE NOT ent.obsolete AND ent.resource_id = ANY(%s)
+                    GROUP BY ent.resource_id
+                ) AS res ON (res.resource_id = tr.resource_id)
+                WHERE (
+                    tr.total_strings,
+                    tr.approved_strings,
+                    tr.pretranslated_strings,
+                    tr.strings_with_errors,
+                    tr.strings_with_warnings,
+                    tr.unreviewed_strings
+                ) IS DISTINCT FROM (
+                    COALESCE(res.total, 0),
+                    agg.approved,
+                    agg.pretranslated,
+                    agg.errors,
+                    agg.warnings,
+                    agg.unreviewed
+                )
+                """
+            ),
+            [list(res_ids), list(locale_ids), list(resource_ids)],
+        )
+        return cursor.fetchone()[0]
@@ -1,19 +1,27 @@
 import logging
 
 from collections import defaultdict
-from collections.abc import Iterable, Sized
+from collections.abc import Iterable, Iterator, Sized
 from datetime import datetime
+from itertools import batched
 from os.path import join, relpath, splitext
+from textwrap import dedent
 
 from fluent.syntax import FluentParser
 from moz.l10n.formats import l10n_extensions
 from moz.l10n.message import message_to_json
-from moz.l10n.model import Id as L10nId
+from moz.l10n.model import (
+    Entry,
+    Id as L10nId,
+    LinePos,
+    Message,
+    Resource as MozL10nResource,
+)
 from moz.l10n.paths import L10nConfigPaths, L10nDiscoverPaths, parse_android_locale
 from moz.l10n.resource import parse_resource
 
 from django.core.paginator import Paginator
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
@@ -23,6 +31,7 @@ from pontoon.base.models import (
     Entity,
     Locale,
     Project,
+    ProjectLocale,
     Resource,
     TranslatedResource,
     Translation,
@@ -31,8 +40,7 @@ from pontoon.base.models import (
     UserProfile,
 )
 from pontoon.base.user_utils import get_system_user
-from pontoon.checks import DB_FORMATS
-from pontoon.checks.utils import bulk_run_checks
+from pontoon.checks.utils import bulk_run_checks, get_translations_for_checks
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import UploadPaths
 from pontoon.sync.formats import RepoTranslation, as_repo_translations
@@ -40,6 +48,9 @@ from pontoon.sync.formats import RepoTranslation, as_repo_translations
 
 log = logging.getLogger(__name__)
 
+# Maximum number of keys included in a single bulk translation query
+BULK_CHUNK_SIZE = 5000
+
 Updates = dict[tuple[int, int], RepoTranslation | None]
 """ (entity.id, locale.id) -> RepoTranslation """
 
@@ -51,8 +62,19 @@ def sync_translations_from_repo(
     paths: L10nConfigPaths | L10nDiscoverPaths,
     db_changes: QuerySet[ChangedEntityLocale, ChangedEntityLocale],
     now: datetime,
-) -> tuple[int, int]:
-    """(removed_resource_count, updated_translation_count)"""
+    changed_source_paths: set[str] | None = None,
+    full_compare: bool = False,
+) -> tuple[int, int, set[tuple[int, int]]]:
+    """
+    `(removed_resource_count, updated_translation_count, updated_translated_resources)`,
+    with the last as a set of `(resource.id, locale.id)` tuples.
+
+    `changed_source_paths` are the paths of the resources
+    with entities added or changed during this sync.
+
+    Unless `full_compare` is set, only the changed lines of target files
+    are compared with the database.
+    """
     co = checkouts.target
     source_paths: set[str] = set(paths.ref_paths) if checkouts.source == co else set()
     del_count = (
@@ -74,23 +96,46 @@ def sync_translations_from_repo(
         n = len(changed_target_paths)
         str_files = "file" if n == 1 else "files"
         log.info(f"[{project.slug}] Reading changes from {n} target {str_files}")
+    changed_lines = None if full_compare else co.changed_lines()
     updates = find_db_updates(
-        project, locale_map, changed_target_paths, paths, db_changes
+        project,
+        locale_map,
+        changed_target_paths,
+        paths,
+        db_changes,
+        None
+        if changed_lines is None
+        else {join(co.path, path): ranges for path, ranges in changed_lines.items()},
+        changed_source_paths,
     )
     update_count = 0 if updates is None else len(updates)
-    if updates:
-        write_db_updates(project, updates, None, now)
-    return del_count, update_count
+    tr_keys = write_db_updates(project, updates, None, now) if updates else set()
+    return del_count, update_count, tr_keys
 
 
 def write_db_updates(
     project: Project, updates: Updates, user: User | None, now: datetime
-) -> None:
+) -> set[tuple[int, int]]:
+    """
+    Returns the `(resource.id, locale.id)` keys
+    of the translated resources with updates.
+    """
+    entity_resources: dict[int, int] = dict(
+        Entity.objects.filter(pk__in={entity_id for entity_id, _ in updates})
+        .values_list("pk", "resource_id")
+        .iterator()
+    )
+    tr_keys = {
+        (entity_resources[entity_id], locale_id)
+        for entity_id, locale_id in updates
+        if entity_id in entity_resources
+    }
     updated_translations, new_translations = update_db_translations(
         project, updates, user, now
     )
     add_failed_checks(new_translations)
     add_translation_memory_entries(project, new_translations + updated_translations)
+    return tr_keys
 
 
 def delete_removed_resources(
@@ -101,6 +146,7 @@ def delete_removed_resources(
 ) -> int:
     rm_t = Q()
     rm_tr = Q()
+    rm_locale_codes: set[str] = set()
     count = 0
     removed_target_paths = (
         path
@@ -118,6 +164,7 @@ def delete_removed_resources(
                     db_path = db_path[:-1]
                 rm_t |= Q(entity__resource__path=db_path, locale__code=locale_code)
                 rm_tr |= Q(resource__path=db_path, locale__code=locale_code)
+                rm_locale_codes.add(locale_code)
                 count += 1
     if rm_t and rm_tr:
         str_del_resources = "deleted resource" if count == 1 else "deleted resources"
@@ -129,6 +176,9 @@ def delete_removed_resources(
             TranslatedResource.objects.filter(resource__project=project).filter(
                 rm_tr
             ).delete()
+            ProjectLocale.objects.filter(
+                project=project, locale__code__in=rm_locale_codes
+            ).calculate_stats()
     return count
 
 
@@ -138,6 +188,8 @@ def find_db_updates(
     changed_target_paths: Iterable[str],
     paths: L10nConfigPaths | L10nDiscoverPaths | UploadPaths,
     db_changes: Iterable[ChangedEntityLocale],
+    changed_lines: dict[str, list[tuple[int, int]]] | None = None,
+    changed_source_paths: set[str] | None = None,
 ) -> Updates | None:
     """
     `(entity.id, locale.id) -> RepoTranslation`
@@ -146,11 +198,19 @@ def find_db_updates(
     - Exact matches with previous approved or pretranslated translations
     - Entity/Locale combos for which Pontoon has changes since the last sync
     - Translations for which no matching entity is found
+
+    If `changed_lines` includes the changed line ranges of a target path,
+    only its entries overlapping those ranges are compared with the database,
+    along with any database translations missing from the file.
+    This is not done for resources in `changed_source_paths`,
+    as their added or changed entities may have unchanged translations.
     """
     log.debug(f"[{project.slug}] Scanning for translation updates...")
     resource_paths: set[str] = set()
     # db_path -> {locale.id}
     translated_resources: dict[str, set[int]] = defaultdict(set)
+    # (db_path, locale.id) -> ([changed tx.key], [all tx.key]), for resources with a diff
+    diff_resources: dict[tuple[str, int], tuple[list[L10nId], list[L10nId]]] = {}
     # (db_path, tx.key, locale.id) -> RepoTranslation|None
     translations: dict[tuple[str, L10nId, int], RepoTranslation | None] = {}
     for target_path in changed_target_paths:
@@ -170,10 +230,29 @@ def find_db_updates(
                     if not project.configuration_file and db_path.endswith(".pot"):
                         db_path = db_path[:-1]
                     resource_paths.add(db_path)
-                    translated_resources[db_path].add(locale.pk)
+                    repo_translations = list(as_repo_translations(l10n_res))
+                    diff_keys = (
+                        changed_entry_keys(l10n_res, changed_lines[target_path])
+                        if changed_lines
+                        and target_path in changed_lines
+                        and not (
+                            changed_source_paths and db_path in changed_source_paths
+                        )
+                        else None
+                    )
+                    if diff_keys is None:
+                        translated_resources[db_path].add(locale.pk)
+                    else:
+                        all_keys = [rt.key for rt in repo_translations]
+                        repo_translations = [
+                            rt for rt in repo_translations if rt.key in diff_keys
+                        ]
+                        diff_resources[(db_path, locale.pk)] = (
+                            [rt.key for rt in repo_translations],
+                            all_keys,
+                        )
                     translations.update(
-                        ((db_path, rt.key, locale.pk), rt)
-                        for rt in as_repo_translations(l10n_res)
+                        ((db_path, rt.key, locale.pk), rt) for rt in repo_translations
                     )
                 except Exception as error:
                     scope = f"[{project.slug}:{db_path}, {locale.code}]"
@@ -184,7 +263,7 @@ def find_db_updates(
             log.debug(
                 f"[{project.slug}:{relpath(target_path, paths.base)}] Not an L10n target path"
             )
-    if not translations:
+    if not translations and not diff_resources:
         return None
 
     resources: dict[str, Resource] = {
@@ -195,12 +274,19 @@ def find_db_updates(
     }
 
     # Exclude translations for which DB & repo already match
-    # TODO: Should be able to use repo diff to identify changed entities and refactor this.
     trans_q = Q()
     for db_path, locale_ids in translated_resources.items():
         res = resources.get(db_path, None)
         if res is not None:
             trans_q |= Q(entity__resource=res, locale_id__in=locale_ids)
+    for (db_path, locale_id), (diff_keys, all_keys) in diff_resources.items():
+        res = resources.get(db_path, None)
+        if res is not None:
+            # Changed entries, and translations removed from the repo
+            trans_q |= Q(entity__resource=res, locale_id=locale_id) & (
+                Q(entity__key__in=[list(key) for key in diff_keys])
+                | ~Q(entity__key__in=[list(key) for key in all_keys])
+            )
     if trans_q:
         log.debug(f"[{project.slug}] Filtering matches from translations...")
         trans_query = (
@@ -277,6 +363,36 @@ def find_db_updates(
     return updates
 
 
+def changed_entry_keys(
+    res: MozL10nResource[Message], line_ranges: list[tuple[int, int]]
+) -> set[L10nId] | None:
+    """
+    The keys of the entries in `res` that overlap any of the `(start, end)` line ranges.
+
+    Returns `None` if some entry or section lacks the required line positions.
+    """
+    keys: set[L10nId] = set()
+    for section in res.sections:
+        section_changed = False
+        if section.id:
+            if section.linepos is None:
+                return None
+            section_changed = lines_overlap(section.linepos, line_ranges)
+        for entry in section.entries:
+            if isinstance(entry, Entry):
+                if entry.linepos is None:
+                    return None
+                if section_changed or lines_overlap(entry.linepos, line_ranges):
+                    keys.add(section.id + entry.id)
+    return keys
+
+
+def lines_overlap(linepos: LinePos, line_ranges: list[tuple[int, int]]) -> bool:
+    return any(
+        start < linepos.end and linepos.start < end for start, end in line_ranges
+    )
+
+
 def translations_equal(
     project: Project, db_path: str, format: str, a: object, b: object
 ) -> bool:
@@ -307,32 +423,25 @@ def update_db_translations(
     log.debug(f"{scope} Syncing translations from repo...")
 
     log_user = user or get_system_user(UserProfile.SystemUserRole.SYNC)
-    translations_to_reject = Q()
+    # (entity_id, locale_id, id of translation to keep or None)
+    translations_to_reject: list[tuple[int, int, int | None]] = []
     actions: list[ActionLog] = []
 
     # Approve matching suggestions
-    matching_suggestions_q = Q()
+    matching_suggestions: list[tuple[int, int, str]] = []
     repo_rm_count = 0
     for (entity_id, locale_id), rt in repo_translations.items():
         if rt is None:
             # The translation has been removed from the repo
-            translations_to_reject |= Q(entity_id=entity_id, locale_id=locale_id)
+            translations_to_reject.append((entity_id, locale_id, None))
             repo_rm_count += 1
         else:
-            matching_suggestions_q |= Q(
-                entity_id=entity_id, locale_id=locale_id, string=rt.string
-            )
+            matching_suggestions.append((entity_id, locale_id, rt.string))
     # (entity_id, locale_id) => translation
-    suggestions: dict[tuple[int, int], Translation] = (
-        {
-            (tx.entity_id, tx.locale_id): tx
-            for tx in Translation.objects.filter(matching_suggestions_q)
-            .filter(approved=False, pretranslated=False)
-            .iterator()
-        }
-        if matching_suggestions_q
-        else {}
-    )
+    suggestions: dict[tuple[int, int], Translation] = {
+        (tx.entity_id, tx.locale_id): tx
+        for tx in find_matching_suggestions(matching_suggestions)
+    }
     update_fields: set[str] = set()
     approve_count = 0
     for tx in suggestions.values():
@@ -372,7 +481,7 @@ def update_db_translations(
                 )
             )
             approve_count += 1
-        translations_to_reject |= Q(entity=tx.entity, locale=tx.locale) & ~Q(id=tx.id)
+        translations_to_reject.append((tx.entity_id, tx.locale_id, tx.id))
         update_fields.update(tx.get_dirty_fields())
     for entity_id, locale_id in suggestions:
         try:
@@ -414,37 +523,34 @@ def update_db_translations(
                         translation=tx,
                     )
                 )
-                translations_to_reject |= Q(entity_id=entity_id, locale_id=locale_id)
+                translations_to_reject.append((entity_id, locale_id, None))
 
     if translations_to_reject:
-        rejected = Translation.objects.filter(rejected=False).filter(
-            translations_to_reject
-        )
-        actions.extend(
-            ActionLog(
-                action_type=ActionLog.ActionType.TRANSLATION_REJECTED,
-                created_at=now,
-                performed_by=log_user,
-                translation=tx,
-                is_implicit_action=True,
+        reject_count = 0
+        for rejected_ids in batched(
+            find_translations_to_reject(translations_to_reject), BULK_CHUNK_SIZE
+        ):
+            actions.extend(
+                ActionLog(
+                    action_type=ActionLog.ActionType.TRANSLATION_REJECTED,
+                    created_at=now,
+                    performed_by=log_user,
+                    translation_id=tx_id,
+                    is_implicit_action=True,
+                )
+                for tx_id in rejected_ids
+            )
+            reject_count += Translation.objects.filter(pk__in=rejected_ids).update(
+                active=False,
+                approved=False,
+                approved_user=None,
+                approved_date=None,
+                rejected=True,
+                rejected_user=None,
+                rejected_date=now,
+                pretranslated=False,
+                fuzzy=False,
             )
-            for tx in rejected
-        )
-        reject_count = rejected.update(
-            active=False,
-            approved=False,
-            approved_user=None,
-            approved_date=None,
-            rejected=True,
-            rejected_user=None,
-            rejected_date=now,
-            pretranslated=False,
-            fuzzy=False,
-        )
-        if reject_count:
-            TranslationMemoryEntry.objects.filter(
-                translation__in=[tx.pk for tx in rejected]
-            ).delete()
         if repo_rm_count:
             nt = str_n_translations(repo_rm_count)
             log.info(f"{scope} Rejected {nt} removed from repo")
@@ -476,6 +582,62 @@ def update_db_translations(
     return created, list(suggestions.values())
 
 
+def find_matching_suggestions(
+    keys: list[tuple[int, int, str]],
+) -> Iterator[Translation]:
+    """
+    Unreviewed translations matching the `(entity_id, locale_id, string)` keys.
+
+    The keys are sent in chunks as arrays, to keep the query size bounded.
+    """
+    for chunk in batched(keys, BULK_CHUNK_SIZE):
+        entity_ids, locale_ids, strings = zip(*chunk)
+        yield from Translation.objects.raw(
+            dedent(
+                """
+                SELECT trans.*
+                FROM "base_translation" trans
+                INNER JOIN unnest(%s::integer[], %s::integer[], %s::text[])
+                    AS k(entity_id, locale_id, string)
+                    ON trans.entity_id = k.entity_id
+                    AND trans.locale_id = k.locale_id
+                    AND trans.string = k.string
+                WHERE NOT trans.approved AND NOT trans.pretranslated
+                """
+            ),
+            [list(entity_ids), list(locale_ids), list(strings)],
+        )
+
+
+def find_translations_to_reject(keys: list[tuple[int, int, int | None]]) -> list[int]:
+    """
+    The ids of all not-rejected translations for each `(entity_id, locale_id)`,
+    except for the translation with the id given as the third member of the key.
+
+    The keys are sent in chunks as arrays, to keep the query size bounded.
+    """
+    ids: list[int] = []
+    with connection.cursor() as cursor:
+        for chunk in batched(keys, BULK_CHUNK_SIZE):
+            entity_ids, locale_ids, keep_ids = zip(*chunk)
+            cursor.execute(
+                dedent(
+                    """
+                    SELECT DISTINCT trans.id
+                    FROM "base_translation" trans
+                    INNER JOIN unnest(%s::integer[], %s::integer[], %s::integer[])
+                        AS k(entity_id, locale_id, keep_id)
+                        ON trans.entity_id = k.entity_id
+                        AND trans.locale_id = k.locale_id
+                    WHERE NOT trans.rejected AND trans.id IS DISTINCT FROM k.keep_id
+                    """
+                ),
+                [list(entity_ids), list(locale_ids), list(keep_ids)],
+            )
+            ids.extend(row[0] for row in cursor.fetchall())
+    return ids
+
+
 def str_n_translations(n: int | Sized) -> str:
     if not isinstance(n, int):
         n = len(n)
@@ -496,11 +658,11 @@ def add_failed_checks(translations: list[Translation]) -> None:
     Run checks on all changed translations from supported resources
     """
     if translations:
-        checked_translations = Translation.objects.filter(
-            pk__in=[tx.pk for tx in translations],
-            entity__resource__format__in=DB_FORMATS,
-        ).select_related("entity__resource", "locale")
-        bulk_run_checks(checked_translations)
+        bulk_run_checks(
+            get_translations_for_checks(
+                Translation.objects.filter(pk__in=[tx.pk for tx in translations])
+            )
+        )
 
 
 def add_translation_memory_entries(
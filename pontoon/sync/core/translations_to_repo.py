@@ -1,9 +1,17 @@
+import hashlib
 import logging
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from hashlib import sha256
+from itertools import groupby
+from multiprocessing import get_context
+from operator import attrgetter
 from os import makedirs, remove
 from os.path import commonpath, dirname, isfile, join, normpath
+from typing import Any, NamedTuple
 
 from moz.l10n.formats import Format
 from moz.l10n.formats.xliff import xliff_is_xcode
@@ -21,18 +29,36 @@ from moz.l10n.model import (
 from moz.l10n.paths import L10nConfigPaths, L10nDiscoverPaths
 from moz.l10n.resource import parse_resource, serialize_resource
 
+import django
+
 from django.conf import settings
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
-from pontoon.base.models import Locale, Project, Translation, User
+from pontoon.base.models import (
+    Locale,
+    Project,
+    TranslatedResource,
+    Translation,
+    User,
+)
 from pontoon.base.models.changed_entity_locale import ChangedEntityLocale
 from pontoon.sync.core.checkout import Checkouts
+from pontoon.sync.core.reference import ReferenceCache
 from pontoon.sync.repositories import CommitToRepositoryException, get_repo
 
 
 log = logging.getLogger(__name__)
 
+
+class TargetTranslation(NamedTuple):
+    """The data of an active translation that's written to a target file."""
+
+    key: tuple[str, ...]
+    string: str
+    fuzzy: bool
+
+
 # Retaining these in the .po files is unnecessary & misleading,
 # and changes to POT-Creation-Date cause unnecessary churn.
 # Pontoon itself is the appropriate reference.
@@ -69,13 +95,14 @@ def sync_translations_to_repo(
     changed_source_paths: set[str],
     removed_source_paths: set[str],
     now: datetime,
+    ref_cache: ReferenceCache | None = None,
 ) -> bool:
     """Returns `True` if the sync includes changes to the repo."""
     readonly_locales = project.locales.filter(project_locale__readonly=True)
     removed = delete_removed_resources(
         project, paths, locale_map, readonly_locales, removed_source_paths
     )
-    updated, updated_locales, translators = update_changed_resources(
+    updated, updated_locales, translators, digests = update_changed_resources(
         project,
         paths,
         locale_map,
@@ -83,6 +110,7 @@ def sync_translations_to_repo(
         db_changes,
         changed_source_paths,
         now,
+        ref_cache,
     )
     if not removed and not updated:
         return False
@@ -118,6 +146,11 @@ def sync_translations_to_repo(
         log.warning(f"[{project.slug}] {co.repo.type} commit failed: {error}")
         raise error
 
+    TranslatedResource.objects.bulk_update(
+        [TranslatedResource(pk=pk, sync_digest=d) for pk, d in digests.items()],
+        ["sync_digest"],
+        batch_size=1000,
+    )
     return True
 
 
@@ -156,8 +189,18 @@ def update_changed_resources(
     db_changes: QuerySet[ChangedEntityLocale],
     changed_source_paths: set[str],
     now: datetime,
-) -> tuple[int, set[Locale], dict[User, set[str]]]:
-    count = 0
+    ref_cache: ReferenceCache | None = None,
+) -> tuple[int, set[Locale], dict[User, set[str]], dict[int, str]]:
+    """
+    `(file_count, updated_locales, translators, digests)`
+
+    Target files for which neither the reference file nor the translations
+    have changed since the last commit are not written.
+    `digests` maps the ids of the written files' translated resources
+    to their new `TranslatedResource.sync_digest` values.
+    """
+    if ref_cache is None:
+        ref_cache = ReferenceCache()
     # db_path -> {Locale}, empty set stands for "all locales"
     changed_resources: dict[str, set[Locale]] = {
         path: set() for path in changed_source_paths
@@ -172,86 +215,314 @@ def update_changed_resources(
             prev = changed_resources[path]
             if prev:
                 prev.add(change.locale)
-    changed_entities = {change.entity for change in db_changes}
+    changed_entities = {change.entity_id for change in db_changes}
     if changed_resources:
         n = len(changed_resources)
         str_resources = "resource" if n == 1 else "resources"
         log.info(f"[{project.slug}] Updating {n} changed {str_resources}")
 
-    updated_locales: set[Locale] = set()
-    translators: dict[User, set[str]] = defaultdict(set)
-    for path, locales_ in changed_resources.items():
-        log_scope = f"[{project.slug}:{path}]"
-        target, locale_codes = paths.target(path)
-        if target is None:
-            continue
-        if commonpath((paths.base or "", target)) != paths.base:
-            log.error(f"{log_scope} Invalid resource path")
-            continue
-        locales = locales_ or {
-            locale
-            for locale in (
-                locale_map[lc] for lc in sorted(locale_codes) if lc in locale_map
+    writer = TargetFileWriter(ref_cache, settings.SYNC_FILE_WORKERS)
+    try:
+        for path, locales_ in changed_resources.items():
+            log_scope = f"[{project.slug}:{path}]"
+            target, locale_codes = paths.target(path)
+            if target is None:
+                continue
+            if commonpath((paths.base or "", target)) != paths.base:
+                log.error(f"{log_scope} Invalid resource path")
+                continue
+            locales = locales_ or {
+                locale
+                for locale in (
+                    locale_map[lc] for lc in sorted(locale_codes) if lc in locale_map
+                )
+                if locale not in readonly_locales
+            }
+            if not locales:
+                continue
+            ref_path = normpath(join(paths.ref_root, path))
+            if ref_path.endswith(".po"):
+                ref_path += "t"
+            if not isfile(ref_path):
+                log.error(f"{log_scope} Missing source file")
+                continue
+            if locales_:
+                lc_str = ", ".join(locale.code for locale in locales_)
+                log.info(f"{log_scope} Updating locales: {lc_str}")
+            else:
+                log.info(f"{log_scope} Updating all locales")
+
+            ref_digest = file_digest(ref_path)
+            # locale.id -> (translated_resource.id, sync_digest)
+            prev_digests: dict[int, tuple[int, str]] = {
+                locale_id: (tr_id, digest)
+                for tr_id, locale_id, digest in TranslatedResource.objects.filter(
+                    resource__project=project,
+                    resource__path=path,
+                    locale__in=[locale.pk for locale in locales],
+                ).values_list("id", "locale_id", "sync_digest")
+            }
+            skip_count = 0
+            for locale, lc_rows in iter_locale_translations(
+                project, path, locales, now
+            ):
+                target_path = paths.format_target_path(target, locale.code)
+                if not lc_rows and not isfile(target_path):
+                    continue
+                target_translations = [
+                    TargetTranslation(tuple(row.entity__key), row.string, row.fuzzy)
+                    for row in lc_rows
+                ]
+                input_digest = target_input_digest(
+                    ref_digest, locale, target_translations
+                )
+                tr_id, prev_digest = prev_digests.get(locale.pk, (None, ""))
+                if prev_digest and prev_digest == sync_digest(
+                    input_digest, file_digest(target_path)
+                ):
+                    skip_count += 1
+                    continue
+                writer.write(
+                    ref_path,
+                    target_path,
+                    target_translations,
+                    TargetFile(
+                        scope=f"[{project.slug}:{path}, {locale.code}]",
+                        locale=locale,
+                        translator_ids={
+                            row.user_id
+                            for row in lc_rows
+                            if row.approved
+                            and row.entity_id in changed_entities
+                            and row.user_id
+                        },
+                        translated_resource_id=tr_id,
+                        input_digest=input_digest,
+                    ),
+                )
+            if skip_count:
+                str_files = "file" if skip_count == 1 else "files"
+                log.info(f"{log_scope} Skipped {skip_count} unchanged {str_files}")
+        writer.wait()
+    finally:
+        writer.shutdown()
+
+    translators: dict[User, set[str]] = {
+        user: writer.translator_ids[user.pk]
+        for user in User.objects.filter(pk__in=writer.translator_ids.keys())
+    }
+    return writer.count, writer.updated_locales, translators, writer.digests
+
+
+class TargetFile(NamedTuple):
+    """A target file being written by `TargetFileWriter`."""
+
+    scope: str
+    locale: Locale
+    translator_ids: set[int]
+    translated_resource_id: int | None
+    input_digest: str
+
+
+class TargetFileWriter:
+    """
+    Writes target files, either directly or with a pool of worker processes,
+    and keeps track of the files that were successfully written.
+    """
+
+    def __init__(self, ref_cache: ReferenceCache, workers: int) -> None:
+        self.ref_cache = ref_cache
+        self.workers = workers
+        # The workers are started from a separate server process,
+        # as forking this process could copy locks held by its other threads
+        # and leave the workers deadlocked.
+        self.executor = (
+            ProcessPoolExecutor(
+                workers, mp_context=get_context("forkserver"), initializer=django.setup
             )
-            if locale not in readonly_locales
-        }
-        if not locales:
-            continue
-        ref_path = normpath(join(paths.ref_root, path))
-        if ref_path.endswith(".po"):
-            ref_path += "t"
-        if not isfile(ref_path):
-            log.error(f"{log_scope} Missing source file")
-            continue
-        if locales_:
-            lc_str = ", ".join(locale.code for locale in locales_)
-            log.info(f"{log_scope} Updating locales: {lc_str}")
+            if workers > 1
+            else None
+        )
+        # Files being written by the executor, in submission order
+        self.pending: deque[tuple[Future[str], TargetFile]] = deque()
+
+        self.count = 0
+        self.updated_locales: set[Locale] = set()
+        # user.id -> {locale.code}
+        self.translator_ids: dict[int, set[str]] = defaultdict(set)
+        # translated_resource.id -> sync_digest
+        self.digests: dict[int, str] = {}
+
+    def write(
+        self,
+        ref_path: str,
+        target_path: str,
+        translations: list[TargetTranslation],
+        file: TargetFile,
+    ) -> None:
+        if self.executor is None:
+            try:
+                res = self.ref_cache.get(ref_path)
+                digest = write_target_file(res, target_path, file.locale, translations)
+            except Exception as error:
+                log.error(f"{file.scope} Update failed: {error}")
+                return
+            self._done(file, digest)
         else:
-            log.info(f"{log_scope} Updating all locales")
-
-        translations = (
-            Translation.objects.filter(
-                entity__obsolete=False,
-                entity__resource__project_id=project.pk,
-                entity__resource__path=path,
-                locale__in=[locale.pk for locale in locales],
-                active=True,
+            # Bound the number of files queued in memory at any time
+            if len(self.pending) >= 2 * self.workers:
+                self._wait_next()
+            future = self.executor.submit(
+                write_target_file_in_worker,
+                ref_path,
+                target_path,
+                file.locale,
+                translations,
             )
-            .filter(
-                Q(approved=True)
-                | Q(pretranslated=True, warnings__isnull=True)
-                | Q(fuzzy=True)
+            self.pending.append((future, file))
+
+    def wait(self) -> None:
+        """Wait for all pending files to be written."""
+        while self.pending:
+            self._wait_next()
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    def _wait_next(self) -> None:
+        future, file = self.pending.popleft()
+        try:
+            digest = future.result()
+        except Exception as error:
+            log.error(f"{file.scope} Update failed: {error}")
+            return
+        self._done(file, digest)
+
+    def _done(self, file: TargetFile, digest: str) -> None:
+        self.count += 1
+        self.updated_locales.add(file.locale)
+        for user_id in file.translator_ids:
+            self.translator_ids[user_id].add(file.locale.code)
+        if file.translated_resource_id is not None:
+            self.digests[file.translated_resource_id] = sync_digest(
+                file.input_digest, digest
             )
-            .exclude(approved_date__gt=now)  # includes approved_date = None
-            .select_related("entity")
+
+
+def iter_locale_translations(
+    project: Project, path: str, locales: Iterable[Locale], now: datetime
+) -> Iterator[tuple[Locale, list[Any]]]:
+    """
+    For each of `locales`, the translations to write to its target file for `path`.
+
+    The translations are read as a single stream ordered by locale,
+    so only one locale's rows are held in memory at a time.
+    """
+    rows = (
+        Translation.objects.filter(
+            entity__obsolete=False,
+            entity__resource__project_id=project.pk,
+            entity__resource__path=path,
+            locale__in=[locale.pk for locale in locales],
+            active=True,
         )
-        for locale in locales:
-            lc_scope = f"[{project.slug}:{path}, {locale.code}]"
-            lc_translations = [tx for tx in translations if tx.locale_id == locale.pk]
-            target_path = paths.format_target_path(target, locale.code)
-            if not lc_translations and not isfile(target_path):
-                continue
-            try:
-                lc_plurals = locale.cldr_plurals_list()
-                res = parse_resource(ref_path)
-                set_translations(locale, lc_translations, res)
-                makedirs(dirname(target_path), exist_ok=True)
-                with open(target_path, "w", encoding="utf-8") as file:
-                    for line in serialize_resource(res, gettext_plurals=lc_plurals):
-                        file.write(line)
-                updated_locales.add(locale)
-                for tx in lc_translations:
-                    if tx.approved and tx.entity in changed_entities and tx.user:
-                        translators[tx.user].add(locale.code)
-                count += 1
-            except Exception as error:
-                log.error(f"{lc_scope} Update failed: {error}")
-                continue
-    return count, updated_locales, translators
+        .filter(
+            Q(approved=True)
+            | Q(pretranslated=True, warnings__isnull=True)
+            | Q(fuzzy=True)
+        )
+        .exclude(approved_date__gt=now)  # includes approved_date = None
+        .order_by("locale_id")
+        .values_list(
+            "locale_id",
+            "entity_id",
+            "entity__key",
+            "string",
+            "fuzzy",
+            "approved",
+            "user_id",
+            named=True,
+        )
+        .iterator(chunk_size=5000)
+    )
+    groups = groupby(rows, key=attrgetter("locale_id"))
+    group = next(groups, None)
+    for locale in sorted(locales, key=attrgetter("pk")):
+        if group is not None and group[0] == locale.pk:
+            yield locale, list(group[1])
+            group = next(groups, None)
+        else:
+            yield locale, []
+
+
+# Parsed reference resources of a file-writing worker process
+_worker_ref_cache = ReferenceCache()
+
+
+def write_target_file_in_worker(
+    ref_path: str,
+    target_path: str,
+    locale: Locale,
+    translations: list[TargetTranslation],
+) -> str:
+    return write_target_file(
+        _worker_ref_cache.get(ref_path), target_path, locale, translations
+    )
+
+
+def write_target_file(
+    res: Resource,
+    target_path: str,
+    locale: Locale,
+    translations: list[TargetTranslation],
+) -> str:
+    """
+    Fill out the reference `res` with `translations`, and write it to `target_path`.
+
+    Returns the SHA-256 digest of the written file.
+    """
+    lc_plurals = locale.cldr_plurals_list()
+    set_translations(locale, translations, res)
+    makedirs(dirname(target_path), exist_ok=True)
+    digest = sha256()
+    with open(target_path, "w", encoding="utf-8", newline="") as file:
+        for line in serialize_resource(res, gettext_plurals=lc_plurals):
+            file.write(line)
+            digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def file_digest(path: str) -> str | None:
+    """The SHA-256 digest of the file at `path`, or `None` if it does not exist."""
+    try:
+        with open(path, "rb") as file:
+            return hashlib.file_digest(file, "sha256").hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def target_input_digest(
+    ref_digest: str | None, locale: Locale, translations: list[TargetTranslation]
+) -> str:
+    """A digest of all the data that a target file is written from."""
+    digest = sha256(f"{ref_digest}\0{locale.code}\0{locale.cldr_plurals}".encode())
+    digest.update(f"\0{locale.nplurals}\0{locale.plural_rule}".encode())
+    for tx in sorted(translations):
+        digest.update(f"\0{tx.key}\0{tx.string}\0{tx.fuzzy}".encode())
+    return digest.hexdigest()
+
+
+def sync_digest(input_digest: str, file_digest: str | None) -> str:
+    """
+    The value stored as `TranslatedResource.sync_digest`,
+    combining the digests of a target file and of its inputs.
+    """
+    return sha256(f"{input_digest}\0{file_digest}".encode()).hexdigest()
 
 
 def set_translations(
-    locale: Locale, translations: list[Translation], res: Resource
+    locale: Locale, translations: list[TargetTranslation], res: Resource
 ) -> None:
     if res.format == Format.fluent:
         trans_res = parse_resource(
@@ -284,6 +555,11 @@ def set_translations(
             if rm:
                 section.entries = [e for e in section.entries if e not in rm]
     else:
+        # Build the key index once, rather than scanning `translations` per entry.
+        tx_index: dict[tuple[str, ...], TargetTranslation] = {
+            tx.key: tx for tx in translations
+        }
+
         # The iOS locale remapping is a hacky workaround for Xcode projects only,
         # so don't apply it to other XLIFF projects.
         is_xcode = res.format == Format.xliff and xliff_is_xcode(res)
@@ -308,7 +584,7 @@ def set_translations(
             rm: list[Entry] = []
             for entry in section.entries:
                 if isinstance(entry, Entry):
-                    if not set_translation(translations, res.format, section, entry):
+                    if not set_translation(tx_index, res.format, section, entry):
                         rm.append(entry)
             if rm and res.format not in (Format.gettext, Format.xliff):
                 section.entries = [e for e in section.entries if e not in rm]
@@ -337,13 +613,12 @@ def set_translations(
 
 
 def set_translation(
-    translations: list[Translation],
+    tx_index: dict[tuple[str, ...], TargetTranslation],
     format: Format | None,
     section: Section,
     entry: Entry,
 ) -> bool:
-    key = list(section.id + entry.id)
-    tx = next((tx for tx in translations if tx.entity.key == key), None)
+    tx = tx_index.get(section.id + entry.id, None)
     if tx is None:
         if format == Format.gettext:
             if isinstance(entry.value, SelectMessage):
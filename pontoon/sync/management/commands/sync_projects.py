@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 
 from pontoon.base.models import Project
+from pontoon.sync.schedule import schedule_syncs
 from pontoon.sync.tasks import sync_project_task
 
 
@@ -40,6 +43,15 @@ class Command(BaseCommand):
             help="Always sync even if there are no changes",
         )
 
+        parser.add_argument(
+            "--max-concurrent",
+            action="store",
+            dest="max_concurrent",
+            type=int,
+            default=None,
+            help="Run at most this many project syncs at the same time",
+        )
+
     def handle(self, *args, **options):
         """
         Collect the projects we want to sync and trigger worker jobs to
@@ -72,11 +84,19 @@ class Command(BaseCommand):
                 )
             )
 
-        for project in projects:
-            self.stdout.write(f"Scheduling sync for project {project.name}.")
+        max_concurrent = options.get("max_concurrent")
+        if max_concurrent is None:
+            max_concurrent = settings.SYNC_MAX_CONCURRENT
+        names = {project.pk: project.name for project in projects}
+        queued_time = timezone.now()
+        for project_pks in schedule_syncs(projects, max_concurrent):
+            for pk in project_pks:
+                self.stdout.write(f"Scheduling sync for project {names[pk]}.")
             sync_project_task.delay(
-                project.pk,
+                project_pks[0],
                 pull=not options["no_pull"],
                 commit=not options["no_commit"],
                 force=options["force"],
+                queued_time=queued_time,
+                next_project_pks=project_pks[1:],
             )
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.15 on 2026-10-18 02:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sync", "0005_remove_old_sync_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="queued_time",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+    ]
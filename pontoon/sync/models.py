@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.db import models
 from django.utils import timezone
 
@@ -16,10 +18,20 @@ class Sync(models.Model):
 
     project = models.ForeignKey(Project, models.CASCADE)
     status = models.IntegerField(choices=Status.choices, default=Status.IN_PROGRESS)
+    queued_time = models.DateTimeField(default=None, blank=True, null=True)
     start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(default=None, blank=True, null=True)
     error = models.TextField(default="")
 
+    @property
+    def wait_time(self) -> timedelta | None:
+        """Time spent waiting in the sync queue."""
+        return self.start_time - self.queued_time if self.queued_time else None
+
+    @property
+    def run_time(self) -> timedelta | None:
+        return self.end_time - self.start_time if self.end_time else None
+
     def done(self, status: Status = Status.DONE) -> None:
         self.status = status
         self.end_time = timezone.now()
@@ -3,13 +3,27 @@ import re
 
 from django.conf import settings
 
-from .utils import CommitToRepositoryException, PullFromRepositoryException, execute
+from .utils import (
+    CommitToRepositoryException,
+    PullFromRepositoryException,
+    execute,
+    parse_diff_line_ranges,
+)
 
 
 log = logging.getLogger(__name__)
 
 
-def update(source: str, target: str, branch: str | None, shallow: bool) -> None:
+def update(
+    source: str, target: str, branch: str | None, shallow: bool, sparse: bool = False
+) -> None:
+    """
+    Clone or update the repository at `target` from `source`.
+
+    With `sparse`, a new clone is made without file contents
+    and with only its top-level files checked out.
+    Use `set_sparse_patterns()` to select the files to check out.
+    """
     log.debug(f"Git: Updating repo {source}")
     if branch and re.search(r"[^%&()+,\-./0-9;<=>@A-Z_a-z{|}]|^-|\.\.|{@", branch):
         raise PullFromRepositoryException(f"Git: Unsupported branch name {branch}")
@@ -45,6 +59,13 @@ def update(source: str, target: str, branch: str | None, shallow: bool) -> None:
             if output:
                 log.debug(output)
             raise PullFromRepositoryException(error)
+
+        if not sparse and sparse_patterns(target) is not None:
+            command = ["git", "sparse-checkout", "disable"]
+            code, output, error = execute(command, target)
+            if code != 0:
+                raise PullFromRepositoryException(error)
+            log.debug("Git: Sparse checkout disabled.")
     else:
         if error != "No such file or directory":
             if output:
@@ -56,6 +77,8 @@ def update(source: str, target: str, branch: str | None, shallow: bool) -> None:
             command.extend(["--branch", branch])
         if shallow:
             command.extend(["--depth", "1"])
+        if sparse:
+            command.extend(["--filter=blob:none", "--sparse"])
         command.extend([source, target])
         code, output, error = execute(command)
         if code != 0:
@@ -65,6 +88,32 @@ def update(source: str, target: str, branch: str | None, shallow: bool) -> None:
         log.debug("Git: Repo cloned.")
 
 
+def sparse_patterns(path: str) -> list[str] | None:
+    """
+    The sparse checkout patterns of the repository at `path`,
+    or `None` if it is not a sparse checkout.
+    """
+    command = ["git", "sparse-checkout", "list"]
+    code, output, _error = execute(command, path)
+    if code != 0:
+        return None
+    return output.decode().splitlines()
+
+
+def set_sparse_patterns(path: str, patterns: list[str]) -> None:
+    """
+    Check out only the files matching `patterns`,
+    using the non-cone gitignore-style pattern syntax.
+    """
+    command = ["git", "sparse-checkout", "set", "--no-cone", *patterns]
+    code, output, error = execute(command, path)
+    if code != 0:
+        if output:
+            log.debug(output)
+        raise PullFromRepositoryException(error)
+    log.debug(f"Git: Sparse checkout patterns set: {patterns}")
+
+
 def commit(path: str, message: str, author: str, branch: str | None, url: str) -> None:
     log.debug("Git: Commit to repository.")
 
@@ -144,3 +193,30 @@ def changed_files(
             log.warning(f"Git: Failed to parse diff line: {line}")
             return None
     return changed, removed, renamed
+
+
+def changed_lines(
+    path: str, from_revision: str, files: list[str] | None = None
+) -> dict[str, list[tuple[int, int]]] | None:
+    """
+    For each file changed since `from_revision`, the line ranges with changes.
+    If set, only the `files` relative to `path` are considered.
+    See `parse_diff_line_ranges()` for details.
+    """
+    cmd = [
+        "git",
+        "-c",
+        "core.quotePath=false",
+        "diff",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        "--find-renames=100%",
+        f"{from_revision}..HEAD",
+        "--",
+        *(files if files is not None else [path]),
+    ]
+    code, output, _error = execute(cmd, path, log=log)
+    if code != 0:
+        return None
+    return parse_diff_line_ranges(output.decode("utf-8", errors="replace"))
@@ -1,12 +1,19 @@
 import logging
 
-from .utils import CommitToRepositoryException, PullFromRepositoryException, execute
+from .utils import (
+    CommitToRepositoryException,
+    PullFromRepositoryException,
+    execute,
+    parse_diff_line_ranges,
+)
 
 
 log = logging.getLogger(__name__)
 
 
-def update(source: str, target: str, branch: str | None, shallow: bool) -> None:
+def update(
+    source: str, target: str, branch: str | None, shallow: bool, sparse: bool = False
+) -> None:
     log.debug(f"Mercurial: Updating repo {source}")
 
     # Undo local changes: Mercurial doesn't offer anything more elegant
@@ -71,3 +78,18 @@ def changed_files(
             elif line.startswith("R"):
                 removed.append(line.split(None, 2)[1])
     return changed, removed, []
+
+
+def changed_lines(
+    path: str, from_revision: str
+) -> dict[str, list[tuple[int, int]]] | None:
+    """
+    For each file changed since `from_revision`, the line ranges with changes.
+    See `parse_diff_line_ranges()` for details.
+    """
+    rev = from_revision.rstrip("+")
+    cmd = ["hg", "diff", "--git", "--unified=0", f"--rev={rev}", "--rev=default"]
+    code, output, _ = execute(cmd, path, log=log)
+    if code != 0:
+        return None
+    return parse_diff_line_ranges(output.decode("utf-8", errors="replace"))
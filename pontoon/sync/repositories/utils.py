@@ -1,3 +1,4 @@
+import re
 import subprocess
 
 from logging import Logger
@@ -28,3 +29,42 @@ def execute(
         return proc.returncode, output, strerror
     except OSError as error:
         return -1, b"", error.strerror or ""
+
+
+hunk_header_re = re.compile(r"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def parse_diff_line_ranges(diff: str) -> dict[str, list[tuple[int, int]]]:
+    """
+    For each file in a unified diff with `a/` & `b/` path prefixes,
+    the `(start, end)` line ranges of the new file that include changes.
+
+    Line numbers start at 1, and each range end is exclusive.
+    For removed lines, the lines immediately before and after them are included.
+    Deleted files are not included.
+    """
+    res: dict[str, list[tuple[int, int]]] = {}
+    ranges: list[tuple[int, int]] | None = None
+    lines = iter(diff.split("\n"))
+    for line in lines:
+        if line.startswith("+++ "):
+            name = line[4:].rstrip("\t")
+            ranges = res.setdefault(name[2:], []) if name.startswith("b/") else None
+        elif line.startswith("@@ ") and ranges is not None:
+            match = hunk_header_re.match(line)
+            if match is None:
+                continue
+            old_count = 1 if match[1] is None else int(match[1])
+            start = int(match[2])
+            new_count = 1 if match[3] is None else int(match[3])
+            ranges.append((start, start + (new_count or 2)))
+
+            # Skip the hunk contents, which may look like headers
+            skip = old_count + new_count
+            while skip > 0:
+                line = next(lines, None)
+                if line is None:
+                    break
+                if not line.startswith("\\"):
+                    skip -= 1
+    return res
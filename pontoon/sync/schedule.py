@@ -0,0 +1,173 @@
+from collections.abc import Iterable
+from datetime import timedelta
+from hashlib import sha1
+from heapq import heapify, heapreplace
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, OuterRef, Subquery
+
+from pontoon.base.models import ChangedEntityLocale, Project
+from pontoon.sync.models import Sync
+
+
+SUCCESSFUL_SYNC_STATUSES = [
+    Sync.Status.DONE,
+    Sync.Status.NO_CHANGES,
+    Sync.Status.NO_COMMIT,
+]
+
+
+class SyncCost(NamedTuple):
+    """Ordering key for scheduling a project's sync; greater runs first."""
+
+    run_time: timedelta
+    pending_changes: int
+
+
+def needs_full_compare(project: Project) -> bool:
+    """
+    Whether the next sync of `project` should compare all translations
+    of changed target files with the database, rather than only their changed lines.
+
+    This is done every `SYNC_FULL_COMPARE_INTERVAL` successful syncs,
+    so that differences between the database and the repository
+    outside of the changed lines are not left in place indefinitely.
+    """
+    interval = settings.SYNC_FULL_COMPARE_INTERVAL
+    if interval <= 0:
+        return False
+    count = Sync.objects.filter(
+        project=project, status__in=SUCCESSFUL_SYNC_STATUSES
+    ).count()
+    return count % interval == 0
+
+
+def sync_lock_names(project: Project) -> list[str]:
+    """
+    Cache keys for the locks held while syncing `project`.
+
+    Projects using the same repository URL or checkout path share a lock,
+    so that they are never synced concurrently.
+    """
+    keys: set[str] = set()
+    for repo in project.repositories.all():
+        keys.add(repo.url.rstrip("/"))
+        keys.add(repo.checkout_path)
+    if not keys:
+        return [f"sync_{project.pk}"]
+    return [f"sync_repo_{sha1(key.encode()).hexdigest()}" for key in sorted(keys)]
+
+
+def acquire_sync_locks(lock_names: list[str], timeout: int) -> bool:
+    """Acquire all of the locks, or none of them."""
+    acquired: list[str] = []
+    for name in lock_names:
+        if cache.add(name, True, timeout=timeout):
+            acquired.append(name)
+        else:
+            cache.delete_many(acquired)
+            return False
+    return True
+
+
+def release_sync_locks(lock_names: list[str]) -> None:
+    cache.delete_many(lock_names)
+
+
+def sync_costs(projects: Iterable[Project]) -> dict[int, SyncCost]:
+    """
+    The run time of each project's last successful sync,
+    and the number of its translation changes waiting to be synced.
+
+    Failed and skipped syncs are ignored, as they may end early.
+
+    Projects that have not yet been synced are assumed to take
+    as long as the average of the others.
+    """
+    pks = [project.pk for project in projects]
+    last_run_times = dict(
+        Project.objects.filter(pk__in=pks)
+        .annotate(
+            last_run_time=Subquery(
+                Sync.objects.filter(
+                    project=OuterRef("pk"),
+                    status__in=SUCCESSFUL_SYNC_STATUSES,
+                    end_time__isnull=False,
+                )
+                .order_by("-start_time")
+                .annotate(run_time=F("end_time") - F("start_time"))
+                .values("run_time")[:1]
+            )
+        )
+        .values_list("pk", "last_run_time")
+    )
+    pending_changes = dict(
+        ChangedEntityLocale.objects.filter(entity__resource__project__in=pks)
+        .values("entity__resource__project")
+        .annotate(count=Count("id"))
+        .values_list("entity__resource__project", "count")
+    )
+    known = [rt for rt in last_run_times.values() if rt is not None]
+    default_run_time = sum(known, timedelta()) / len(known) if known else timedelta()
+    return {
+        pk: SyncCost(
+            last_run_times.get(pk) or default_run_time, pending_changes.get(pk, 0)
+        )
+        for pk in pks
+    }
+
+
+def schedule_syncs(projects: Iterable[Project], max_concurrent: int) -> list[list[int]]:
+    """
+    Split `projects` into sequences of project ids,
+    each of which is to be synced one project at a time.
+
+    Projects are ordered by the run time of their previous sync
+    and then by their number of pending changes, most expensive first.
+    Projects sharing a repository are kept in the same sequence,
+    and the sequences are balanced by their expected total run time.
+
+    If `max_concurrent` is not positive, each project group
+    gets its own sequence.
+    """
+    projects = list(projects)
+    costs = sync_costs(projects)
+
+    # Group projects by their shared locks
+    groups: list[tuple[set[str], list[Project]]] = []
+    for project in projects:
+        locks = set(sync_lock_names(project))
+        group = [project]
+        for other in [g for g in groups if g[0] & locks]:
+            groups.remove(other)
+            locks |= other[0]
+            group += other[1]
+        groups.append((locks, group))
+
+    def project_cost(project: Project) -> SyncCost:
+        return costs[project.pk]
+
+    def group_cost(group: list[Project]) -> SyncCost:
+        return SyncCost(
+            sum((costs[p.pk].run_time for p in group), timedelta()),
+            sum(costs[p.pk].pending_changes for p in group),
+        )
+
+    sorted_groups = [
+        sorted(group, key=project_cost, reverse=True) for _, group in groups
+    ]
+    sorted_groups.sort(key=group_cost, reverse=True)
+    if max_concurrent <= 0 or len(sorted_groups) <= max_concurrent:
+        return [[p.pk for p in group] for group in sorted_groups]
+
+    # Assign each group to the sequence with the least expected run time
+    lanes: list[list[int]] = [[] for _ in range(max_concurrent)]
+    heap = [(timedelta(), idx) for idx in range(max_concurrent)]
+    heapify(heap)
+    for group in sorted_groups:
+        lane_time, idx = heap[0]
+        lanes[idx].extend(p.pk for p in group)
+        heapreplace(heap, (lane_time + group_cost(group).run_time, idx))
+    return [lane for lane in lanes if lane]
@@ -1,14 +1,21 @@
 import logging
 
+from datetime import datetime
+
 from celery import shared_task
 
 from django.conf import settings
-from django.core.cache import cache
 
 from pontoon.base.models import Project
 from pontoon.base.tasks import PontoonTask
 from pontoon.sync.core import sync_project
 from pontoon.sync.models import Sync
+from pontoon.sync.schedule import (
+    acquire_sync_locks,
+    needs_full_compare,
+    release_sync_locks,
+    sync_lock_names,
+)
 
 
 log = logging.getLogger(__name__)
@@ -20,6 +27,36 @@ def sync_project_task(
     pull: bool = True,
     commit: bool = True,
     force: bool = False,
+    queued_time: datetime | None = None,
+    next_project_pks: list[int] | None = None,
+):
+    """
+    If `next_project_pks` is set, a sync for the first of those projects
+    is queued once this one completes, whether or not it succeeds.
+
+    If the worker is killed during the sync, the rest of the projects
+    are not synced before the next run of the `sync_projects` command.
+    """
+    try:
+        _sync_project(project_pk, pull, commit, force, queued_time)
+    finally:
+        if next_project_pks:
+            sync_project_task.delay(
+                next_project_pks[0],
+                pull=pull,
+                commit=commit,
+                force=force,
+                queued_time=queued_time,
+                next_project_pks=next_project_pks[1:],
+            )
+
+
+def _sync_project(
+    project_pk: int,
+    pull: bool,
+    commit: bool,
+    force: bool,
+    queued_time: datetime | None,
 ):
     try:
         project = Project.objects.get(pk=project_pk)
@@ -38,16 +75,17 @@ def sync_project_task(
         except Sync.DoesNotExist:
             pass
 
-    sync = Sync.objects.create(project=project)
-    lock_name = f"sync_{project_pk}"
-    if not cache.add(lock_name, True, timeout=settings.SYNC_TASK_TIMEOUT):
+    full_compare = needs_full_compare(project)
+    sync = Sync.objects.create(project=project, queued_time=queued_time)
+    lock_names = sync_lock_names(project)
+    if not acquire_sync_locks(lock_names, settings.SYNC_TASK_TIMEOUT):
         sync.done(Sync.Status.PREV_BUSY)
         raise RuntimeError(
             f"[{project.slug}] Sync aborted: Previous sync still running."
         )
     try:
         db_changed, repo_changed = sync_project(
-            project, pull=pull, commit=commit, force=force
+            project, pull=pull, commit=commit, force=force, full_compare=full_compare
         )
         if not db_changed and not repo_changed:
             status = Sync.Status.NO_CHANGES
@@ -64,5 +102,5 @@ def sync_project_task(
         log.error(f"[{project.slug}] Sync failed: {err}")
         sync.fail(str(err))
     finally:
-        # release the lock
-        cache.delete(lock_name)
+        # release the locks
+        release_sync_locks(lock_names)
@@ -0,0 +1,122 @@
+"""
+Benchmark of writing a large synthetic gettext resource to the repository.
+
+Skipped unless `SYNC_BENCHMARK_ENTRIES` sets the number of entries to create.
+Timings are logged at INFO level, e.g.
+
+    SYNC_BENCHMARK_ENTRIES=5000 pytest --log-cli-level=INFO pontoon/sync/tests/test_benchmark.py
+"""
+
+import logging
+import os
+
+from os import makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from unittest.mock import Mock
+
+import pytest
+
+from django.conf import settings
+from django.utils import timezone
+
+from pontoon.base.models import Entity, Translation
+from pontoon.sync.core.checkout import Checkout, Checkouts
+from pontoon.sync.core.paths import find_paths
+from pontoon.sync.core.translations_to_repo import update_changed_resources
+from pontoon.sync.tests.utils import build_file_tree
+from pontoon.test.factories import (
+    LocaleFactory,
+    ProjectFactory,
+    RepositoryFactory,
+    ResourceFactory,
+    SectionFactory,
+    TranslatedResourceFactory,
+)
+
+
+log = logging.getLogger(__name__)
+
+ENTRY_COUNT = int(os.environ.get("SYNC_BENCHMARK_ENTRIES", 0))
+
+pytestmark = pytest.mark.skipif(
+    not ENTRY_COUNT, reason="SYNC_BENCHMARK_ENTRIES is not set"
+)
+
+
+@pytest.mark.django_db
+def test_benchmark_update_changed_resources():
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        locale_map = {locale.code: locale}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-benchmark", locales=[locale], repositories=[repo]
+        )
+        res = ResourceFactory.create(
+            project=project, path="big.po", format="gettext", total_strings=0
+        )
+        section = SectionFactory.create(resource=res, key=[])
+        TranslatedResourceFactory.create(
+            locale=locale, resource=res, total_strings=ENTRY_COUNT
+        )
+        entities = Entity.objects.bulk_create(
+            Entity(
+                resource=res,
+                section=section,
+                key=[f"Message {i}"],
+                string=f"Message {i}",
+                value=[f"Message {i}"],
+                order=i,
+            )
+            for i in range(ENTRY_COUNT)
+        )
+        Translation.objects.bulk_create(
+            Translation(
+                entity=entity,
+                locale=locale,
+                string=f"Translation {i}",
+                value=[f"Translation {i}"],
+                active=True,
+                approved=True,
+            )
+            for i, entity in enumerate(entities)
+        )
+
+        # Filesystem setup
+        pot = 'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n'
+        pot += "".join(
+            f'\nmsgid "Message {i}"\nmsgstr ""\n' for i in range(ENTRY_COUNT)
+        )
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": {"big.pot": pot}, "fr-Test": {"big.po": ""}},
+        )
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            changed=[join("en-US", "big.pot")],
+            removed=[],
+            sparse=False,
+        )
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        # Test
+        start = perf_counter()
+        count, _, _, _ = update_changed_resources(
+            project, paths, locale_map, [], [], {"big.po"}, timezone.now()
+        )
+        elapsed = perf_counter() - start
+        log.info(f"update_changed_resources: {ENTRY_COUNT} entries in {elapsed:.3f}s")
+
+        assert count == 1
+        with open(join(repo.checkout_path, "fr-Test", "big.po")) as file:
+            po = file.read()
+        assert f'msgstr "Translation {ENTRY_COUNT - 1}"' in po
@@ -1,4 +1,5 @@
 from tempfile import TemporaryDirectory
+from threading import Barrier
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -18,6 +19,7 @@ class MockVersionControl:
         renamed: list[tuple[str, str]] | None = None,
     ):
         self._calls: list[tuple[str, Any]] = []
+        self._sparse_patterns: list[str] | None = []
         if changed is None and removed is None and renamed is None:
             self._changes = None
         else:
@@ -29,6 +31,13 @@ class MockVersionControl:
     def update(self, *args):
         self._calls.append(("update", args))
 
+    def sparse_patterns(self, *args):
+        self._calls.append(("sparse_patterns", args))
+        return self._sparse_patterns
+
+    def set_sparse_patterns(self, *args):
+        self._calls.append(("set_sparse_patterns", args))
+
     def revision(self, *args):
         self._calls.append(("revision", args))
         return "abc123"
@@ -37,6 +46,10 @@ class MockVersionControl:
         self._calls.append(("changed_files", args))
         return self._changes
 
+    def changed_lines(self, *args):
+        self._calls.append(("changed_lines", args))
+        return None
+
 
 def test_no_changes_with_prev_commit():
     mock_vcs = MockVersionControl(changed=[])
@@ -48,6 +61,7 @@ def test_no_changes_with_prev_commit():
         source_repo=True,
         url="URL",
         type=Repository.Type.GIT,
+        sparse_checkout=False,
     )
     with patch("pontoon.sync.core.checkout.get_repo", return_value=mock_vcs):
         co = Checkout("SLUG", mock_repo)
@@ -60,7 +74,7 @@ def test_no_changes_with_prev_commit():
         assert not co.changed
         assert not co.removed
         assert mock_vcs._calls == [
-            ("update", ("URL", "/foo/bar", "BRANCH", False)),
+            ("update", ("URL", "/foo/bar", "BRANCH", False, False)),
             ("revision", ("/foo/bar",)),
             ("changed_files", ("/foo/bar", "def456")),
         ]
@@ -75,7 +89,7 @@ def test_no_changes_with_prev_commit():
         mock_vcs._calls.clear()
         co = Checkout("SLUG", mock_repo, shallow=True)
         assert mock_vcs._calls == [
-            ("update", ("URL", "/foo/bar", "BRANCH", True)),
+            ("update", ("URL", "/foo/bar", "BRANCH", True, False)),
             ("revision", ("/foo/bar",)),
         ]
 
@@ -97,6 +111,7 @@ def test_no_changes_with_no_prev_commit():
             source_repo=True,
             url="URL",
             type=Repository.Type.GIT,
+            sparse_checkout=False,
         )
         with patch("pontoon.sync.core.checkout.get_repo", return_value=mock_vcs):
             co = Checkout("SLUG", mock_repo)
@@ -110,11 +125,69 @@ def test_no_changes_with_no_prev_commit():
                 "fr/foo.ftl",
             ]
             assert mock_vcs._calls == [
-                ("update", ("URL", root, "BRANCH", False)),
+                ("update", ("URL", root, "BRANCH", False, False)),
                 ("revision", (root,)),
             ]
 
 
+def test_sparse_checkout():
+    tree: FileTree = {
+        "l10n.toml": "",
+        "en-US": {"bar.ftl": "", "foo.ftl": ""},
+    }
+    with TemporaryDirectory() as root:
+        build_file_tree(root, tree)
+        mock_vcs = MockVersionControl(
+            changed=["en-US/bar.ftl", "other/baz.ftl"], removed=["other/old.ftl"]
+        )
+        mock_vcs._sparse_patterns = ["/l10n.toml", "/en-US/*.ftl"]
+        mock_repo = Mock(
+            Repository,
+            branch="BRANCH",
+            checkout_path=root,
+            last_synced_revision="def456",
+            source_repo=True,
+            url="URL",
+            type=Repository.Type.GIT,
+            sparse_checkout=True,
+        )
+        with patch("pontoon.sync.core.checkout.get_repo", return_value=mock_vcs):
+            co = Checkout("SLUG", mock_repo)
+            assert co.sparse
+            assert co.changed == ["en-US/bar.ftl"]
+            assert co.removed == ["other/old.ftl"]
+            assert mock_vcs._calls == [
+                ("update", ("URL", root, "BRANCH", False, True)),
+                ("sparse_patterns", (root,)),
+                ("revision", (root,)),
+                ("changed_files", (root, "def456")),
+            ]
+
+            mock_vcs._calls.clear()
+            co.changed_lines()
+            assert mock_vcs._calls == [
+                ("changed_lines", (root, "def456", ["en-US/bar.ftl"])),
+            ]
+
+            # Unchanged patterns are not set again
+            mock_vcs._calls.clear()
+            co.set_sparse_patterns(["/l10n.toml", "/en-US/*.ftl"])
+            assert mock_vcs._calls == []
+            assert co.changed == ["en-US/bar.ftl"]
+
+            # With new patterns, all files are considered as changed
+            co.set_sparse_patterns(["/l10n.toml", "/en-US/*.ftl", "/*/*.ftl"])
+            assert mock_vcs._calls == [
+                (
+                    "set_sparse_patterns",
+                    (root, ["/l10n.toml", "/en-US/*.ftl", "/*/*.ftl"]),
+                ),
+            ]
+            assert sorted(co.changed) == ["en-US/bar.ftl", "en-US/foo.ftl", "l10n.toml"]
+            assert co.removed == ["other/old.ftl"]
+            assert co.changed_lines() is None
+
+
 @patch("pontoon.sync.core.checkout.Checkout")
 def test_get_checkouts(_):
     with pytest.raises(Exception) as exc_info:
@@ -155,3 +228,52 @@ def test_get_checkouts(_):
     result = checkout_repos(Mock(Project, repositories=one_target))
     assert result.source is not None
     assert result.source == result.target
+
+
+def test_get_checkouts_sequentially():
+    checked_out: list[Repository] = []
+
+    def mock_checkout(slug, repo, **kwargs):
+        checked_out.append(repo)
+        return Mock(Checkout, repo=repo, path="/foo")
+
+    source_repo = Mock(Repository, source_repo=True)
+    target_repo = Mock(Repository, source_repo=False)
+    repos = Mock(**{"all.return_value": [target_repo, source_repo]})
+    with patch("pontoon.sync.core.checkout.Checkout", side_effect=mock_checkout):
+        result = checkout_repos(Mock(Project, slug="SLUG", repositories=repos))
+    assert checked_out == [source_repo, target_repo]
+    assert result.source.repo == source_repo
+    assert result.target.repo == target_repo
+
+
+def test_get_checkouts_concurrently(settings):
+    settings.SYNC_PARALLEL_CHECKOUTS = True
+    barrier = Barrier(2, timeout=5)
+
+    def mock_checkout(slug, repo, **kwargs):
+        # Fails if the checkouts are not created at the same time
+        barrier.wait()
+        return Mock(Checkout, repo=repo, path="/foo")
+
+    source_repo = Mock(Repository, source_repo=True)
+    target_repo = Mock(Repository, source_repo=False)
+    repos = Mock(**{"all.return_value": [target_repo, source_repo]})
+    with patch("pontoon.sync.core.checkout.Checkout", side_effect=mock_checkout):
+        result = checkout_repos(Mock(Project, slug="SLUG", repositories=repos))
+    assert result.source.repo == source_repo
+    assert result.target.repo == target_repo
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_get_checkouts_error(settings, parallel):
+    settings.SYNC_PARALLEL_CHECKOUTS = parallel
+    source_repo = Mock(Repository, source_repo=True)
+    target_repo = Mock(Repository, source_repo=False)
+    repos = Mock(**{"all.return_value": [source_repo, target_repo]})
+    with patch(
+        "pontoon.sync.core.checkout.Checkout", side_effect=Exception("Fetch failed")
+    ):
+        with pytest.raises(Exception) as exc_info:
+            checkout_repos(Mock(Project, slug="SLUG", repositories=repos))
+    assert str(exc_info.value) == "Fetch failed"
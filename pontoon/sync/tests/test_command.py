@@ -1,6 +1,6 @@
 import io
 
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 
@@ -52,7 +52,12 @@ def test_syncable_projects_only(command, mock_sync_project_task):
 
     execute_command(command)
     mock_sync_project_task.delay.assert_called_with(
-        active_project.pk, pull=True, commit=True, force=False
+        active_project.pk,
+        pull=True,
+        commit=True,
+        force=False,
+        queued_time=ANY,
+        next_project_pks=[],
     )
 
 
@@ -64,7 +69,12 @@ def test_non_repository_projects(command, mock_sync_project_task):
 
     execute_command(command)
     mock_sync_project_task.delay.assert_called_with(
-        repo_project.pk, pull=True, commit=True, force=False
+        repo_project.pk,
+        pull=True,
+        commit=True,
+        force=False,
+        queued_time=ANY,
+        next_project_pks=[],
     )
 
 
@@ -78,7 +88,12 @@ def test_project_slugs(command, mock_sync_project_task):
 
     execute_command(command, projects=handle_project.slug)
     mock_sync_project_task.delay.assert_called_with(
-        handle_project.pk, pull=True, commit=True, force=False
+        handle_project.pk,
+        pull=True,
+        commit=True,
+        force=False,
+        queued_time=ANY,
+        next_project_pks=[],
     )
 
 
@@ -102,7 +117,12 @@ def test_invalid_slugs(command, mock_sync_project_task):
     execute_command(command, projects=handle_project.slug + ",aaa,bbb")
 
     mock_sync_project_task.delay.assert_called_with(
-        handle_project.pk, pull=True, commit=True, force=False
+        handle_project.pk,
+        pull=True,
+        commit=True,
+        force=False,
+        queued_time=ANY,
+        next_project_pks=[],
     )
 
     assert (
@@ -116,5 +136,18 @@ def test_options(command, mock_sync_project_task):
     project = ProjectFactory.create()
     execute_command(command, no_pull=True, no_commit=True)
     mock_sync_project_task.delay.assert_called_with(
-        project.pk, pull=False, commit=False, force=False
+        project.pk,
+        pull=False,
+        commit=False,
+        force=False,
+        queued_time=ANY,
+        next_project_pks=[],
     )
+
+
+@pytest.mark.django_db
+def test_max_concurrent(command, mock_sync_project_task):
+    ProjectFactory.create_batch(3)
+    execute_command(command, max_concurrent=1)
+    mock_sync_project_task.delay.assert_called_once()
+    assert len(mock_sync_project_task.delay.call_args.kwargs["next_project_pks"]) == 2
@@ -150,9 +150,9 @@ def test_kitchen_sink():
             )
         commit_msg: str = mock_vcs._calls[4][1][1]
         assert mock_vcs._calls == [
-            ("update", ("http://example.com/src-repo", src_root, "", False)),
+            ("update", ("http://example.com/src-repo", src_root, "", False, False)),
             ("revision", (src_root,)),
-            ("update", ("http://example.com/tgt-repo", tgt_root, "", False)),
+            ("update", ("http://example.com/tgt-repo", tgt_root, "", False, False)),
             ("revision", (tgt_root,)),
             (
                 "commit",
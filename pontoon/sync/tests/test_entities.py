@@ -91,6 +91,7 @@ def test_resource_obsoletion():
             changed=[],
             removed=[join("en-US", "c.ftl")],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -171,6 +172,7 @@ def test_resource_deobsoletion():
             changed=[join("en-US", "c.ftl")],
             removed=[],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -230,6 +232,7 @@ def test_rename_resource():
             changed=[],
             removed=[],
             renamed=[(join("en-US", "c.ftl"), join("en-US", "d.ftl"))],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -284,6 +287,7 @@ def test_add_resource():
             changed=[join("en-US", "c.ftl")],
             removed=[],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -343,6 +347,7 @@ def test_add_resource_with_comments():
             changed=[join("en-US", "c.ftl")],
             removed=[],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -419,6 +424,7 @@ def test_update_resource():
             changed=[join("en-US", "c.ftl")],
             removed=[],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -507,6 +513,7 @@ def test_change_entities():
             changed=[join("en-US", "res.ftl")],
             removed=[],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
@@ -583,6 +590,7 @@ def test_fluent_group_comment_change():
             changed=[join("en-US", "file.ftl")],
             removed=[],
             renamed=[],
+            sparse=False,
         )
         paths = find_paths(project, Checkouts(mock_checkout, mock_checkout))
 
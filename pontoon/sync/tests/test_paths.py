@@ -1,7 +1,7 @@
 from os.path import join
 from tempfile import TemporaryDirectory
 from textwrap import dedent
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 from pontoon.base.models import Project, Repository
 from pontoon.sync.core.checkout import Checkout, Checkouts
@@ -21,7 +21,10 @@ def test_no_config_one_repo():
         build_file_tree(root, tree)
         mock_project = Mock(Project, checkout_path=root, configuration_file=None)
         mock_checkout = Mock(
-            Checkout, path=join(root, "repo"), removed=[join("en-US", "missing.ftl")]
+            Checkout,
+            path=join(root, "repo"),
+            removed=[join("en-US", "missing.ftl")],
+            sparse=False,
         )
         paths = find_paths(mock_project, Checkouts(mock_checkout, mock_checkout))
         assert paths.ref_root == join(root, "repo", "en-US")
@@ -58,8 +61,8 @@ def test_no_config_two_repos():
         build_file_tree(root, tree)
         mock_project = Mock(Project, checkout_path=root, configuration_file=None)
         checkouts = Checkouts(
-            Mock(Checkout, path=join(root, "source"), removed=[]),
-            Mock(Checkout, path=join(root, "target")),
+            Mock(Checkout, path=join(root, "source"), removed=[], sparse=False),
+            Mock(Checkout, path=join(root, "target"), sparse=False),
         )
         paths = find_paths(mock_project, checkouts)
         assert paths.ref_root == join(root, "source")
@@ -97,7 +100,9 @@ def test_config_one_repo():
     with TemporaryDirectory() as root:
         build_file_tree(root, tree)
         mock_project = Mock(Project, checkout_path=root, configuration_file="l10n.toml")
-        mock_checkout = Mock(Checkout, path=join(root, "repo"), removed=[])
+        mock_checkout = Mock(
+            Checkout, path=join(root, "repo"), removed=[], sparse=False
+        )
         paths = find_paths(mock_project, Checkouts(mock_checkout, mock_checkout))
         assert paths.ref_root == join(root, "repo")
         assert paths.base == join(root, "repo")
@@ -136,11 +141,12 @@ def test_config_two_repos():
         build_file_tree(root, tree)
         mock_project = Mock(Project, checkout_path=root, configuration_file="l10n.toml")
         checkouts = Checkouts(
-            Mock(Checkout, path=join(root, "source"), removed=[]),
+            Mock(Checkout, path=join(root, "source"), removed=[], sparse=False),
             Mock(
                 Checkout,
                 path=join(root, "target"),
                 repo=Mock(Repository, checkout_path=join(root, "target")),
+                sparse=False,
             ),
         )
         paths = find_paths(mock_project, checkouts)
@@ -154,3 +160,94 @@ def test_config_two_repos():
             join(root, "source", "foo", "en", "foo.pot"),
             {"locale": "fr"},
         )
+
+
+def test_config_sparse_patterns():
+    tree: FileTree = {
+        "source": {
+            "bar": {"en": {"bar.ftl": ""}},
+            "foo": {"en": {"a": {"foo.ftl": ""}}},
+            "sub": {
+                "en": {"sub.ftl": ""},
+                "l10n.toml": dedent(
+                    """\
+                    [env]
+                        dir = "sub"
+                    [[paths]]
+                        reference = "en/*.ftl"
+                        l10n = "{l10n_base}/{dir}/{locale}/*.ftl"
+                    """
+                ),
+            },
+            "l10n.toml": dedent(
+                """\
+                [[includes]]
+                    path = "sub/l10n.toml"
+                [[paths]]
+                    reference = "bar/en/bar.ftl"
+                    l10n = "bar/{locale}/bar.ftl"
+                [[paths]]
+                    reference = "foo/en/**"
+                    l10n = "foo/{locale}/**"
+                """
+            ),
+        },
+        "target": {"bar": {"fr": {"bar.ftl": ""}}},
+    }
+    with TemporaryDirectory() as root:
+        build_file_tree(root, tree)
+        mock_project = Mock(Project, checkout_path=root, configuration_file="l10n.toml")
+        source = Mock(
+            Checkout,
+            path=join(root, "source"),
+            removed=[],
+            sparse=True,
+            sparse_patterns=[],
+        )
+        target = Mock(
+            Checkout,
+            path=join(root, "target"),
+            repo=Mock(Repository, checkout_path=join(root, "target")),
+            sparse=True,
+            sparse_patterns=[],
+        )
+        find_paths(mock_project, Checkouts(source, target))
+        ref_patterns = [
+            "/l10n.toml",
+            "/sub/l10n.toml",
+            "/bar/en/bar.ftl",
+            "/foo/en/**",
+            "/sub/en/*.ftl",
+        ]
+        assert source.set_sparse_patterns.call_args_list == [
+            call(ref_patterns),
+            call(ref_patterns),
+        ]
+        target.set_sparse_patterns.assert_called_once_with(
+            ["/bar/*/bar.ftl", "/foo/*/a/foo.ftl", "/sub/*/sub.ftl"]
+        )
+
+
+def test_no_config_sparse_patterns():
+    tree: FileTree = {
+        "repo": {
+            "en-US": {"bar.ftl": ""},
+            "locales": {"fr": {"bar.ftl": ""}},
+            "other": {"file.txt": ""},
+        }
+    }
+    with TemporaryDirectory() as root:
+        build_file_tree(root, tree)
+        mock_project = Mock(Project, checkout_path=root, configuration_file=None)
+        mock_checkout = Mock(
+            Checkout,
+            path=join(root, "repo"),
+            removed=[],
+            sparse=True,
+            sparse_patterns=[],
+        )
+        find_paths(mock_project, Checkouts(mock_checkout, mock_checkout))
+        assert mock_checkout.set_sparse_patterns.call_args_list == [
+            call(["/*"]),
+            call(["/en-US/", "/locales/"]),
+        ]
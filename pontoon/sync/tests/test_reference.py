@@ -0,0 +1,75 @@
+from os.path import join
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest.mock import patch
+
+from moz.l10n.formats import Format
+from moz.l10n.model import Metadata, PatternMessage
+from moz.l10n.resource import parse_resource, serialize_resource
+
+from pontoon.sync.core.reference import ReferenceCache
+from pontoon.sync.tests.utils import build_file_tree
+
+
+def test_reference_cache_parses_once():
+    with TemporaryDirectory() as root:
+        build_file_tree(root, {"a.properties": "key-0 = Message 0\n"})
+        ref_path = join(root, "a.properties")
+        cache = ReferenceCache()
+        with patch(
+            "pontoon.sync.core.reference.parse_resource", wraps=parse_resource
+        ) as mock_parse:
+            res_a = cache.get(ref_path)
+            res_b = cache.get(join(root, ".", "a.properties"))
+        assert mock_parse.call_count == 1
+        assert res_a == res_b
+        assert res_a is not res_b
+
+
+def test_reference_cache_clone_is_independent():
+    src = dedent(
+        """\
+        msgid ""
+        msgstr ""
+        "Language: en\\n"
+
+        msgid "Hello"
+        msgstr ""
+
+        msgid "One file"
+        msgid_plural "%d files"
+        msgstr[0] ""
+        msgstr[1] ""
+        """
+    )
+    with TemporaryDirectory() as root:
+        build_file_tree(root, {"a.pot": src})
+        ref_path = join(root, "a.pot")
+        cache = ReferenceCache()
+        orig = "".join(serialize_resource(cache.get(ref_path)))
+
+        res = cache.get(ref_path)
+        res.meta = []
+        section = res.sections[0]
+        section.meta.append(Metadata("x", "y"))
+        hello, plural = section.entries
+        hello.value = PatternMessage(["Bonjour"])
+        hello.meta.insert(0, Metadata("flag", "fuzzy"))
+        plural.value.variants = {}
+        section.entries = []
+
+        assert "".join(serialize_resource(cache.get(ref_path))) == orig
+
+
+def test_reference_cache_add():
+    cache = ReferenceCache()
+    ftl = parse_resource(Format.fluent, "key = Message\n")
+    cache.add("/repo/en-US/a.ftl", ftl)
+    assert cache.get("/repo/en-US/./a.ftl") == ftl
+
+    # Gettext resources depend on their parse options, so they're not reused.
+    po = parse_resource(Format.gettext, 'msgid "x"\nmsgstr ""\n')
+    cache.add("/repo/en-US/b.pot", po)
+    with patch("pontoon.sync.core.reference.parse_resource") as mock_parse:
+        cache.get("/repo/en-US/b.pot")
+    assert mock_parse.call_count == 1
@@ -93,3 +93,48 @@ def test_changed_files_error(mock_popen, repo_type):
     mock_popen.return_value = Mock(**attrs)
     assert get_repo(repo_type).changed_files("path", "1") is None
     assert mock_popen.called
+
+
+GIT_DIFF = dedent(
+    """\
+    diff --git a/fr/a.ftl b/fr/a.ftl
+    index 1111111..2222222 100644
+    --- a/fr/a.ftl
+    +++ b/fr/a.ftl
+    @@ -2 +2 @@ key-0 = Zero
+    -key-1 = One
+    +key-1 = Uno
+    @@ -5,2 +4,0 @@ key-2 = Two
+    -key-3 = Three
+    -+++ b/fr/b.ftl
+    @@ -9,0 +8,2 @@ key-4 = Four
+    +key-5 = Five
+    +key-6 = Six
+    diff --git a/fr/c.ftl b/fr/c.ftl
+    deleted file mode 100644
+    index 3333333..0000000
+    --- a/fr/c.ftl
+    +++ /dev/null
+    @@ -1 +0,0 @@
+    -key = Value
+    """
+).encode()
+
+
+@pytest.mark.parametrize("repo_type", ["git", "hg"])
+@patch("subprocess.Popen")
+def test_changed_lines(mock_popen, repo_type):
+    attrs = {"communicate.return_value": (GIT_DIFF, None), "returncode": 0}
+    mock_popen.return_value = Mock(**attrs)
+    assert get_repo(repo_type).changed_lines("/path", "1") == {
+        "fr/a.ftl": [(2, 3), (4, 6), (8, 10)]
+    }
+    assert mock_popen.called
+
+
+@pytest.mark.parametrize("repo_type", ["git", "hg"])
+@patch("subprocess.Popen")
+def test_changed_lines_error(mock_popen, repo_type):
+    attrs = {"communicate.return_value": (b"", None), "returncode": 1}
+    mock_popen.return_value = Mock(**attrs)
+    assert get_repo(repo_type).changed_lines("path", "1") is None
@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+import pytest
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from pontoon.sync.models import Sync
+from pontoon.sync.schedule import (
+    acquire_sync_locks,
+    needs_full_compare,
+    release_sync_locks,
+    schedule_syncs,
+    sync_lock_names,
+)
+from pontoon.test.factories import (
+    ChangedEntityLocaleFactory,
+    EntityFactory,
+    ProjectFactory,
+    RepositoryFactory,
+    ResourceFactory,
+)
+
+
+def create_sync(project, minutes, status=Sync.Status.DONE):
+    start = timezone.now() - timedelta(hours=1)
+    return Sync.objects.create(
+        project=project,
+        status=status,
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+    )
+
+
+@pytest.mark.django_db
+def test_sync_lock_names_shared_repo():
+    project_a = ProjectFactory.create()
+    project_b = ProjectFactory.create(repositories=[])
+    RepositoryFactory.create(project=project_b, url=project_a.repositories.get().url)
+    project_c = ProjectFactory.create()
+
+    locks_a = set(sync_lock_names(project_a))
+    assert locks_a & set(sync_lock_names(project_b))
+    assert not locks_a & set(sync_lock_names(project_c))
+
+    cache.clear()
+    assert acquire_sync_locks(sync_lock_names(project_a), 60)
+    assert not acquire_sync_locks(sync_lock_names(project_b), 60)
+    assert acquire_sync_locks(sync_lock_names(project_c), 60)
+    release_sync_locks(sync_lock_names(project_a))
+    assert acquire_sync_locks(sync_lock_names(project_b), 60)
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_schedule_order():
+    slow, fast, new, busy = ProjectFactory.create_batch(4)
+    create_sync(slow, 30)
+    create_sync(fast, 1)
+    create_sync(busy, 1)
+    entity = EntityFactory.create(resource=ResourceFactory.create(project=busy))
+    ChangedEntityLocaleFactory.create(entity=entity)
+
+    projects = [fast, new, busy, slow]
+    lanes = schedule_syncs(projects, 0)
+    assert lanes == [[slow.pk], [new.pk], [busy.pk], [fast.pk]]
+
+    lanes = schedule_syncs(projects, 2)
+    assert lanes == [[slow.pk], [new.pk, busy.pk, fast.pk]]
+
+
+@pytest.mark.django_db
+def test_schedule_ignores_unsuccessful_syncs():
+    project_a, project_b = ProjectFactory.create_batch(2)
+    create_sync(project_a, 30)
+    create_sync(project_b, 20)
+    # Later syncs that were skipped or failed early
+    create_sync(project_a, 0, Sync.Status.PREV_BUSY)
+    create_sync(project_a, 1, Sync.Status.FAIL)
+
+    lanes = schedule_syncs([project_a, project_b], 0)
+    assert lanes == [[project_a.pk], [project_b.pk]]
+
+
+@pytest.mark.django_db
+def test_needs_full_compare(settings):
+    settings.SYNC_FULL_COMPARE_INTERVAL = 3
+    project = ProjectFactory.create()
+    assert needs_full_compare(project)
+
+    create_sync(project, 1)
+    create_sync(project, 1, Sync.Status.NO_CHANGES)
+    assert not needs_full_compare(project)
+
+    # Unsuccessful syncs are not counted
+    create_sync(project, 1, Sync.Status.FAIL)
+    assert not needs_full_compare(project)
+
+    create_sync(project, 1, Sync.Status.NO_COMMIT)
+    assert needs_full_compare(project)
+
+    settings.SYNC_FULL_COMPARE_INTERVAL = 0
+    assert not needs_full_compare(project)
+
+
+@pytest.mark.django_db
+def test_schedule_shared_repo():
+    project_a, project_b, project_c = ProjectFactory.create_batch(3)
+    RepositoryFactory.create(project=project_c, url=project_a.repositories.get().url)
+    create_sync(project_a, 5)
+    create_sync(project_b, 8)
+    create_sync(project_c, 10)
+
+    lanes = schedule_syncs([project_a, project_b, project_c], 0)
+    assert lanes == [[project_c.pk, project_a.pk], [project_b.pk]]
@@ -0,0 +1,183 @@
+import pytest
+
+from pontoon.base.models import ProjectLocale, Resource, TranslatedResource
+from pontoon.sync.core.stats import (
+    count_project_locale_stats_drift,
+    update_scoped_stats,
+    update_stats,
+)
+from pontoon.test.factories import (
+    EntityFactory,
+    ErrorFactory,
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+    WarningFactory,
+)
+
+
+def tr_stats(project):
+    return {
+        (tr.resource.path, tr.locale.code): (
+            tr.total_strings,
+            tr.approved_strings,
+            tr.unreviewed_strings,
+        )
+        for tr in TranslatedResource.objects.filter(
+            resource__project=project
+        ).select_related("resource", "locale")
+    }
+
+
+@pytest.mark.django_db
+def test_scoped_stats():
+    locale_de = LocaleFactory.create(code="de-Test")
+    locale_fr = LocaleFactory.create(code="fr-Test")
+    project = ProjectFactory.create(locales=[locale_de, locale_fr])
+    res_a = ResourceFactory.create(project=project, path="a.ftl")
+    res_b = ResourceFactory.create(project=project, path="b.ftl")
+    for res in [res_a, res_b]:
+        for locale in [locale_de, locale_fr]:
+            TranslatedResourceFactory.create(resource=res, locale=locale)
+        for i in range(2):
+            entity = EntityFactory.create(resource=res, key=[f"key-{i}"])
+            for locale in [locale_de, locale_fr]:
+                TranslationFactory.create(entity=entity, locale=locale, approved=i == 0)
+                TranslationFactory.create(entity=entity, locale=locale)
+    update_stats(project)
+    assert tr_stats(project) == {
+        (path, locale): (2, 1, 3)
+        for path in ["a.ftl", "b.ftl"]
+        for locale in ["de-Test", "fr-Test"]
+    }
+
+    # Make all stats outdated
+    EntityFactory.create(resource=res_a, key=["key-2"])
+    EntityFactory.create(resource=res_b, key=["key-2"])
+    TranslatedResource.objects.filter(resource__project=project).update(
+        approved_strings=0
+    )
+    locale_it = LocaleFactory.create(code="it-Test")
+    TranslatedResourceFactory.create(resource=res_b, locale=locale_it)
+
+    update_scoped_stats(project, [res_a.pk], {(res_b.pk, locale_de.pk)})
+    assert Resource.objects.get(pk=res_a.pk).total_strings == 3
+    assert Resource.objects.get(pk=res_b.pk).total_strings == 2
+    assert tr_stats(project) == {
+        # Changed resource
+        ("a.ftl", "de-Test"): (3, 1, 3),
+        ("a.ftl", "fr-Test"): (3, 1, 3),
+        # Changed translated resource
+        ("b.ftl", "de-Test"): (2, 1, 3),
+        # Unchanged
+        ("b.ftl", "fr-Test"): (2, 0, 3),
+        # Added translated resource
+        ("b.ftl", "it-Test"): (2, 0, 0),
+    }
+
+    # Only the given resources are updated, without their project locales
+    TranslatedResource.objects.filter(resource__project=project).update(
+        total_strings=0, approved_strings=0
+    )
+    ProjectLocale.objects.filter(project=project).update(approved_strings=0)
+    update_scoped_stats(
+        project,
+        [res_a.pk],
+        [],
+        include_outdated=False,
+        update_project_locales=False,
+    )
+    assert tr_stats(project) == {
+        ("a.ftl", "de-Test"): (3, 1, 3),
+        ("a.ftl", "fr-Test"): (3, 1, 3),
+        ("b.ftl", "de-Test"): (0, 0, 3),
+        ("b.ftl", "fr-Test"): (0, 0, 3),
+        ("b.ftl", "it-Test"): (0, 0, 0),
+    }
+    assert not ProjectLocale.objects.filter(
+        project=project, approved_strings__gt=0
+    ).exists()
+
+
+@pytest.mark.django_db
+def test_stats_failed_checks():
+    locale = LocaleFactory.create(code="de-Test")
+    project = ProjectFactory.create(locales=[locale])
+    res = ResourceFactory.create(project=project, path="a.ftl")
+    tr = TranslatedResourceFactory.create(resource=res, locale=locale)
+    translations = [
+        TranslationFactory.create(
+            entity=EntityFactory.create(resource=res, key=[f"key-{i}"]),
+            locale=locale,
+            approved=True,
+        )
+        for i in range(3)
+    ]
+    for message in ["Error 1", "Error 2"]:
+        ErrorFactory.create(translation=translations[0], message=message)
+    WarningFactory.create(translation=translations[0], message="Warning")
+    WarningFactory.create(translation=translations[1], message="Warning")
+
+    expected = (3, 1, 1, 2)
+    update_stats(project)
+    tr.refresh_from_db()
+    assert (
+        tr.total_strings,
+        tr.approved_strings,
+        tr.strings_with_errors,
+        tr.strings_with_warnings,
+    ) == expected
+
+    TranslatedResource.objects.filter(pk=tr.pk).update(
+        approved_strings=0, strings_with_errors=0, strings_with_warnings=0
+    )
+    update_scoped_stats(project, [], {(res.pk, locale.pk)})
+    tr.refresh_from_db()
+    assert (
+        tr.total_strings,
+        tr.approved_strings,
+        tr.strings_with_errors,
+        tr.strings_with_warnings,
+    ) == expected
+
+    tr.calculate_stats()
+    assert (
+        tr.total_strings,
+        tr.approved_strings,
+        tr.strings_with_errors,
+        tr.strings_with_warnings,
+    ) == expected
+
+
+@pytest.mark.django_db
+def test_project_locale_stats():
+    locale_de = LocaleFactory.create(code="de-Test")
+    locale_fr = LocaleFactory.create(code="fr-Test")
+    project = ProjectFactory.create(locales=[locale_de, locale_fr])
+    for path in ["a.ftl", "b.ftl"]:
+        res = ResourceFactory.create(project=project, path=path)
+        for locale in [locale_de, locale_fr]:
+            TranslatedResourceFactory.create(resource=res, locale=locale)
+        entity = EntityFactory.create(resource=res, key=["key"])
+        TranslationFactory.create(entity=entity, locale=locale_de, approved=True)
+
+    def pl_stats():
+        return {
+            pl.locale.code: (pl.total_strings, pl.approved_strings)
+            for pl in ProjectLocale.objects.filter(project=project)
+        }
+
+    ProjectLocale.objects.filter(project=project).update(approved_strings=5)
+    assert count_project_locale_stats_drift(project) == 2
+    update_stats(project)
+    assert count_project_locale_stats_drift(project) == 0
+    assert pl_stats() == {"de-Test": (2, 2), "fr-Test": (2, 0)}
+
+    # Only the project locales of updated translated resources are updated
+    ProjectLocale.objects.filter(project=project).update(approved_strings=1)
+    res_a = Resource.objects.get(project=project, path="a.ftl")
+    update_scoped_stats(project, [], {(res_a.pk, locale_fr.pk)})
+    assert pl_stats() == {"de-Test": (2, 1), "fr-Test": (2, 0)}
+    assert count_project_locale_stats_drift(project) == 1
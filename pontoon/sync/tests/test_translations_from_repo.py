@@ -3,7 +3,7 @@ from os.path import join
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 from typing import Any, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -21,7 +21,12 @@ from pontoon.base.models import (
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import find_paths
 from pontoon.sync.core.stats import update_stats
-from pontoon.sync.core.translations_from_repo import sync_translations_from_repo
+from pontoon.sync.core.translations_from_repo import (
+    find_db_updates,
+    find_matching_suggestions,
+    find_translations_to_reject,
+    sync_translations_from_repo,
+)
 from pontoon.sync.tests.utils import build_file_tree
 from pontoon.test.factories import (
     EntityFactory,
@@ -107,15 +112,20 @@ def test_update_ftl_translations():
             path=repo.checkout_path,
             changed=[join("fr-Test", "c.ftl")],
             removed=[],
+            changed_lines=Mock(return_value=None),
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
-            project, locale_map, checkouts, paths, cast(Any, []), now
+        removed_resources, updated_translations, updated_tr_keys = (
+            sync_translations_from_repo(
+                project, locale_map, checkouts, paths, cast(Any, []), now
+            )
         )
         assert (removed_resources, updated_translations) == (0, 3)
+        assert updated_tr_keys == {(res["c"].pk, locale.pk)}
         translations = Translation.objects.filter(
             entity__resource=res["c"], locale=locale
         )
@@ -238,12 +248,14 @@ def test_android_translation_changes():
             path=repo.checkout_path,
             changed=[join("fr-Test", "strings.xml")],
             removed=[],
+            changed_lines=Mock(return_value=None),
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
             project, locale_map, checkouts, paths, cast(Any, []), now
         )
         assert (removed_resources, updated_translations) == (0, 2)
@@ -331,12 +343,14 @@ def test_ini_translations():
             path=repo.checkout_path,
             changed=[join("fr-Test", "file.ini")],
             removed=[],
+            changed_lines=Mock(return_value=None),
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
             project, locale_map, checkouts, paths, cast(Any, []), now
         )
         assert (removed_resources, updated_translations) == (0, 0)
@@ -398,12 +412,14 @@ def test_remove_po_target_resource():
             path=repo.checkout_path,
             changed=[],
             removed=[join("fr-Test", "b.po")],
+            changed_lines=Mock(return_value=None),
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
             project, locale_map, checkouts, paths, cast(Any, []), now
         )
         assert (removed_resources, updated_translations) == (1, 0)
@@ -418,3 +434,145 @@ def test_remove_po_target_resource():
         update_stats(project)
         project.refresh_from_db()
         assert (project.total_strings, project.approved_strings) == (6, 6)
+
+
+@pytest.mark.django_db
+def test_update_from_diff():
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        locale_map = {locale.code: locale}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-update-diff",
+            locales=[locale],
+            repositories=[repo],
+            visibility="public",
+        )
+        res = ResourceFactory.create(
+            project=project, path="a.ftl", format="fluent", total_strings=4
+        )
+        TranslatedResourceFactory.create(locale=locale, resource=res, total_strings=4)
+        entities = {}
+        for i in range(4):
+            key = f"key-{i}"
+            entities[key] = EntityFactory.create(
+                resource=res, string=f"{key} = Message {i}\n", key=[key]
+            )
+            TranslationFactory.create(
+                entity=entities[key],
+                locale=locale,
+                string=f"{key} = Translation {i}\n",
+                active=True,
+                approved=True,
+            )
+
+        # Filesystem setup
+        a_ftl = dedent(
+            """\
+            key-0 = Translation 0
+            key-1 = Changed 1
+            key-2 = Other 2
+            """
+        )
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": {"a.ftl": ""}, "fr-Test": {"a.ftl": a_ftl}},
+        )
+        target_path = join(repo.checkout_path, "fr-Test", "a.ftl")
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            changed=[join("fr-Test", "a.ftl")],
+            removed=[],
+            sparse=False,
+        )
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        # Without a diff, all differences are found
+        updates = find_db_updates(project, locale_map, [target_path], paths, [])
+        assert updates is not None
+        assert {
+            entity_id: rt and rt.string for (entity_id, _), rt in updates.items()
+        } == {
+            entities["key-1"].pk: "key-1 = Changed 1\n",
+            entities["key-2"].pk: "key-2 = Other 2\n",
+            entities["key-3"].pk: None,
+        }
+
+        # With a diff, only changed & removed entries are found
+        updates = find_db_updates(
+            project, locale_map, [target_path], paths, [], {target_path: [(2, 3)]}
+        )
+        assert updates is not None
+        assert {
+            entity_id: rt and rt.string for (entity_id, _), rt in updates.items()
+        } == {
+            entities["key-1"].pk: "key-1 = Changed 1\n",
+            entities["key-3"].pk: None,
+        }
+
+        # Entities added or changed in this sync may have unchanged translations
+        updates = find_db_updates(
+            project,
+            locale_map,
+            [target_path],
+            paths,
+            [],
+            {target_path: [(2, 3)]},
+            {"a.ftl"},
+        )
+        assert updates is not None
+        assert {
+            entity_id: rt and rt.string for (entity_id, _), rt in updates.items()
+        } == {
+            entities["key-1"].pk: "key-1 = Changed 1\n",
+            entities["key-2"].pk: "key-2 = Other 2\n",
+            entities["key-3"].pk: None,
+        }
+
+        # A full comparison does not use the diff
+        mock_checkout.changed_lines.return_value = {join("fr-Test", "a.ftl"): [(2, 3)]}
+        sync_translations_from_repo(
+            project, locale_map, checkouts, paths, [], now, full_compare=True
+        )
+        mock_checkout.changed_lines.assert_not_called()
+        active = Translation.objects.get(entity=entities["key-2"], active=True)
+        assert active.string == "key-2 = Other 2\n"
+
+
+@pytest.mark.django_db
+def test_bulk_translation_queries():
+    locale = LocaleFactory.create(code="fr-Test")
+    entities = EntityFactory.create_batch(5)
+    approved = [
+        TranslationFactory.create(
+            entity=entity, locale=locale, string="Old", approved=True
+        )
+        for entity in entities
+    ]
+    suggestions = [
+        TranslationFactory.create(entity=entity, locale=locale, string=f"New {i}")
+        for i, entity in enumerate(entities)
+    ]
+
+    with patch("pontoon.sync.core.translations_from_repo.BULK_CHUNK_SIZE", 2):
+        found = find_matching_suggestions(
+            [(entity.pk, locale.pk, f"New {i}") for i, entity in enumerate(entities)]
+            + [(entities[0].pk, locale.pk, "Old"), (entities[0].pk, locale.pk, "X")]
+        )
+        assert sorted(tx.pk for tx in found) == [tx.pk for tx in suggestions]
+
+        reject = find_translations_to_reject(
+            [
+                (entity.pk, locale.pk, suggestions[i].pk)
+                for i, entity in enumerate(entities[:3])
+            ]
+            + [(entities[3].pk, locale.pk, None)]
+        )
+        assert sorted(reject) == [tx.pk for tx in approved[:4]] + [suggestions[3].pk]
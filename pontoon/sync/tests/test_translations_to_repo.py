@@ -3,17 +3,20 @@ from os.path import dirname, exists, join
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 from typing import Any, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from django.conf import settings
 from django.utils import timezone
 
-from pontoon.base.models import ChangedEntityLocale
+from pontoon.base.models import ChangedEntityLocale, TranslatedResource
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import find_paths
-from pontoon.sync.core.translations_to_repo import sync_translations_to_repo
+from pontoon.sync.core.translations_to_repo import (
+    sync_translations_to_repo,
+    update_changed_resources,
+)
 from pontoon.sync.tests.utils import build_file_tree
 from pontoon.test.factories import (
     EntityFactory,
@@ -65,6 +68,7 @@ def test_remove_resource():
             path=repo.checkout_path,
             changed=[],
             removed=[join("en-US", "c.ftl")],
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
@@ -148,6 +152,7 @@ def test_remove_entity():
             path=repo.checkout_path,
             changed=[join("en-US", "c.ftl")],
             removed=[],
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
@@ -271,6 +276,7 @@ def test_add_translation():
             path=repo.checkout_path,
             changed=[join("en-US", "c.ftl")],
             removed=[],
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
@@ -344,6 +350,7 @@ def test_directory_creation_on_translation_update():
             path=repo.checkout_path,
             changed=[join("en-US", "nested_dir", "deeper_dir", "c.ftl")],
             removed=[],
+            sparse=False,
         )
         checkouts = Checkouts(mock_checkout, mock_checkout)
         paths = find_paths(project, checkouts)
@@ -369,3 +376,157 @@ def test_directory_creation_on_translation_update():
         assert exists(target_path), (
             "Expected translated file to be created in nested directories."
         )
+
+
+@pytest.mark.django_db
+def test_update_with_file_workers():
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locales = [
+            LocaleFactory.create(code=f"{lang}-Test") for lang in ("de", "fr", "it")
+        ]
+        locale_map = {locale.code: locale for locale in locales}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-file-workers",
+            locales=locales,
+            repositories=[repo],
+        )
+        res = ResourceFactory.create(project=project, path="a.ftl", format="fluent")
+        entity = EntityFactory.create(
+            resource=res, key=["key-0"], string="key-0 = Message 0\n"
+        )
+        for i, locale in enumerate(locales):
+            TranslatedResourceFactory.create(
+                locale=locale, resource=res, total_strings=1
+            )
+            TranslationFactory.create(
+                entity=entity,
+                locale=locale,
+                string=f"key-0 = Translation {i}\n",
+                active=True,
+                approved=True,
+            )
+
+        # Filesystem setup
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": {"a.ftl": "key-0 = Message 0\n"}}
+            | {locale.code: {"a.ftl": ""} for locale in locales},
+        )
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            changed=[join("en-US", "a.ftl")],
+            removed=[],
+            sparse=False,
+        )
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        # Test
+        settings.SYNC_FILE_WORKERS = 2
+        try:
+            count, updated_locales, _, _ = update_changed_resources(
+                project, paths, locale_map, [], [], {"a.ftl"}, now
+            )
+        finally:
+            settings.SYNC_FILE_WORKERS = 0
+        assert count == 3
+        assert updated_locales == set(locales)
+        for i, locale in enumerate(locales):
+            with open(join(repo.checkout_path, locale.code, "a.ftl")) as file:
+                assert file.read() == f"key-0 = Translation {i}\n"
+
+
+@pytest.mark.django_db
+def test_skip_unchanged_target_files():
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locales = [LocaleFactory.create(code=f"{lang}-Test") for lang in ("de", "fr")]
+        locale_map = {locale.code: locale for locale in locales}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-skip-unchanged",
+            locales=locales,
+            repositories=[repo],
+        )
+        res = ResourceFactory.create(project=project, path="a.ftl", format="fluent")
+        entity = EntityFactory.create(
+            resource=res, key=["key-0"], string="key-0 = Message 0\n"
+        )
+        for i, locale in enumerate(locales):
+            TranslatedResourceFactory.create(
+                locale=locale, resource=res, total_strings=1
+            )
+            TranslationFactory.create(
+                entity=entity,
+                locale=locale,
+                string=f"key-0 = Translation {i}\n",
+                active=True,
+                approved=True,
+            )
+
+        # Filesystem setup
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": {"a.ftl": "key-0 = Message 0\n"}}
+            | {locale.code: {"a.ftl": ""} for locale in locales},
+        )
+        de_path = join(repo.checkout_path, "de-Test", "a.ftl")
+        fr_path = join(repo.checkout_path, "fr-Test", "a.ftl")
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            repo=repo,
+            url=repo.url,
+            changed=[join("en-US", "a.ftl")],
+            removed=[],
+            sparse=False,
+        )
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        def sync():
+            with patch("pontoon.sync.core.translations_to_repo.get_repo"):
+                return sync_translations_to_repo(
+                    project,
+                    True,
+                    locale_map,
+                    checkouts,
+                    paths,
+                    cast(Any, []),
+                    {"a.ftl"},
+                    set(),
+                    now,
+                )
+
+        # Test
+        assert sync()
+        with open(de_path) as file:
+            assert file.read() == "key-0 = Translation 0\n"
+        assert not TranslatedResource.objects.filter(resource=res, sync_digest="")
+
+        # Nothing has changed
+        assert not sync()
+
+        # The target file is modified outside of Pontoon
+        with open(de_path, "w") as file:
+            file.write("key-0 = Other\n")
+        count, updated_locales, _, _ = update_changed_resources(
+            project, paths, locale_map, [], [], {"a.ftl"}, now
+        )
+        assert count == 1
+        assert updated_locales == {locales[0]}
+        with open(de_path) as file:
+            assert file.read() == "key-0 = Translation 0\n"
+        with open(fr_path) as file:
+            assert file.read() == "key-0 = Translation 1\n"
@@ -39,7 +39,6 @@ from pontoon.base.aggregated_stats import get_top_instances
 from pontoon.base.models import (
     Locale,
     Project,
-    TranslatedResource,
     TranslationMemoryEntry,
     User,
 )
@@ -83,7 +82,7 @@ def teams(request):
         "teams/teams.html",
         {
             "locales": locales,
-            "all_locales_stats": TranslatedResource.objects.string_stats(),
+            "all_locales_stats": ProjectLocale.objects.string_stats(),
             "locale_stats": locale_stats,
             "form": form,
             "top_instances": get_top_instances(locales, locale_stats),
@@ -101,7 +100,7 @@ def team(request, locale):
     if not visible_count:
         raise Http404
 
-    locale_stats = TranslatedResource.objects.filter(locale=locale).string_stats(
+    locale_stats = ProjectLocale.objects.filter(locale=locale).string_stats(
         request.user
     )
 
@@ -1,6 +1,11 @@
 import re
 
-from django.db import models
+from collections.abc import Iterable, Mapping
+from typing import TypeVar
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import models, transaction
 
 from pontoon.base.models import Entity, Resource, TranslatedResource
 
@@ -21,19 +26,120 @@ def update_terminology_project_stats():
     TranslatedResource.objects.filter(resource=resource).calculate_stats()
 
 
+word_boundary = re.compile(r"\b")
+
+TERM_INDEX_VERSION_KEY = "terminology_term_index_version"
+
+K = TypeVar("K")
+
+
+class TermIndex:
+    """
+    Finds the terms that occur in a string, starting at a word boundary.
+
+    Rather than searching for each term separately,
+    the term texts are stored in a case-sensitive and a case-insensitive trie,
+    which are walked from each word boundary of the string.
+    """
+
+    def __init__(self, terms: Iterable[tuple[int, str, bool]]):
+        """
+        :param terms: The `(pk, text, case_sensitive)` of each term.
+        """
+        self.case_sensitive: dict = {}
+        self.case_insensitive: dict = {}
+        for pk, text, case_sensitive in terms:
+            node = self.case_sensitive if case_sensitive else self.case_insensitive
+            for ch in text if case_sensitive else text.lower():
+                node = node.setdefault(ch, {})
+            # The empty key is never a character, so it marks the end of a term.
+            node.setdefault("", []).append(pk)
+
+    def match(self, string: str) -> set[int]:
+        """The pks of the terms that occur in `string`."""
+        pks: set[int] = set()
+        for boundary in word_boundary.finditer(string):
+            start = boundary.start()
+            self._walk(self.case_sensitive, string, start, pks, ignore_case=False)
+            self._walk(self.case_insensitive, string, start, pks, ignore_case=True)
+        return pks
+
+    @staticmethod
+    def _walk(node: dict, string: str, start: int, pks: set[int], ignore_case: bool):
+        for pos in range(start, len(string) + 1):
+            if "" in node:
+                pks.update(node[""])
+            if pos == len(string):
+                return
+            for ch in string[pos].lower() if ignore_case else string[pos]:
+                node = node.get(ch)
+                if node is None:
+                    return
+
+
+_term_index: tuple[str, TermIndex] | None = None
+
+
+def get_term_index() -> TermIndex:
+    """
+    The index of all localizable terms.
+
+    The index is kept in memory, and rebuilt when its version in the cache changes.
+    """
+    global _term_index
+    version = cache.get(TERM_INDEX_VERSION_KEY)
+    if version is None:
+        cache.add(TERM_INDEX_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(TERM_INDEX_VERSION_KEY)
+    if _term_index is None or _term_index[0] != version:
+        terms = (
+            Term.objects.exclude(definition="")
+            .exclude(forbidden=True)
+            .values_list("pk", "text", "case_sensitive")
+        )
+        _term_index = (version, TermIndex(terms))
+    return _term_index[1]
+
+
+def invalidate_term_index():
+    """
+    Make all processes rebuild their term index.
+
+    Called once the transaction changing the terms is committed,
+    so that the index is not rebuilt from the previous terms.
+    """
+    cache.set(TERM_INDEX_VERSION_KEY, uuid4().hex, timeout=None)
+
+
 class TermQuerySet(models.QuerySet["Term"]):
     def for_string(self, string):
-        terms = []
-        available_terms = self.exclude(definition="").exclude(forbidden=True)
+        """
+        The available terms that occur in `string`, with their translations.
+        """
+        return self.for_strings({0: string})[0]
 
-        for term in available_terms:
-            term_text = r"\b" + re.escape(term.text)
-            flags = 0 if term.case_sensitive else re.IGNORECASE
+    def for_strings(self, strings: Mapping[K, str]) -> dict[K, list["Term"]]:
+        """
+        The available terms that occur in each of `strings`, with their translations.
 
-            if re.search(term_text, string, flags):
-                terms.append(term)
+        The terms of all the strings are retrieved with a single query.
+        """
+        index = get_term_index()
+        matches = {key: index.match(string) for key, string in strings.items()}
+        terms = (
+            self.filter(pk__in=set().union(*matches.values()))
+            .exclude(definition="")
+            .exclude(forbidden=True)
+            .prefetch_related("translations")
+        )
+        if not terms.ordered:
+            terms = terms.order_by("pk")
 
-        return terms
+        terms = list(terms)
+        return {
+            key: [term for term in terms if term.pk in pks]
+            for key, pks in matches.items()
+        }
 
     def delete(self, *args, **kwargs):
         """
@@ -44,6 +150,7 @@ class TermQuerySet(models.QuerySet["Term"]):
         update_terminology_project_stats()
 
         super().delete(*args, **kwargs)
+        transaction.on_commit(invalidate_term_index)
 
 
 class Term(models.Model):
@@ -91,12 +198,27 @@ class Term(models.Model):
         """
         if self.do_not_translate:
             return self.text
+        elif "translations" in getattr(self, "_prefetched_objects_cache", {}):
+            return next(
+                (t.text for t in self.translations.all() if t.locale_id == locale.pk),
+                None,
+            )
         else:
             try:
                 return self.translations.get(locale=locale).text
             except (AttributeError, TermTranslation.DoesNotExist):
                 return None
 
+    def serialize(self, locale):
+        return {
+            "text": self.text,
+            "part_of_speech": self.part_of_speech,
+            "definition": self.definition,
+            "usage": self.usage,
+            "translation": self.translation(locale),
+            "entity_id": self.entity_id,
+        }
+
     @property
     def localizable(self):
         """
@@ -230,6 +352,7 @@ class Term(models.Model):
             self.handle_term_update()
 
         super().save(*args, **kwargs)
+        transaction.on_commit(invalidate_term_index)
 
         if created and self.localizable:
             self.handle_term_create()
@@ -242,6 +365,7 @@ class Term(models.Model):
         update_terminology_project_stats()
 
         super().delete(*args, **kwargs)
+        transaction.on_commit(invalidate_term_index)
 
     def __str__(self):
         return self.text
@@ -2,27 +2,30 @@ from unittest.mock import patch
 
 import pytest
 
-from pontoon.terminology.models import Term
+from django.db import transaction
+
+from pontoon.terminology.models import Term, TermIndex
 from pontoon.test.factories import EntityFactory, TermFactory, TermTranslationFactory
 
 
 @pytest.fixture
 @patch("pontoon.terminology.models.update_terminology_project_stats")
-def available_terms(_):
+def available_terms(_, django_capture_on_commit_callbacks):
     """This fixture provides:
 
     - 4 generic terms
     - 6 terms to be used for matching in strings
     """
-    for i in range(0, 4):
-        TermFactory.create(text=f"term{i}")
+    with django_capture_on_commit_callbacks(execute=True):
+        for i in range(0, 4):
+            TermFactory.create(text=f"term{i}")
 
-    TermFactory.create(text="abnormality")
-    TermFactory.create(text="student ambassador")
-    TermFactory.create(text="track")
-    TermFactory.create(text="sensitive")
-    TermFactory.create(text="surf")
-    TermFactory.create(text="Channel", case_sensitive=True)
+        TermFactory.create(text="abnormality")
+        TermFactory.create(text="student ambassador")
+        TermFactory.create(text="track")
+        TermFactory.create(text="sensitive")
+        TermFactory.create(text="surf")
+        TermFactory.create(text="Channel", case_sensitive=True)
 
 
 @pytest.fixture
@@ -72,6 +75,125 @@ def test_terms_for_string(string, found_terms, available_terms):
         assert term.text == found_terms[i]
 
 
+def test_term_index():
+    index = TermIndex(
+        [
+            (1, "track", False),
+            (2, "Channel", True),
+            (3, "student ambassador", False),
+            (4, "student", False),
+            (5, ".NET", True),
+        ]
+    )
+    # Terms start at a word boundary, and may be followed by other characters
+    assert index.match("Tracks you around the web") == {1}
+    assert index.match("Sidetrack") == set()
+    assert index.match("Release Channel, not channel") == {2}
+    assert index.match("release channel") == set()
+    assert index.match("Student ambassadors") == {3, 4}
+    assert index.match("ASP.NET") == {5}
+    assert index.match("") == set()
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_changes(
+    _, available_terms, django_capture_on_commit_callbacks
+):
+    """
+    The terms found in strings are updated when terms change.
+    """
+    string = "Welcome to the new tab page"
+    assert Term.objects.for_string(string) == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        term = TermFactory.create(text="new tab")
+    assert Term.objects.for_string(string) == [term]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        term.forbidden = True
+        term.save()
+    assert Term.objects.for_string(string) == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        term.forbidden = False
+        term.text = "tab page"
+        term.save()
+    assert Term.objects.for_string(string) == [term]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Term.objects.filter(pk=term.pk).delete()
+    assert Term.objects.for_string(string) == []
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_after_commit(
+    _, available_terms, django_capture_on_commit_callbacks
+):
+    """
+    The term index is only rebuilt once a transaction changing terms is committed.
+    """
+    string = "Welcome to the new tab page"
+    assert Term.objects.for_string(string) == []
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with transaction.atomic():
+            term = TermFactory.create(text="new tab")
+        # Not yet committed
+        assert Term.objects.for_string(string) == []
+
+    for callback in callbacks:
+        callback()
+    assert Term.objects.for_string(string) == [term]
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_translations(
+    _, available_terms, locale_a, locale_b, django_assert_num_queries
+):
+    """
+    The translations of the found terms are fetched with a single query.
+    """
+    for term in Term.objects.filter(text__in=["sensitive", "surf"]):
+        TermTranslationFactory.create(locale=locale_a, term=term, text=f"{term}-a")
+        TermTranslationFactory.create(locale=locale_b, term=term, text=f"{term}-b")
+
+    string = "So avoid sensitive activities when surfing in public"
+    Term.objects.for_string(string)
+    with django_assert_num_queries(2):
+        terms = Term.objects.for_string(string)
+        assert [term.translation(locale_a) for term in terms] == [
+            "sensitive-a",
+            "surf-a",
+        ]
+        assert [term.translation(locale_b) for term in terms] == [
+            "sensitive-b",
+            "surf-b",
+        ]
+
+
+@pytest.mark.django_db
+def test_terms_for_strings(available_terms, django_assert_num_queries):
+    """
+    Find available terms in several strings with a single query.
+    """
+    strings = {
+        1: "Join us as a student ambassador",
+        2: "So avoid sensitive activities when surfing in public",
+        3: "Nothing to see here",
+    }
+    Term.objects.for_strings(strings)
+    with django_assert_num_queries(2):
+        terms = Term.objects.for_strings(strings)
+    assert {key: [term.text for term in terms[key]] for key in terms} == {
+        1: ["student ambassador"],
+        2: ["sensitive", "surf"],
+        3: [],
+    }
+
+
 @pytest.mark.django_db
 @patch("pontoon.terminology.models.update_terminology_project_stats")
 def test_term_translation(_, locale_a):
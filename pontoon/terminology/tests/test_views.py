@@ -0,0 +1,87 @@
+import json
+
+from unittest.mock import patch
+
+import pytest
+
+from pontoon.base.models import Project
+from pontoon.test.factories import EntityFactory, TermFactory
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_get_entity_terms(
+    _, client, resource_a, locale_a, django_capture_on_commit_callbacks
+):
+    entity_a = EntityFactory.create(resource=resource_a, string="Open a new tab")
+    entity_b = EntityFactory.create(resource=resource_a, string="Close the window")
+    obsolete = EntityFactory.create(
+        resource=resource_a, string="Open a new tab", obsolete=True
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        TermFactory.create(text="new tab")
+        TermFactory.create(text="window")
+
+    response = client.get(
+        "/terminology/get-entity-terms/",
+        {
+            "entities": f"{entity_a.pk},{entity_b.pk},{obsolete.pk}",
+            "locale": locale_a.code,
+        },
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 200
+    terms = json.loads(response.content)
+    assert {pk: [term["text"] for term in terms[pk]] for pk in terms} == {
+        str(entity_a.pk): ["new tab"],
+        str(entity_b.pk): ["window"],
+    }
+
+    response = client.get(
+        "/terminology/get-entity-terms/",
+        {"entities": "a,b", "locale": locale_a.code},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/terminology/get-entity-terms/",
+        {"entities": ",".join(str(i) for i in range(101)), "locale": locale_a.code},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_get_entity_terms_private_project(
+    _, member, resource_a, locale_a, django_capture_on_commit_callbacks
+):
+    """
+    Terms are not retrieved for the entities of projects the user can't see.
+    """
+    resource_a.project.visibility = Project.Visibility.PRIVATE
+    resource_a.project.save()
+    entity = EntityFactory.create(resource=resource_a, string="Open a new tab")
+    with django_capture_on_commit_callbacks(execute=True):
+        TermFactory.create(text="new tab")
+
+    params = {"entities": str(entity.pk), "locale": locale_a.code}
+    response = member.client.get(
+        "/terminology/get-entity-terms/",
+        params,
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content) == {}
+
+    member.user.is_superuser = True
+    member.user.save()
+    response = member.client.get(
+        "/terminology/get-entity-terms/",
+        params,
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert [term["text"] for term in json.loads(response.content)[str(entity.pk)]] == [
+        "new tab"
+    ]
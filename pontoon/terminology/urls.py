@@ -6,6 +6,12 @@ from . import views
 urlpatterns = [
     # AJAX: Retrieve terms for given Entity and Locale
     path("get-terms/", views.get_terms, name="pontoon.terms.get"),
+    # AJAX: Retrieve terms for given Entities and Locale
+    path(
+        "get-entity-terms/",
+        views.get_entity_terms,
+        name="pontoon.terms.get.entities",
+    ),
     # AJAX: Download terminology in TBX 2.0
     path(
         "<locale:locale>.v2.tbx",
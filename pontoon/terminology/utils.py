@@ -2,6 +2,31 @@ from xml.sax.saxutils import escape, quoteattr
 
 from django.conf import settings
 
+from pontoon.base.simple_preview import get_simple_preview
+from pontoon.terminology.models import Term
+
+
+def get_entity_terms(entities, locale):
+    """
+    Get the terms that occur in the source strings of a queryset of entities,
+    along with their translations to the given locale.
+
+    The source strings are matched in a single pass,
+    and all of the terms are retrieved with a single query.
+
+    :returns: A dict of serialized terms, keyed by entity pk.
+    """
+    strings = {
+        pk: get_simple_preview(format, string)
+        for pk, format, string in entities.values_list(
+            "pk", "resource__format", "string"
+        )
+    }
+    return {
+        pk: [term.serialize(locale) for term in terms]
+        for pk, terms in Term.objects.for_strings(strings).items()
+    }
+
 
 def build_tbx_v2_file(term_translations, locale):
     """
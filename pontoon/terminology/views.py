@@ -5,12 +5,16 @@ from django.utils.decorators import method_decorator
 from django.views.decorators.http import condition
 from django.views.generic import ListView
 
-from pontoon.base.models import Locale
-from pontoon.base.utils import require_AJAX
+from pontoon.base.models import Entity, Locale, Project
+from pontoon.base.utils import require_AJAX, split_ints
 from pontoon.terminology import utils
 from pontoon.terminology.models import Term, TermTranslation
 
 
+# The maximum number of entities for which `get_entity_terms` retrieves terms.
+MAX_ENTITY_TERMS_ENTITIES = 100
+
+
 @require_AJAX
 def get_terms(request):
     """Retrieve terms for given source string and Locale."""
@@ -24,22 +28,43 @@ def get_terms(request):
         )
 
     locale = get_object_or_404(Locale, code=locale_code)
-    payload = []
-
-    for term in Term.objects.for_string(source_string):
-        data = {
-            "text": term.text,
-            "part_of_speech": term.part_of_speech,
-            "definition": term.definition,
-            "usage": term.usage,
-            "translation": term.translation(locale),
-            "entity_id": term.entity_id,
-        }
-        payload.append(data)
+    payload = [
+        term.serialize(locale) for term in Term.objects.for_string(source_string)
+    ]
 
     return JsonResponse(payload, safe=False)
 
 
+@require_AJAX
+def get_entity_terms(request):
+    """Retrieve terms for the source strings of given Entities and Locale."""
+    try:
+        entity_ids = split_ints(request.GET["entities"])
+        locale_code = request.GET["locale"]
+    except (MultiValueDictKeyError, ValueError) as e:
+        return JsonResponse(
+            {"status": False, "message": f"Bad Request: {e}"},
+            status=400,
+        )
+
+    if len(entity_ids) > MAX_ENTITY_TERMS_ENTITIES:
+        return JsonResponse(
+            {
+                "status": False,
+                "message": f"Bad Request: At most {MAX_ENTITY_TERMS_ENTITIES} entities are supported",
+            },
+            status=400,
+        )
+
+    locale = get_object_or_404(Locale, code=locale_code)
+    visible_projects = Project.objects.visible().visible_for(request.user)
+    entities = Entity.objects.filter(
+        pk__in=entity_ids, obsolete=False, resource__project__in=visible_projects
+    )
+
+    return JsonResponse(utils.get_entity_terms(entities, locale))
+
+
 @method_decorator(condition(etag_func=None), name="dispatch")
 class DownloadTerminologyViewV2(ListView):
     def get_tbx_file_content(self, term_translations, locale_code):
@@ -112,10 +112,26 @@ class LocaleFactory(DjangoModelFactory):
 class ProjectLocaleFactory(DjangoModelFactory):
     class Meta:
         model = ProjectLocale
+        skip_postgeneration_save = True
 
     project = SubFactory(ProjectFactory)
     locale = SubFactory(LocaleFactory)
 
+    @factory.post_generation
+    def stats(self, create, extracted, **kwargs):
+        if create:
+            ProjectLocale.objects.filter(pk=self.pk).calculate_stats()
+            self.refresh_from_db(
+                fields=[
+                    "total_strings",
+                    "approved_strings",
+                    "pretranslated_strings",
+                    "strings_with_errors",
+                    "strings_with_warnings",
+                    "unreviewed_strings",
+                ]
+            )
+
 
 class EntityFactory(DjangoModelFactory):
     resource = SubFactory(ResourceFactory)
@@ -199,6 +215,14 @@ class TranslatedResourceFactory(DjangoModelFactory):
 
     class Meta:
         model = TranslatedResource
+        skip_postgeneration_save = True
+
+    @factory.post_generation
+    def project_locale_stats(self, create, extracted, **kwargs):
+        if create:
+            ProjectLocale.objects.filter(
+                project=self.resource.project_id, locale=self.locale_id
+            ).calculate_stats()
 
 
 class ErrorFactory(DjangoModelFactory):
@@ -9,6 +9,7 @@ import type {
   EntityTranslation,
   HistoryTranslation,
 } from './translation';
+import type { TermType } from './terminology';
 import type { BatchBadgeUpdate } from '../modules/batchactions/actions';
 import { Message } from '@mozilla/l10n';
 
@@ -94,6 +95,7 @@ type EntitiesResponse =
       has_next?: boolean;
       stats: APIStats;
       requested_entity?: RequestedEntityLocation;
+      terms?: Record<number, TermType[]>;
     }
   | { entities?: never; has_next: false; stats: object };
 
@@ -116,8 +118,15 @@ export async function fetchEntities(
   const payload = buildFetchPayload(location);
   if (page) {
     payload.append('page', String(page));
+    if (location.project !== 'terminology') {
+      payload.append('terms', 'true');
+    }
+  }
+  const response = await POST('/get-entities/', payload);
+  if (response?.terms) {
+    response.terms = keysToCamelCase(response.terms);
   }
-  return await POST('/get-entities/', payload);
+  return response;
 }
 
 export async function fetchEntityIds(location: Location): Promise<number[]> {
@@ -50,6 +50,8 @@ export type ComposedMachineryTranslation = {
 type ConcordanceTranslations = {
   results: Array<MachineryTranslation>;
   hasMore: boolean;
+  /** Identifies the last result, for fetching the following ones */
+  cursor: string | null;
 };
 
 let abortController = new AbortController();
@@ -67,12 +69,15 @@ function GET_(url: string, params: Record<string, string>) {
 /**
  * Return results from Concordance search.
  *
+ * If set, `cursor` is used instead of `page` to fetch the following results.
+ *
  * Note! Not under common machinery abort controller
  */
 export async function fetchConcordanceResults(
   source: string,
   locale: Locale,
   page?: number,
+  cursor?: string | null,
 ): Promise<ConcordanceTranslations> {
   const url = '/concordance-search/';
   const params = new URLSearchParams({
@@ -80,8 +85,11 @@ export async function fetchConcordanceResults(
     locale: locale.code,
     page: String(page || 1),
   });
+  if (cursor) {
+    params.set('cursor', cursor);
+  }
 
-  const { results, has_next } = (await GET(url, params, {
+  const { results, has_next, cursor: next } = (await GET(url, params, {
     singleton: true,
   })) as {
     results: Array<{
@@ -94,6 +102,7 @@ export async function fetchConcordanceResults(
       entities: number[];
     }>;
     has_next: boolean;
+    cursor?: string;
   };
 
   return Array.isArray(results)
@@ -109,8 +118,9 @@ export async function fetchConcordanceResults(
           entities: item.entities,
         })),
         hasMore: has_next,
+        cursor: next ?? null,
       }
-    : { results: [], hasMore: false };
+    : { results: [], hasMore: false, cursor: null };
 }
 
 /**
@@ -15,6 +15,9 @@ export type SearchData = {
   /** Last fetched page (1-indexed) */
   page: number;
 
+  /** Identifies the last fetched result, for fetching more */
+  cursor: string | null;
+
   /** If `true`, results are being fetched */
   fetching: boolean;
 
@@ -37,6 +40,7 @@ const initSearch: SearchData = {
   input: '',
   query: '',
   page: 1,
+  cursor: null,
   fetching: false,
   results: [],
   hasMore: false,
@@ -65,13 +69,20 @@ export function SearchProvider({ children }: { children: React.ReactElement }) {
             : prev;
         } else {
           const query = prev.input;
-          return { ...prev, query, page: 1, results: [], fetching: !!query };
+          return {
+            ...prev,
+            query,
+            page: 1,
+            cursor: null,
+            results: [],
+            fetching: !!query,
+          };
         }
       });
     },
   }));
 
-  const { query, page, fetching } = search;
+  const { query, page, cursor, fetching } = search;
 
   useEffect(() => {
     setSearch((prev) => ({
@@ -81,13 +92,14 @@ export function SearchProvider({ children }: { children: React.ReactElement }) {
       query: '',
       results: [],
       hasMore: false,
+      cursor: null,
     }));
   }, [entity]);
 
   useEffect(() => {
     if (fetching) {
-      fetchConcordanceResults(query, locale, page).then(
-        ({ results, hasMore }) => {
+      fetchConcordanceResults(query, locale, page, cursor).then(
+        ({ results, hasMore, cursor: next }) => {
           setSearch((prev) =>
             prev.query !== query
               ? prev // Let's not clobber the results if the query has changed
@@ -96,6 +108,7 @@ export function SearchProvider({ children }: { children: React.ReactElement }) {
                   fetching: false,
                   results: prev.results.concat(results),
                   hasMore,
+                  cursor: next,
                 },
           );
         },
@@ -8,6 +8,7 @@ import {
 import { EntityTranslation } from '~/api/translation';
 import { Location } from '~/context/Location';
 import { updateStats } from '~/modules/stats/actions';
+import { receiveEntityTerms } from '~/modules/terms/actions';
 import type { AppDispatch } from '~/store';
 
 export const RECEIVE_ENTITIES = 'entities/RECEIVE';
@@ -76,6 +77,9 @@ export const getEntities =
         requestedEntityLocation: content.requested_entity ?? null,
       });
       dispatch(updateStats(content.stats));
+      if (content.terms) {
+        dispatch(receiveEntityTerms(content.terms));
+      }
     }
   };
 
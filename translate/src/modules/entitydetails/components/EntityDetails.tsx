@@ -72,7 +72,7 @@ export function EntityDetails(): React.ReactElement<'section'> | null {
     const source = getPlainMessage(machineryEntry);
 
     if (source !== terms.sourceString && project !== 'terminology') {
-      dispatch(getTerms(source, lc));
+      dispatch(getTerms(source, lc, terms.entityTerms[pk]));
     }
 
     if (entity > 0) {
@@ -2,15 +2,22 @@ import { fetchTerms, TermType } from '~/api/terminology';
 import type { AppDispatch } from '~/store';
 
 export const RECEIVE = 'terms/RECEIVE';
+export const RECEIVE_ENTITY_TERMS = 'terms/RECEIVE_ENTITY_TERMS';
 export const REQUEST = 'terms/REQUEST';
 
-export type Action = ReceiveAction | RequestAction;
+export type Action = ReceiveAction | ReceiveEntityTermsAction | RequestAction;
 
 export type ReceiveAction = {
   readonly type: typeof RECEIVE;
   readonly terms: Array<TermType>;
 };
 
+/** Terms of a page of entities, keyed by entity pk. */
+export type ReceiveEntityTermsAction = {
+  readonly type: typeof RECEIVE_ENTITY_TERMS;
+  readonly entityTerms: Record<number, Array<TermType>>;
+};
+
 export type RequestAction = {
   readonly type: typeof REQUEST;
   readonly sourceString: string;
@@ -22,10 +29,27 @@ export function request(sourceString: string): RequestAction {
   };
 }
 
-export function get(sourceString: string, locale: string) {
+export function receiveEntityTerms(
+  entityTerms: Record<number, Array<TermType>>,
+): ReceiveEntityTermsAction {
+  return {
+    type: RECEIVE_ENTITY_TERMS,
+    entityTerms,
+  };
+}
+
+/**
+ * Get the terms of a source string,
+ * unless they're already available from the entity list.
+ */
+export function get(
+  sourceString: string,
+  locale: string,
+  entityTerms?: Array<TermType>,
+) {
   return async (dispatch: AppDispatch) => {
     dispatch(request(sourceString));
-    const terms = await fetchTerms(sourceString, locale);
+    const terms = entityTerms ?? (await fetchTerms(sourceString, locale));
     dispatch({ type: RECEIVE, terms });
   };
 }
@@ -1,6 +1,6 @@
 import type { TermType } from '~/api/terminology';
 
-import { Action, RECEIVE, REQUEST } from './actions';
+import { Action, RECEIVE, RECEIVE_ENTITY_TERMS, REQUEST } from './actions';
 
 // Name of this module.
 // Used as the key to store this module's reducer.
@@ -10,12 +10,14 @@ export type TermState = {
   readonly fetching: boolean;
   readonly sourceString: string;
   readonly terms: Array<TermType>;
+  readonly entityTerms: Record<number, Array<TermType>>;
 };
 
 const initialState: TermState = {
   fetching: false,
   sourceString: '',
   terms: [],
+  entityTerms: {},
 };
 
 export function reducer(
@@ -36,6 +38,11 @@ export function reducer(
         fetching: false,
         terms: action.terms,
       };
+    case RECEIVE_ENTITY_TERMS:
+      return {
+        ...state,
+        entityTerms: { ...state.entityTerms, ...action.entityTerms },
+      };
     default:
       return state;
   }